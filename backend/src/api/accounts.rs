@@ -27,8 +27,8 @@ pub fn router() -> Router<Arc<AppState>> {
 // Response Types
 // ============================================================================
 
-#[derive(Serialize)]
-struct AccountInfo {
+#[derive(Serialize, Clone)]
+pub struct AccountInfo {
     email: String,
     rank: String,
     valid_until: u64,
@@ -76,13 +76,24 @@ struct VerifyAccountRequest {
 async fn list_accounts(
     State(state): State<Arc<AppState>>,
 ) -> Json<AccountsResponse> {
+    let account = state.account_cache
+        .get_with((), async { load_account(&state) })
+        .await;
+
+    Json(AccountsResponse { accounts: account.into_iter().collect() })
+}
+
+/// Stored account info from the settings table.
+/// The UI polls this for the account badge, so it is served through
+/// `AppState.account_cache` instead of three settings reads per call.
+fn load_account(state: &AppState) -> Option<AccountInfo> {
     // Read email from DB first, then fall back to config.toml
     let email = match state.db.get_setting("fshare_email") {
         Ok(Some(e)) if !e.is_empty() => e,
         _ => {
             let config_email = state.config.fshare.email.clone();
             if config_email.is_empty() {
-                return Json(AccountsResponse { accounts: vec![] });
+                return None;
             }
             config_email
         }
@@ -104,16 +115,19 @@ async fn list_accounts(
         .and_then(|s| s.parse::<u64>().ok())
         .unwrap_or(0);
 
-    let account = AccountInfo {
+    Some(AccountInfo {
         email,
         rank,
         valid_until,
         quota_used: 0,
         quota_total: 0,
         is_active: true,
-    };
+    })
+}
 
-    Json(AccountsResponse { accounts: vec![account] })
+/// Drop the cached account info after credentials or rank change
+fn invalidate_account(state: &AppState) {
+    state.account_cache.invalidate_all();
 }
 
 /// POST /api/accounts - Add new account
@@ -141,8 +155,8 @@ async fn add_account(
     }
     
     // Clear stale rank so the old FREE/VIP badge doesn't linger
-    let _ = state.db.save_setting("fshare_rank", "");
-    let _ = state.db.save_setting("fshare_valid_until", "0");
+    let _ = state.db.save_settings(&[("fshare_rank", ""), ("fshare_valid_until", "0")]);
+    invalidate_account(&state);
 
     // Clear the existing session so the handler re-logs in with new credentials
     if let Some(handler) = state.host_registry.get_handler_for_url("https://fshare.vn/file/test") {
@@ -158,9 +172,12 @@ async fn add_account(
         match handler.check_account_status().await {
             Ok(status) => {
                 let rank = if status.premium { "VIP" } else { "FREE" };
-                let _ = state.db.save_setting("fshare_rank", rank);
                 let valid_until = status.valid_until.unwrap_or(0);
-                let _ = state.db.save_setting("fshare_valid_until", &valid_until.to_string());
+                let _ = state.db.save_settings(&[
+                    ("fshare_rank", rank),
+                    ("fshare_valid_until", valid_until.to_string().as_str()),
+                ]);
+                invalidate_account(&state);
                 tracing::info!("[Accounts] add_account: verified rank='{}' valid_until={}", rank, valid_until);
                 return Ok(Json(ActionResponse {
                     success: true,
@@ -217,6 +234,7 @@ async fn remove_account(
     // Save to config.toml
     match crate::config::save_config(&new_config) {
         Ok(_) => {
+            invalidate_account(&state);
             tracing::info!("Fshare account removed successfully for {}", email);
             Json(ActionResponse {
                 success: true,
@@ -274,10 +292,12 @@ async fn refresh_account(
             Ok(status) => {
                 // Cache the rank in DB so list_accounts returns it instantly next time
                 let rank = if status.premium { "VIP" } else { "FREE" };
-                let _ = state.db.save_setting("fshare_rank", rank);
-                
                 let valid_until = status.valid_until.unwrap_or(0);
-                let _ = state.db.save_setting("fshare_valid_until", &valid_until.to_string());
+                let _ = state.db.save_settings(&[
+                    ("fshare_rank", rank),
+                    ("fshare_valid_until", valid_until.to_string().as_str()),
+                ]);
+                invalidate_account(&state);
                 
                 tracing::info!("[Accounts] Refreshed rank for {}: {} (valid_until: {})", status.account_email, rank, valid_until);
                 Json(ActionResponse {
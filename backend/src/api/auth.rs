@@ -53,7 +53,7 @@ pub async fn auth_middleware(
     }
 
     match provided_key {
-        Some(key) if validate_api_key(&state, &key) => {
+        Some(key) if validate_api_key(&state, &key).await => {
             Ok(next.run(req).await)
         }
         _ => {
@@ -64,12 +64,23 @@ pub async fn auth_middleware(
 }
 
 /// Shared validation logic
-pub fn validate_api_key(state: &AppState, provided: &str) -> bool {
-    // Get API key from database (where UI saves it)
-    let config_key = state.db.get_setting("indexer_api_key")
-        .ok()
-        .flatten()
-        .unwrap_or_else(|| "flasharr-default-key".to_string());
+pub async fn validate_api_key(state: &AppState, provided: &str) -> bool {
+    if provided.is_empty() {
+        return false;
+    }
+
+    // Get API key from database (where UI saves it), cached briefly
+    let config_key = state.api_key_cache.get_with((), async {
+        state.db.get_setting("indexer_api_key")
+            .ok()
+            .flatten()
+            .unwrap_or_else(|| "flasharr-default-key".to_string())
+    }).await;
     
-    !provided.is_empty() && provided == config_key
+    provided == config_key
+}
+
+/// Drop the cached API key after it has been changed
+pub fn invalidate_api_key(state: &AppState) {
+    state.api_key_cache.invalidate_all();
 }
@@ -152,7 +152,7 @@ async fn smart_search(
     State(_state): State<Arc<AppState>>,
     Json(payload): Json<SmartSearchRequest>,
 ) -> Json<Value> {
-    let client = Client::builder().cookie_store(true).build().unwrap_or_default();
+    let client = discovery_client();
     let mut queries = vec![payload.title.clone()];
     
     // 1. Resolve Aliases from TMDB
@@ -359,10 +359,10 @@ async fn smart_search(
 
 /// GET /api/discovery/popular-today - Get popular items with Fshare availability
 async fn popular_today(
-    State(_state): State<Arc<AppState>>,
+    State(state): State<Arc<AppState>>,
     Query(params): Query<PopularQuery>,
 ) -> Json<PopularResponse> {
-    let client = Client::new();
+    let client = &state.http_client;
     let url = format!(
         "https://api.themoviedb.org/3/trending/{}/day?api_key={}",
         params.media_type,
@@ -407,7 +407,7 @@ async fn popular_today(
 
 /// GET /api/discovery/available-on-fshare - Check Fshare availability
 async fn available_on_fshare(
-    State(_state): State<Arc<AppState>>,
+    State(state): State<Arc<AppState>>,
     Query(params): Query<AvailabilityQuery>,
 ) -> Json<AvailabilityResponse> {
     let query = if let Some(ref year) = params.year {
@@ -416,7 +416,7 @@ async fn available_on_fshare(
         params.title.clone()
     };
     
-    let client = Client::new();
+    let client = &state.http_client;
     let url = format!(
         "https://timfshare.com/api/v1/string-query-search?query={}",
         urlencoding::encode(&query)
@@ -466,18 +466,26 @@ async fn available_on_fshare(
     })
 }
 
+/// Per-request timeout for the trending feed and its TMDB enrichment
+const TRENDING_TIMEOUT: std::time::Duration = std::time::Duration::from_secs(10);
+
+/// Shared cookie-aware client for the discovery handlers that don't use the
+/// state client, built on first use instead of on every request
+fn discovery_client() -> &'static Client {
+    static CLIENT: once_cell::sync::Lazy<Client> = once_cell::sync::Lazy::new(|| {
+        Client::builder().cookie_store(true).build().unwrap_or_default()
+    });
+    &CLIENT
+}
+
 /// GET /api/discovery/trending
 async fn trending() -> Json<TrendingResponse> {
-    let client = Client::builder()
-        .timeout(std::time::Duration::from_secs(10))
-        .cookie_store(true)
-        .build()
-        .unwrap_or_default();
+    let client = discovery_client();
     let url = "https://timfshare.com/api/key/data-top";
     
     let mut results = Vec::new();
     
-    if let Ok(resp) = client.get(url).send().await {
+    if let Ok(resp) = client.get(url).timeout(TRENDING_TIMEOUT).send().await {
         if let Ok(data) = resp.json::<Value>().await {
             if let Some(items) = data["dataFile"].as_array() {
                 // Filter video files
@@ -485,7 +493,8 @@ async fn trending() -> Json<TrendingResponse> {
                 
                 for item in items.iter().take(50) {
                     let name = item["name"].as_str().unwrap_or("").to_string();
-                    let has_video_ext = video_exts.iter().any(|ext| name.to_lowercase().ends_with(ext));
+                    let ext = name.rfind('.').map(|i| name[i..].to_ascii_lowercase()).unwrap_or_default();
+                    let has_video_ext = video_exts.contains(&ext.as_str());
                     
                     if !has_video_ext { continue; }
                     
@@ -546,7 +555,7 @@ async fn trending() -> Json<TrendingResponse> {
                 }
             }
             
-            if let Ok(resp) = client.get(&url).send().await {
+            if let Ok(resp) = client.get(&url).timeout(TRENDING_TIMEOUT).send().await {
                  if let Ok(data) = resp.json::<Value>().await {
                     if let Some(results) = data["results"].as_array() {
                         if let Some(first) = results.first() {
@@ -561,7 +570,7 @@ async fn trending() -> Json<TrendingResponse> {
                     "https://api.themoviedb.org/3/search/{}?api_key={}&query={}",
                     media_type, TMDB_API_KEY, urlencoding::encode(&clean_title)
                 );
-                 if let Ok(resp) = client.get(&url).send().await {
+                 if let Ok(resp) = client.get(&url).timeout(TRENDING_TIMEOUT).send().await {
                      if let Ok(data) = resp.json::<Value>().await {
                         if let Some(results) = data["results"].as_array() {
                             if let Some(first) = results.first() {
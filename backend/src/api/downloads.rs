@@ -6,15 +6,21 @@ use axum::{
     routing::{get, post, delete},
     Router,
     Json,
+    body::{Body, Bytes},
     extract::{State, Path, Query},
-    http::StatusCode,
+    http::{header, HeaderMap, StatusCode},
+    response::{IntoResponse, Response},
 };
+use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
 use std::sync::Arc;
 use serde::{Deserialize, Serialize};
 use uuid::Uuid;
 use crate::AppState;
 use crate::downloader::{DownloadTask, DownloadState, EngineStats};
+use crate::downloader::manager::LiveProgress;
 use crate::utils::status_utils::StatusCounts;
+use super::stats::{cached_stats, invalidate_stats};
 
 pub fn router() -> Router<Arc<AppState>> {
     Router::new()
@@ -61,6 +67,24 @@ struct DownloadsResponse {
 
 // StatusCounts imported from crate::utils::status_utils
 
+/// Cache key for one page of the downloads table
+#[derive(Clone, PartialEq, Eq, Hash)]
+pub struct DownloadsPageKey {
+    page: u32,
+    limit: u32,
+    sort_by: String,
+    sort_dir: String,
+    status: Option<String>,
+}
+
+/// One page of download rows and the filter counts, as read from the database.
+/// Real-time progress is merged in per request, so only the DB reads are shared.
+pub struct DownloadsPage {
+    tasks: Vec<DownloadTask>,
+    total: u64,
+    status_counts: StatusCounts,
+}
+
 /// Query parameters for list downloads
 #[derive(Debug, Deserialize)]
 struct ListDownloadsQuery {
@@ -213,43 +237,35 @@ pub struct AddDownloadRequest {
 /// - status: Filter by status (e.g., "DOWNLOADING", "QUEUED", "COMPLETED", "FAILED")
 async fn list_downloads(
     State(state): State<Arc<AppState>>,
+    headers: HeaderMap,
     Query(params): Query<ListDownloadsQuery>,
-) -> Json<DownloadsResponse> {
+) -> Response {
     let page = params.page.unwrap_or(1).max(1);
     let limit = params.limit.unwrap_or(20).min(100).max(1);
     let sort_by = params.sort_by.unwrap_or_else(|| "added".to_string());
     let sort_dir = params.sort_dir.unwrap_or_else(|| "desc".to_string());
     let status_filter = params.status; // None means "all"
     
-    // Query from database with pagination, sorting, and optional status filter (async to prevent blocking)
-    let (mut downloads, total) = state.db
-        .get_tasks_paginated_sorted_filtered_async(page, limit, &sort_by, &sort_dir, status_filter.as_deref()).await
-        .unwrap_or_else(|e| {
-            tracing::error!("Failed to get tasks from DB: {}", e);
-            (Vec::new(), 0)
-        });
-    
-    // Get status counts from database for filter dropdown
-    let db_status_counts = state.db.get_status_counts_async().await.unwrap_or_default();
-    let status_counts = StatusCounts::from_db_counts(db_status_counts);
+    let key = DownloadsPageKey {
+        page,
+        limit,
+        sort_by,
+        sort_dir,
+        status: status_filter,
+    };
+    let cached = cached_downloads_page(&state, key).await;
+    let mut downloads = cached.tasks.clone();
+    let total = cached.total;
+    let status_counts = cached.status_counts.clone();
 
     // Merge real-time progress from active downloads in memory
-    let active_tasks = state.download_orchestrator.task_manager().get_active_tasks().await;
-    for download in downloads.iter_mut() {
-        if let Some(active) = active_tasks.iter().find(|t| t.id == download.id) {
-            // Update with real-time data from memory
-            download.progress = active.progress;
-            download.speed = active.speed;
-            download.eta = active.eta;
-            download.downloaded = active.downloaded;
-            download.state = active.state;
-        }
-    }
+    let live = state.download_orchestrator.task_manager().get_active_progress().await;
+    merge_realtime_progress(&mut downloads, &live);
 
     let stats = state.download_orchestrator.task_manager().get_stats().await;
     let total_pages = ((total as f64) / (limit as f64)).ceil() as u32;
     
-    Json(DownloadsResponse { 
+    json_with_etag(&headers, &DownloadsResponse { 
         downloads, 
         stats,
         status_counts,
@@ -260,6 +276,84 @@ async fn list_downloads(
     })
 }
 
+/// Database half of `list_downloads`, shared by pollers for up to 1s.
+/// Concurrent callers asking for the same page wait on a single pair of queries.
+async fn cached_downloads_page(state: &AppState, key: DownloadsPageKey) -> Arc<DownloadsPage> {
+    state.downloads_page_cache
+        .get_with(key.clone(), async {
+            // The page query and the filter-dropdown counts are independent,
+            // so run them concurrently on separate pool connections
+            let (page, db_status_counts) = tokio::join!(
+                // Query from database with pagination, sorting, and optional status filter (async to prevent blocking)
+                state.db.get_tasks_paginated_sorted_filtered_async(key.page, key.limit, &key.sort_by, &key.sort_dir, key.status.as_deref()),
+                // Get status counts from database for filter dropdown
+                state.db.get_status_counts_async(),
+            );
+            let (tasks, total) = page.unwrap_or_else(|e| {
+                tracing::error!("Failed to get tasks from DB: {}", e);
+                (Vec::new(), 0)
+            });
+            let status_counts = StatusCounts::from_db_counts(db_status_counts.unwrap_or_default());
+
+            Arc::new(DownloadsPage { tasks, total, status_counts })
+        })
+        .await
+}
+
+/// Drop cached stats and download pages so the next poll reflects a mutation immediately
+pub(crate) fn invalidate_listing(state: &AppState) {
+    invalidate_stats(state);
+    state.downloads_page_cache.invalidate_all();
+}
+
+/// Serialize `value` with a content-hash ETag, answering `304 Not Modified`
+/// when the client's `If-None-Match` already has this exact payload.
+/// Pollers that see no change get a header-only response.
+fn json_with_etag<T: Serialize>(headers: &HeaderMap, value: &T) -> Response {
+    let body = match serde_json::to_vec(value) {
+        Ok(body) => body,
+        Err(e) => {
+            tracing::error!("Failed to serialize response: {}", e);
+            return StatusCode::INTERNAL_SERVER_ERROR.into_response();
+        }
+    };
+
+    let mut hasher = std::collections::hash_map::DefaultHasher::new();
+    body.hash(&mut hasher);
+    let etag = format!("W/\"{:016x}\"", hasher.finish());
+
+    let not_modified = headers
+        .get(header::IF_NONE_MATCH)
+        .and_then(|v| v.to_str().ok())
+        .is_some_and(|v| v.split(',').any(|tag| tag.trim() == etag));
+
+    let cache_headers = [
+        (header::ETAG, etag),
+        (header::CACHE_CONTROL, "no-cache".to_string()),
+    ];
+    if not_modified {
+        return (StatusCode::NOT_MODIFIED, cache_headers).into_response();
+    }
+    (
+        cache_headers,
+        [(header::CONTENT_TYPE, "application/json")],
+        body,
+    ).into_response()
+}
+
+/// Overlay real-time progress from in-memory active tasks onto DB rows.
+/// Indexes the active tasks by ID once so each row is an O(1) lookup.
+fn merge_realtime_progress(downloads: &mut [DownloadTask], live: &HashMap<Uuid, LiveProgress>) {
+    if live.is_empty() {
+        return;
+    }
+    for download in downloads.iter_mut() {
+        if let Some(progress) = live.get(&download.id) {
+            progress.apply_to(download);
+        }
+    }
+}
+
 /// GET /api/downloads/:id - Get single download
 async fn get_download(
     State(state): State<Arc<AppState>>,
@@ -275,10 +369,48 @@ async fn get_download(
 }
 
 /// POST /api/downloads - Add new download
+///
+/// By default responds with the created task once file info has been fetched
+/// from the host. Clients sending `Prefer: respond-async` (RFC 7240) get an
+/// immediate `202 Accepted` instead; the task then arrives via the
+/// WebSocket `TASK_ADDED` event.
 async fn add_download(
     State(state): State<Arc<AppState>>,
+    headers: HeaderMap,
     Json(payload): Json<AddDownloadRequest>,
-) -> Result<Json<DownloadTask>, (StatusCode, String)> {
+) -> Result<Response, (StatusCode, String)> {
+    if prefers_async(&headers) {
+        tokio::spawn(async move {
+            if let Err((status, message)) = create_download(&state, payload).await {
+                tracing::warn!("Background add_download failed ({}): {}", status, message);
+            }
+        });
+        let accepted = ActionResponse {
+            success: true,
+            message: Some("Download accepted".to_string()),
+        };
+        return Ok((StatusCode::ACCEPTED, Json(accepted)).into_response());
+    }
+
+    // Return full task object so frontend gets batch_id, batch_name, etc.
+    create_download(&state, payload).await.map(|task| Json(task).into_response())
+}
+
+/// Whether the client asked for asynchronous processing via `Prefer`
+fn prefers_async(headers: &HeaderMap) -> bool {
+    headers
+        .get_all("prefer")
+        .iter()
+        .filter_map(|v| v.to_str().ok())
+        .flat_map(|v| v.split(','))
+        .any(|pref| pref.trim().eq_ignore_ascii_case("respond-async"))
+}
+
+/// Resolve batch membership and hand the download to the orchestrator
+async fn create_download(
+    state: &AppState,
+    payload: AddDownloadRequest,
+) -> Result<DownloadTask, (StatusCode, String)> {
     // === DEBUG: Log incoming request ===
     tracing::info!("=== [API] add_download called ===");
     tracing::info!("[API] Incoming URL: {}", payload.url);
@@ -399,8 +531,9 @@ async fn add_download(
         }
     };
     
-    // Return full task object so frontend gets batch_id, batch_name, etc.
-    Ok(Json(task))
+    invalidate_listing(state);
+
+    Ok(task)
 }
 
 /// DELETE /api/downloads/:id - Delete download
@@ -430,6 +563,7 @@ async fn delete_download(
     // Broadcast TASK_REMOVED to frontend if deleted from either location
     if success {
         state.download_orchestrator.broadcast_task_removed(&id);
+        invalidate_listing(&state);
     }
     
     Ok(Json(ActionResponse {
@@ -451,6 +585,7 @@ async fn pause_download(
     // Broadcast state change if successful
     if let Some(task) = task_result {
         state.download_orchestrator.broadcast_task_update(&task);
+        invalidate_listing(&state);
     }
 
     Ok(Json(ActionResponse {
@@ -476,6 +611,7 @@ async fn resume_download(
     // Broadcast state change if successful
     if let Some(task) = task_result {
         state.download_orchestrator.broadcast_task_update(&task);
+        invalidate_listing(&state);
         // Wake idle workers to process the resumed task
         state.download_orchestrator.wake_workers();
     }
@@ -503,6 +639,7 @@ async fn retry_download(
 
     // Wake idle workers to process the retried task
     if success {
+        invalidate_listing(&state);
         state.download_orchestrator.wake_workers();
     }
 
@@ -524,10 +661,13 @@ async fn redownload_download(
     let uuid = Uuid::parse_str(&id).map_err(|_| StatusCode::BAD_REQUEST)?;
     
     match state.download_orchestrator.redownload_task(uuid).await {
-        Ok(_) => Ok(Json(ActionResponse {
-            success: true,
-            message: None,
-        })),
+        Ok(_) => {
+            invalidate_listing(&state);
+            Ok(Json(ActionResponse {
+                success: true,
+                message: None,
+            }))
+        }
         Err(e) => {
             tracing::error!("Failed to re-download task {}: {}", uuid, e);
             Ok(Json(ActionResponse {
@@ -544,6 +684,7 @@ async fn pause_all(
     State(state): State<Arc<AppState>>,
 ) -> Json<BulkActionResponse> {
     let affected = state.download_orchestrator.pause_all_async().await;
+    invalidate_listing(&state);
     
     Json(BulkActionResponse {
         success: true,
@@ -557,6 +698,7 @@ async fn resume_all(
     State(state): State<Arc<AppState>>,
 ) -> Json<BulkActionResponse> {
     let affected = state.download_orchestrator.resume_all_async().await;
+    invalidate_listing(&state);
     
     Json(BulkActionResponse {
         success: true,
@@ -567,8 +709,8 @@ async fn resume_all(
 /// GET /api/downloads/stats - Get engine statistics
 async fn get_stats(
     State(state): State<Arc<AppState>>,
-) -> Json<EngineStats> {
-    Json(state.download_orchestrator.task_manager().get_stats().await)
+) -> Response {
+    cached_stats(&state).await.json_response()
 }
 
 // ============================================================================
@@ -581,7 +723,10 @@ async fn pause_batch(
     Path(batch_id): Path<String>,
 ) -> Json<BulkActionResponse> {
     match state.download_service.pause_batch(&batch_id).await {
-        Ok(affected) => Json(BulkActionResponse { success: true, affected }),
+        Ok(affected) => {
+            invalidate_listing(&state);
+            Json(BulkActionResponse { success: true, affected })
+        }
         Err(e) => {
             tracing::error!("Failed to pause batch {}: {}", batch_id, e);
             Json(BulkActionResponse { success: false, affected: 0 })
@@ -595,7 +740,10 @@ async fn resume_batch(
     Path(batch_id): Path<String>,
 ) -> Json<BulkActionResponse> {
     match state.download_service.resume_batch(&batch_id).await {
-        Ok(affected) => Json(BulkActionResponse { success: true, affected }),
+        Ok(affected) => {
+            invalidate_listing(&state);
+            Json(BulkActionResponse { success: true, affected })
+        }
         Err(e) => {
             tracing::error!("Failed to resume batch {}: {}", batch_id, e);
             Json(BulkActionResponse { success: false, affected: 0 })
@@ -609,7 +757,10 @@ async fn delete_batch(
     Path(batch_id): Path<String>,
 ) -> Json<BulkActionResponse> {
     match state.download_service.delete_batch(&batch_id).await {
-        Ok(affected) => Json(BulkActionResponse { success: true, affected }),
+        Ok(affected) => {
+            invalidate_listing(&state);
+            Json(BulkActionResponse { success: true, affected })
+        }
         Err(e) => {
             tracing::error!("Failed to delete batch {}: {}", batch_id, e);
             Json(BulkActionResponse { success: false, affected: 0 })
@@ -625,6 +776,7 @@ async fn redownload_batch(
     match state.download_orchestrator.redownload_batch_async(batch_id.clone()).await {
         Ok(affected) => {
             tracing::info!("Re-downloaded batch {}: {} tasks", batch_id, affected);
+            invalidate_listing(&state);
             Json(BulkActionResponse { success: true, affected })
         }
         Err(e) => {
@@ -660,12 +812,10 @@ async fn get_batch_progress(
     State(state): State<Arc<AppState>>,
     Path(batch_id): Path<String>,
 ) -> Result<Json<BatchProgress>, StatusCode> {
-    let all_tasks = state.download_orchestrator.task_manager().get_tasks().await;
-
-    // Filter tasks by batch_id
-    let batch_tasks: Vec<_> = all_tasks.iter()
-        .filter(|t| t.batch_id.as_deref() == Some(&batch_id))
-        .collect();
+    // Filter tasks by batch_id (only the batch's tasks are cloned)
+    let batch_tasks = state.download_orchestrator.task_manager()
+        .get_tasks_matching(|t| t.batch_id.as_deref() == Some(batch_id.as_str()))
+        .await;
     
     if batch_tasks.is_empty() {
         return Err(StatusCode::NOT_FOUND);
@@ -733,50 +883,43 @@ async fn get_batch_progress(
 /// This endpoint supports batch-first pagination where batches are treated as single rows
 async fn list_batch_summaries(
     State(state): State<Arc<AppState>>,
+    headers: HeaderMap,
     Query(params): Query<ListDownloadsQuery>,
-) -> Json<BatchSummariesResponse> {
+) -> Response {
     let page = params.page.unwrap_or(1).max(1);
     let limit = params.limit.unwrap_or(20).min(100).max(1);
     let status_filter = params.status;
     
-    // Get batch summaries from database
-    let (batches, standalone, total_batches, total_standalone) = state.db
-        .get_batch_summaries_paginated_async(page, limit, status_filter.as_deref()).await
+    // Batch summaries and status counts are independent queries; run them together
+    let (summaries, db_status_counts) = tokio::join!(
+        state.db.get_batch_summaries_paginated_async(page, limit, status_filter.as_deref()),
+        state.db.get_status_counts_async(),
+    );
+    let (batches, standalone, total_batches, total_standalone) = summaries
         .unwrap_or_else(|e| {
             tracing::error!("Failed to get batch summaries from DB: {}", e);
             (Vec::new(), Vec::new(), 0, 0)
         });
     
     // Merge real-time progress from active downloads for standalone items
-    let active_tasks = state.download_orchestrator.task_manager().get_active_tasks().await;
+    let live = state.download_orchestrator.task_manager().get_active_progress().await;
     let mut standalone_with_realtime = standalone;
-    for download in standalone_with_realtime.iter_mut() {
-        if let Some(active) = active_tasks.iter().find(|t| t.id == download.id) {
-            download.progress = active.progress;
-            download.speed = active.speed;
-            download.eta = active.eta;
-            download.downloaded = active.downloaded;
-            download.state = active.state;
+    merge_realtime_progress(&mut standalone_with_realtime, &live);
+    
+    // Sum live speed/downloaded per batch in a single pass over the active tasks
+    let mut live_by_batch: HashMap<&str, (f64, u64)> = HashMap::new();
+    for task in live.values() {
+        if let Some(batch_id) = task.batch_id.as_deref() {
+            let entry = live_by_batch.entry(batch_id).or_insert((0.0, 0));
+            entry.0 += task.speed;
+            entry.1 += task.downloaded;
         }
     }
-    
+
     // Update batch speeds and real-time progress from active tasks
     let mut batches_with_realtime = batches;
     for batch in batches_with_realtime.iter_mut() {
-        // Find all active tasks belonging to this batch
-        let batch_active: Vec<_> = active_tasks.iter()
-            .filter(|t| t.batch_id.as_ref() == Some(&batch.batch_id))
-            .collect();
-            
-        if !batch_active.is_empty() {
-            let mut live_speed: f64 = 0.0;
-            let mut live_downloaded: u64 = 0;
-            
-            for task in &batch_active {
-                live_speed += task.speed;
-                live_downloaded += task.downloaded;
-            }
-            
+        if let Some(&(live_speed, live_downloaded)) = live_by_batch.get(batch.batch_id.as_str()) {
             batch.speed = live_speed;
             
             // Fix double-counting: The DB query summed 'downloaded' for ALL tasks including active ones.
@@ -804,15 +947,13 @@ async fn list_batch_summaries(
         }
     }
     
-    // Get status counts from database
-    let db_status_counts = state.db.get_status_counts_async().await.unwrap_or_default();
-    let status_counts = StatusCounts::from_db_counts(db_status_counts);
+    let status_counts = StatusCounts::from_db_counts(db_status_counts.unwrap_or_default());
 
     let stats = state.download_orchestrator.task_manager().get_stats().await;
     let total = total_batches + total_standalone;
     let total_pages = ((total as f64) / (limit as f64)).ceil() as u32;
 
-    Json(BatchSummariesResponse {
+    json_with_etag(&headers, &BatchSummariesResponse {
         batches: batches_with_realtime,
         standalone: standalone_with_realtime,
         stats,
@@ -824,12 +965,34 @@ async fn list_batch_summaries(
     })
 }
 
+/// Lists longer than this are streamed instead of serialized into one buffer
+const STREAM_THRESHOLD: usize = 50;
+
+/// Stream a JSON array one element at a time so the first bytes go out before
+/// the whole list is serialized and peak memory stays at one item.
+fn stream_json_array<T: Serialize + Send + 'static>(items: Vec<T>) -> Response {
+    let elements = items.into_iter().enumerate().map(|(i, item)| {
+        let mut buf = if i == 0 { Vec::new() } else { vec![b','] };
+        serde_json::to_writer(&mut buf, &item)
+            .map(|_| Bytes::from(buf))
+            .map_err(std::io::Error::from)
+    });
+    let chunks = std::iter::once(Ok(Bytes::from_static(b"[")))
+        .chain(elements)
+        .chain(std::iter::once(Ok(Bytes::from_static(b"]"))));
+
+    (
+        [(header::CONTENT_TYPE, "application/json")],
+        Body::from_stream(futures_util::stream::iter(chunks)),
+    ).into_response()
+}
+
 /// GET /api/downloads/batch/:batch_id/items - Get all items in a batch
 /// Used for lazy loading when user expands a batch
 async fn get_batch_items(
     State(state): State<Arc<AppState>>,
     Path(batch_id): Path<String>,
-) -> Result<Json<Vec<DownloadTask>>, StatusCode> {
+) -> Result<Response, StatusCode> {
     // Get all tasks with this batch_id from database
     let tasks = match state.db.get_tasks_by_batch_id_async(batch_id.clone()).await {
         Ok(tasks) => tasks,
@@ -844,19 +1007,16 @@ async fn get_batch_items(
     }
     
     // Merge real-time progress from active downloads
-    let active_tasks = state.download_orchestrator.task_manager().get_active_tasks().await;
+    let live = state.download_orchestrator.task_manager().get_active_progress().await;
     let mut tasks_with_realtime = tasks;
-    for task in tasks_with_realtime.iter_mut() {
-        if let Some(active) = active_tasks.iter().find(|t| t.id == task.id) {
-            task.progress = active.progress;
-            task.speed = active.speed;
-            task.eta = active.eta;
-            task.downloaded = active.downloaded;
-            task.state = active.state;
-        }
-    }
+    merge_realtime_progress(&mut tasks_with_realtime, &live);
     
-    Ok(Json(tasks_with_realtime))
+    // Small batches keep the buffered fast path
+    if tasks_with_realtime.len() > STREAM_THRESHOLD {
+        Ok(stream_json_array(tasks_with_realtime))
+    } else {
+        Ok(Json(tasks_with_realtime).into_response())
+    }
 }
 
 // ============================================================================
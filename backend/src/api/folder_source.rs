@@ -47,6 +47,20 @@ struct FolderSourceConfig {
     pub gist_url: String,
 }
 
+const FSHARE_FILE_URL_PREFIX: &str = "https://www.fshare.vn/file/";
+const FSHARE_FOLDER_URL_PREFIX: &str = "https://www.fshare.vn/folder/";
+
+/// Build the public Fshare URL for a folder listing item.
+/// Called once per item on folder enumeration, so it writes into a single
+/// presized buffer rather than going through `format!`.
+pub(crate) fn fshare_item_url(linkcode: &str, is_dir: bool) -> String {
+    let prefix = if is_dir { FSHARE_FOLDER_URL_PREFIX } else { FSHARE_FILE_URL_PREFIX };
+    let mut url = String::with_capacity(prefix.len() + linkcode.len());
+    url.push_str(prefix);
+    url.push_str(linkcode);
+    url
+}
+
 /// A raw item parsed from the Fshare v3 XML response
 #[derive(Debug, Clone, Default)]
 struct FshareXmlItem {
@@ -365,7 +379,7 @@ fn parse_folder_response(body: &str) -> (Vec<FshareXmlItem>, bool) {
 
 /// Parse JSON response from Fshare v3 API
 fn parse_folder_json(json_text: &str) -> (Vec<FshareXmlItem>, bool) {
-    let parsed: serde_json::Value = match serde_json::from_str(json_text) {
+    let mut parsed: serde_json::Value = match serde_json::from_str(json_text) {
         Ok(v) => v,
         Err(e) => {
             tracing::error!("[FOLDER-SOURCE] JSON parse error: {}", e);
@@ -373,33 +387,24 @@ fn parse_folder_json(json_text: &str) -> (Vec<FshareXmlItem>, bool) {
         }
     };
 
+    let has_next = parsed.get("_links")
+        .and_then(|links| links.get("next"))
+        .map(|next| !next.is_null())
+        .unwrap_or(false);
+
     let mut items = Vec::new();
-    if let Some(arr) = parsed.get("items").and_then(|v| v.as_array()) {
-        for item in arr {
-            let linkcode = item.get("linkcode").and_then(|v| v.as_str()).unwrap_or("").to_string();
-            let name = item.get("name").and_then(|v| v.as_str()).unwrap_or("").to_string();
+    // Items are taken by value so their strings move into FshareXmlItem without cloning
+    if let Some(serde_json::Value::Array(arr)) = parsed.get_mut("items").map(serde_json::Value::take) {
+        for mut item in arr {
+            let linkcode = take_json_str(&mut item, "linkcode");
+            let name = take_json_str(&mut item, "name");
             if linkcode.is_empty() || name.is_empty() { continue; }
 
-            let id = item.get("id").map(|v| match v {
-                serde_json::Value::Number(n) => n.to_string(),
-                serde_json::Value::String(s) => s.clone(),
-                _ => String::new(),
-            }).unwrap_or_default();
-
-            let item_type = item.get("type").map(|v| match v {
-                serde_json::Value::Number(n) => n.to_string(),
-                serde_json::Value::String(s) => s.clone(),
-                _ => String::new(),
-            }).unwrap_or_default();
-
-            let size = item.get("size").map(|v| match v {
-                serde_json::Value::Number(n) => n.to_string(),
-                serde_json::Value::String(s) => s.clone(),
-                _ => "0".to_string(),
-            }).unwrap_or_else(|| "0".to_string());
-
-            let mimetype = item.get("mimetype").and_then(|v| v.as_str()).unwrap_or("").to_string();
-            let path = item.get("path").and_then(|v| v.as_str()).unwrap_or("").to_string();
+            let id = take_json_scalar(&mut item, "id").unwrap_or_default();
+            let item_type = take_json_scalar(&mut item, "type").unwrap_or_default();
+            let size = take_json_scalar(&mut item, "size").unwrap_or_else(|| "0".to_string());
+            let mimetype = take_json_str(&mut item, "mimetype");
+            let path = take_json_str(&mut item, "path");
 
             items.push(FshareXmlItem {
                 id,
@@ -413,14 +418,26 @@ fn parse_folder_json(json_text: &str) -> (Vec<FshareXmlItem>, bool) {
         }
     }
 
-    let has_next = parsed.get("_links")
-        .and_then(|links| links.get("next"))
-        .map(|next| !next.is_null())
-        .unwrap_or(false);
-
     (items, has_next)
 }
 
+/// Move a string field out of a JSON item instead of cloning it
+pub(crate) fn take_json_str(item: &mut serde_json::Value, key: &str) -> String {
+    match item.get_mut(key).map(serde_json::Value::take) {
+        Some(serde_json::Value::String(s)) => s,
+        _ => String::new(),
+    }
+}
+
+/// Move a string-or-number field out of a JSON item as a string
+pub(crate) fn take_json_scalar(item: &mut serde_json::Value, key: &str) -> Option<String> {
+    match item.get_mut(key).map(serde_json::Value::take)? {
+        serde_json::Value::String(s) => Some(s),
+        serde_json::Value::Number(n) => Some(n.to_string()),
+        _ => None,
+    }
+}
+
 /// Parse Fshare v3 XML response (legacy format)
 fn parse_folder_xml(xml_text: &str) -> (Vec<FshareXmlItem>, bool) {
     let mut reader = Reader::from_str(xml_text);
@@ -599,11 +616,7 @@ async fn scan_single_folder(
             let size: u64 = xml_item.size.parse().unwrap_or(0);
 
             // Build the Fshare URL
-            let fshare_url = if is_dir {
-                format!("https://www.fshare.vn/folder/{}", xml_item.linkcode)
-            } else {
-                format!("https://www.fshare.vn/file/{}", xml_item.linkcode)
-            };
+            let fshare_url = fshare_item_url(&xml_item.linkcode, is_dir);
 
             // Parse the name to detect movies/series
             let parsed = FilenameParser::parse(&xml_item.name);
@@ -672,6 +685,12 @@ mod tests {
         assert_eq!(extract_folder_code("garbage"), None);
     }
 
+    #[test]
+    fn test_fshare_item_url() {
+        assert_eq!(fshare_item_url("ABC123", false), "https://www.fshare.vn/file/ABC123");
+        assert_eq!(fshare_item_url("XEVZ47FBZSR4", true), "https://www.fshare.vn/folder/XEVZ47FBZSR4");
+    }
+
     #[test]
     fn test_parse_folder_xml() {
         let xml = r#"<?xml version="1.0" encoding="UTF-8"?>
@@ -761,18 +780,20 @@ mod tests {
             "From - Bẫy_Việt Sub",
         ];
 
-        println!("\n📊 Folder Name Parsing Results (diagnostic)\n");
+        // Build the whole report and print it once rather than line by line
+        use std::fmt::Write;
+        let mut report = String::from("\n📊 Folder Name Parsing Results (diagnostic)\n\n");
         for name in &names {
             let parsed = FilenameParser::parse(name);
-            println!("Input:    {}", name);
-            println!("  title:     '{}'", parsed.title);
-            println!("  is_series: {}", parsed.is_series);
-            println!("  season:    {:?}", parsed.season);
-            println!("  episode:   {:?}", parsed.episode);
-            println!("  year:      {:?}", parsed.year);
-            println!("  quality:   {}", parsed.quality_attrs.quality_name());
-            println!();
+            let _ = writeln!(report, "Input:    {}", name);
+            let _ = writeln!(report, "  title:     '{}'", parsed.title);
+            let _ = writeln!(report, "  is_series: {}", parsed.is_series);
+            let _ = writeln!(report, "  season:    {:?}", parsed.season);
+            let _ = writeln!(report, "  episode:   {:?}", parsed.episode);
+            let _ = writeln!(report, "  year:      {:?}", parsed.year);
+            let _ = writeln!(report, "  quality:   {}\n", parsed.quality_attrs.quality_name());
         }
+        print!("{}", report);
 
         // Only assert that parsing doesn't panic — all names are parseable
         assert!(names.len() > 0);
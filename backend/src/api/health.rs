@@ -44,29 +44,26 @@ pub async fn health_status(
     State(state): State<Arc<AppState>>,
 ) -> Result<Json<HealthCheckResponse>, StatusCode> {
     
-    // Check WebSocket (enhanced - check if broadcast channel is working)
-    let websocket = check_websocket(&state).await;
-
-    // Check Webhook (SABnzbd API bridge)
-    let webhook = check_webhook(&state).await;
-
-    // Check Sonarr
-    let sonarr = check_arr_service(&state, "sonarr").await;
-
-    // Check Radarr
-    let radarr = check_arr_service(&state, "radarr").await;
-
-    // Check Fshare handler
-    let fshare = check_fshare(&state).await;
-
-    // Check Fshare ping (actual connectivity)
-    let fshare_ping = check_fshare_ping(&state).await;
-
-    // Check Internet speed (placeholder)
-    let internet_speed = check_internet_speed().await;
-
-    // Check Database
-    let database = check_database(&state).await;
+    // The Sonarr, Radarr and Fshare probes each wait on a remote host (up to
+    // 5s apiece), so run every check concurrently instead of back to back.
+    let (websocket, webhook, sonarr, radarr, fshare, fshare_ping, internet_speed, database) = tokio::join!(
+        // Check WebSocket (enhanced - check if broadcast channel is working)
+        check_websocket(&state),
+        // Check Webhook (SABnzbd API bridge)
+        check_webhook(&state),
+        // Check Sonarr
+        check_arr_service(&state, "sonarr"),
+        // Check Radarr
+        check_arr_service(&state, "radarr"),
+        // Check Fshare handler
+        check_fshare(&state),
+        // Check Fshare ping (actual connectivity)
+        check_fshare_ping(&state),
+        // Check Internet speed (placeholder)
+        check_internet_speed(),
+        // Check Database
+        check_database(&state),
+    );
 
     // Determine overall status
     let overall_status = determine_overall_status(&[
@@ -93,32 +90,23 @@ pub async fn health_status(
 }
 
 async fn check_arr_service(state: &AppState, service_type: &str) -> Option<ServiceHealth> {
-    // Get settings from database
-    let db = &state.db;
-    
-    let (enabled, url, api_key) = match service_type {
-        "sonarr" => {
-            let enabled = db.get_setting("sonarr_enabled")
-                .ok()
-                .flatten()
-                .and_then(|v| v.parse::<bool>().ok())
-                .unwrap_or(false);
-            let url = db.get_setting("sonarr_url").ok().flatten();
-            let api_key = db.get_setting("sonarr_api_key").ok().flatten();
-            (enabled, url, api_key)
-        },
-        "radarr" => {
-            let enabled = db.get_setting("radarr_enabled")
-                .ok()
-                .flatten()
-                .and_then(|v| v.parse::<bool>().ok())
-                .unwrap_or(false);
-            let url = db.get_setting("radarr_url").ok().flatten();
-            let api_key = db.get_setting("radarr_api_key").ok().flatten();
-            (enabled, url, api_key)
-        },
-        _ => return None,
-    };
+    if !matches!(service_type, "sonarr" | "radarr") {
+        return None;
+    }
+
+    // Get settings from database (one query for all three keys)
+    let enabled_key = format!("{}_enabled", service_type);
+    let url_key = format!("{}_url", service_type);
+    let api_key_key = format!("{}_api_key", service_type);
+    let mut settings = state.db
+        .get_settings(&[enabled_key.as_str(), url_key.as_str(), api_key_key.as_str()])
+        .unwrap_or_default();
+
+    let enabled = settings.get(&enabled_key)
+        .and_then(|v| v.parse::<bool>().ok())
+        .unwrap_or(false);
+    let url = settings.remove(&url_key);
+    let api_key = settings.remove(&api_key_key);
 
     if !enabled {
         return None;
@@ -129,7 +117,7 @@ async fn check_arr_service(state: &AppState, service_type: &str) -> Option<Servi
 
     // Test connection with system/status endpoint
     let start = std::time::Instant::now();
-    let client = reqwest::Client::new();
+    let client = &state.http_client;
     let test_url = format!("{}/api/v3/system/status", url.trim_end_matches('/'));
     
     match client
@@ -231,11 +219,12 @@ async fn check_webhook(_state: &AppState) -> ServiceHealth {
     }
 }
 
-async fn check_fshare_ping(_state: &AppState) -> ServiceHealth {
-    // Actual ping to Fshare to test connectivity
+async fn check_fshare_ping(state: &AppState) -> ServiceHealth {
+    // Actual ping to Fshare to test connectivity; the shared client keeps the
+    // connection alive so repeated polls skip the TCP + TLS handshake
     let start = std::time::Instant::now();
-    let client = reqwest::Client::new();
-    
+    let client = &state.http_client;
+
     match client
         .get("https://www.fshare.vn")
         .timeout(std::time::Duration::from_secs(5))
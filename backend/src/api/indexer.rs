@@ -9,6 +9,7 @@ use axum::{
     extract::{State, Query},
     http::{StatusCode, HeaderMap},
 };
+use std::borrow::Cow;
 use std::sync::Arc;
 use serde::Deserialize;
 use crate::AppState;
@@ -112,51 +113,57 @@ async fn handle_indexer(
         params.t, params.q, params.season, params.ep, params.tmdbid, params.imdbid, params.tvdbid, params.cat, params.apikey
     );
     
-    let (status, xml_body) = match params.t.as_str() {
-        "caps" => (StatusCode::OK, handle_caps()),
+    let (status, xml_body): (StatusCode, Cow<'static, str>) = match params.t.as_str() {
+        "caps" => (StatusCode::OK, Cow::Borrowed(handle_caps())),
         "search" => {
-            if !crate::api::auth::validate_api_key(&state, &params.apikey) {
+            if !crate::api::auth::validate_api_key(&state, &params.apikey).await {
                 tracing::warn!("Invalid API key provided: {:?}", params.apikey);
-                (StatusCode::UNAUTHORIZED, generate_error_xml("Invalid API key"))
+                (StatusCode::UNAUTHORIZED, Cow::Borrowed(INVALID_API_KEY_XML))
             } else {
-                (StatusCode::OK, handle_search(state, params).await)
+                (StatusCode::OK, Cow::Owned(handle_search(state, params).await))
             }
         },
         "tvsearch" => {
-            if !crate::api::auth::validate_api_key(&state, &params.apikey) {
+            if !crate::api::auth::validate_api_key(&state, &params.apikey).await {
                 tracing::warn!("Invalid API key provided: {:?}", params.apikey);
-                (StatusCode::UNAUTHORIZED, generate_error_xml("Invalid API key"))
+                (StatusCode::UNAUTHORIZED, Cow::Borrowed(INVALID_API_KEY_XML))
             } else {
-                (StatusCode::OK, handle_tv_search(state, params, host).await)
+                (StatusCode::OK, Cow::Owned(handle_tv_search(state, params, host).await))
             }
         },
         "movie" => {
-            if !crate::api::auth::validate_api_key(&state, &params.apikey) {
+            if !crate::api::auth::validate_api_key(&state, &params.apikey).await {
                 tracing::warn!("Invalid API key provided: {:?}", params.apikey);
-                (StatusCode::UNAUTHORIZED, generate_error_xml("Invalid API key"))
+                (StatusCode::UNAUTHORIZED, Cow::Borrowed(INVALID_API_KEY_XML))
             } else {
-                (StatusCode::OK, handle_movie_search(state, params, host).await)
+                (StatusCode::OK, Cow::Owned(handle_movie_search(state, params, host).await))
             }
         },
-        _ => (StatusCode::BAD_REQUEST, generate_error_xml("Unknown function")),
+        _ => (StatusCode::BAD_REQUEST, Cow::Borrowed(UNKNOWN_FUNCTION_XML)),
     };
     
     // CRITICAL: Trim to remove any leading/trailing whitespace from r#""# strings
-    let trimmed_body = xml_body.trim().to_string();
+    let trimmed_body = xml_body.trim();
+    
+    // Debug: Log response preview for troubleshooting (arguments are only
+    // evaluated when DEBUG is enabled, so production pays nothing here)
+    tracing::debug!(
+        "XML Response Preview: {}{}",
+        log_preview(trimmed_body, 500),
+        if trimmed_body.len() > 500 { format!("... ({} total bytes)", trimmed_body.len()) } else { String::new() }
+    );
     
-    // Debug: Log response preview for troubleshooting
-    let preview = if trimmed_body.len() > 500 {
-        format!("{}... ({} total bytes)", &trimmed_body[..500], trimmed_body.len())
-    } else {
-        trimmed_body.clone()
+    // Static bodies are handed to hyper as-is; generated ones are copied once
+    let body = match xml_body {
+        Cow::Borrowed(xml) => Body::from(xml.trim()),
+        Cow::Owned(ref xml) => Body::from(xml.trim().to_string()),
     };
-    tracing::debug!("XML Response Preview: {}", preview);
     
     // FORCE the response headers and body using explicit builder
     Response::builder()
         .status(status)
         .header(header::CONTENT_TYPE, "application/xml; charset=utf-8")
-        .body(Body::from(trimmed_body))
+        .body(body)
         .unwrap()
 }
 
@@ -221,7 +228,7 @@ async fn handle_nzb_download(
 }
 
 /// Handle capabilities request
-fn handle_caps() -> String {
+fn handle_caps() -> &'static str {
     r#"<?xml version="1.0" encoding="UTF-8"?>
 <caps>
   <server title="Fshare Indexer" version="1.0" />
@@ -241,16 +248,29 @@ fn handle_caps() -> String {
       <subcat id="5045" name="TV/UHD" />
     </category>
   </categories>
-</caps>"#.to_string()
+</caps>"#
 }
 
 // ============================================================================
 // ID Conversion & Smart Search Bridge
 // ============================================================================
 
+/// Shared client for TMDB lookups made outside request state (ID conversion,
+/// title fetches from the orchestrator), so they reuse pooled connections
+fn tmdb_client() -> &'static Client {
+    static CLIENT: once_cell::sync::Lazy<Client> = once_cell::sync::Lazy::new(|| {
+        Client::builder()
+            .timeout(Duration::from_secs(15))
+            .pool_idle_timeout(Duration::from_secs(90))
+            .build()
+            .unwrap_or_default()
+    });
+    &CLIENT
+}
+
 /// Convert TVDB ID to TMDB ID
 async fn tvdb_to_tmdb(tvdb_id: &str) -> Option<String> {
-    let client = Client::new();
+    let client = tmdb_client();
     let url = format!(
         "https://api.themoviedb.org/3/find/{}?api_key={}&external_source=tvdb_id",
         tvdb_id, TMDB_API_KEY
@@ -269,7 +289,7 @@ async fn tvdb_to_tmdb(tvdb_id: &str) -> Option<String> {
 
 /// Convert IMDB ID to TMDB ID
 async fn imdb_to_tmdb(imdb_id: &str) -> Option<String> {
-    let client = Client::new();
+    let client = tmdb_client();
     
     // Ensure IMDB ID has 'tt' prefix
     let clean_id = if imdb_id.starts_with("tt") {
@@ -474,7 +494,7 @@ pub async fn fetch_tmdb_title(tmdb_id: &str, media_type: &str) -> Option<String>
     }
 
     tracing::info!("TMDB title cache MISS: {} — fetching from API", cache_key);
-    let client = Client::new();
+    let client = tmdb_client();
     let endpoint = if media_type == "tv" { "tv" } else { "movie" };
     let url = format!(
         "https://api.themoviedb.org/3/{}/{}?api_key={}",
@@ -544,7 +564,7 @@ pub async fn fetch_tmdb_title_and_year(
         return (cached_title, year);
     }
 
-    let client = Client::new();
+    let client = tmdb_client();
     let endpoint = if media_type == "tv" { "tv" } else { "movie" };
     let url = format!(
         "https://api.themoviedb.org/3/{}/{}?api_key={}",
@@ -883,19 +903,13 @@ async fn handle_movie_search(
 
 /// Execute Fshare search and convert to indexer results
 async fn execute_fshare_search_for_indexer(
-    _state: &AppState,
+    state: &AppState,
     query: &str,
 ) -> Vec<IndexerResult> {
-    use reqwest::Client;
     use crate::api::search_pipeline::SearchPipeline;
     
-    let client = Client::builder()
-        .timeout(std::time::Duration::from_secs(10))
-        .build()
-        .unwrap_or_else(|_| Client::new());
-    
-    // Use SearchPipeline for consistent Fshare search
-    let raw_results = SearchPipeline::execute_fshare_search(&client, query, 100).await;
+    // Use SearchPipeline for consistent Fshare search (shared pooled client)
+    let raw_results = SearchPipeline::execute_fshare_search(&state.http_client, query, 100).await;
     
     raw_results.into_iter().map(|r| {
         IndexerResult {
@@ -914,57 +928,43 @@ fn determine_category(filename: &str) -> u32 {
     use regex::Regex;
     use once_cell::sync::Lazy;
     
-    // Compile regex patterns once
-    static TV_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-        vec![
+    // TV and anime episode markers, compiled once into a single alternation
+    // so each filename is scanned in one pass instead of once per pattern
+    static SERIES_PATTERN: Lazy<Regex> = Lazy::new(|| {
+        Regex::new(concat!(
+            "(?i)",
             // Standard patterns: S01E01, S1E1, s01e01
-            Regex::new(r"(?i)s\d{1,2}e\d{1,2}").unwrap(),
+            r"s\d{1,2}e\d{1,2}",
             // Alternative: 1x01, 1X01
-            Regex::new(r"(?i)\d{1,2}x\d{1,2}").unwrap(),
-            // Season/Episode words
-            Regex::new(r"(?i)(season|episode|tập|tap)\s*\d+").unwrap(),
-            // Complete Season: Season 1, Season.1
-            Regex::new(r"(?i)season[\s.]*\d+").unwrap(),
-        ]
-    });
-    
-    static ANIME_PATTERNS: Lazy<Vec<Regex>> = Lazy::new(|| {
-        vec![
+            r"|\d{1,2}x\d{1,2}",
+            // Season/Episode words, Complete Season: Season 1, Season.1
+            r"|(season|episode|tập|tap)\s*\d+",
+            r"|season[\s.]*\d+",
             // Anime episode patterns: [01], - 01, EP01
-            Regex::new(r"(?i)\[(\d{1,3})\]").unwrap(),
-            Regex::new(r"(?i)\s-\s(\d{1,3})\s").unwrap(),
-            Regex::new(r"(?i)ep\s*\d{1,3}").unwrap(),
+            r"|\[(\d{1,3})\]",
+            r"|\s-\s(\d{1,3})\s",
+            r"|ep\s*\d{1,3}",
             // Batch patterns
-            Regex::new(r"(?i)(batch|complete|全集)").unwrap(),
-        ]
+            r"|(batch|complete|全集)",
+            // Explicit anime markers
+            r"|anime|アニメ",
+        ))
+        .unwrap()
     });
+    static UHD_PATTERN: Lazy<Regex> = Lazy::new(|| Regex::new("2160p|4k|uhd|2k").unwrap());
     
     let lower = filename.to_lowercase();
     
-    // Check for anime indicators first (more specific)
-    let is_anime = ANIME_PATTERNS.iter().any(|re| re.is_match(&lower)) ||
-                   lower.contains("anime") ||
-                   lower.contains("アニメ") ||
-                   lower.contains("[") && lower.contains("]") && 
-                   (lower.contains("1080p") || lower.contains("720p") || lower.contains("2160p"));
+    // Anime and TV share the TV categories, so one combined check decides both
+    let is_series = SERIES_PATTERN.is_match(&lower) ||
+                    lower.contains("[") && lower.contains("]") && 
+                    (lower.contains("1080p") || lower.contains("720p") || lower.contains("2160p"));
     
-    // Check for TV show patterns
-    let is_tv = TV_PATTERNS.iter().any(|re| re.is_match(&lower));
+    // Check for resolution (one literal-set scan)
+    let is_uhd = UHD_PATTERN.is_match(&lower);
     
-    // Check for resolution
-    let is_uhd = lower.contains("2160p") || 
-                 lower.contains("4k") || 
-                 lower.contains("uhd") ||
-                 lower.contains("2k");
-    
-    // Determine category with priority: Anime > TV > Movies
-    if is_anime {
-        if is_uhd {
-            5045 // TV/UHD (anime in UHD)
-        } else {
-            5040 // TV/HD (anime in HD)
-        }
-    } else if is_tv {
+    // Determine category: TV (including anime) > Movies
+    if is_series {
         if is_uhd {
             5045 // TV/UHD
         } else {
@@ -987,7 +987,9 @@ fn generate_search_xml(results: Vec<IndexerResult>, _query: &str) -> String {
     use quick_xml::Writer;
     use std::io::Cursor;
     
-    let mut writer = Writer::new(Cursor::new(Vec::new()));
+    // Items run to roughly 1KB each; size the buffer up front so the
+    // stream is written once instead of regrowing as items are appended
+    let mut writer = Writer::new(Cursor::new(Vec::with_capacity(512 + results.len() * 1024)));
     
     // XML declaration
     writer.write_event(Event::Decl(quick_xml::events::BytesDecl::new("1.0", Some("UTF-8"), None))).unwrap();
@@ -1041,6 +1043,8 @@ fn write_item<W: std::io::Write>(writer: &mut quick_xml::Writer<W>, result: Inde
     use quick_xml::events::{Event, BytesStart, BytesText, BytesEnd};
     
     writer.write_event(Event::Start(BytesStart::new("item"))).unwrap();
+    // Formatted once and reused by <size>, the enclosure and the size attribute
+    let size = result.size.to_string();
     
     // Title
     writer.write_event(Event::Start(BytesStart::new("title"))).unwrap();
@@ -1061,7 +1065,7 @@ fn write_item<W: std::io::Write>(writer: &mut quick_xml::Writer<W>, result: Inde
     
     // Size
     writer.write_event(Event::Start(BytesStart::new("size"))).unwrap();
-    writer.write_event(Event::Text(BytesText::new(&result.size.to_string()))).unwrap();
+    writer.write_event(Event::Text(BytesText::new(&size))).unwrap();
     writer.write_event(Event::End(BytesEnd::new("size"))).unwrap();
     
     // Pub date
@@ -1072,7 +1076,7 @@ fn write_item<W: std::io::Write>(writer: &mut quick_xml::Writer<W>, result: Inde
     // Enclosure (CRITICAL for *arr suite to recognize downloadable content)
     let mut enclosure = BytesStart::new("enclosure");
     enclosure.push_attribute(("url", result.link.as_str()));
-    enclosure.push_attribute(("length", result.size.to_string().as_str()));
+    enclosure.push_attribute(("length", size.as_str()));
     enclosure.push_attribute(("type", "application/x-nzb"));
     writer.write_event(Event::Empty(enclosure)).unwrap();
     
@@ -1104,21 +1108,32 @@ fn write_item<W: std::io::Write>(writer: &mut quick_xml::Writer<W>, result: Inde
     // Size attribute (*arr suite prefers this over <size> tag)
     let mut attr_size = BytesStart::new("newznab:attr");
     attr_size.push_attribute(("name", "size"));
-    attr_size.push_attribute(("value", result.size.to_string().as_str()));
+    attr_size.push_attribute(("value", size.as_str()));
     writer.write_event(Event::Empty(attr_size)).unwrap();
     
     writer.write_event(Event::End(BytesEnd::new("item"))).unwrap();
 }
 
-/// Generate error XML
-fn generate_error_xml(message: &str) -> String {
-    format!(
-        r#"<?xml version="1.0" encoding="UTF-8"?>
-<error code="100" description="{}" />"#,
-        message
-    )
+/// Longest prefix of `text` up to `max` bytes that ends on a char boundary
+fn log_preview(text: &str, max: usize) -> &str {
+    if text.len() <= max {
+        return text;
+    }
+    let mut end = max;
+    while !text.is_char_boundary(end) {
+        end -= 1;
+    }
+    &text[..end]
 }
 
+/// Error XML for a request with a missing or wrong API key
+const INVALID_API_KEY_XML: &str = r#"<?xml version="1.0" encoding="UTF-8"?>
+<error code="100" description="Invalid API key" />"#;
+
+/// Error XML for an unsupported `t=` function
+const UNKNOWN_FUNCTION_XML: &str = r#"<?xml version="1.0" encoding="UTF-8"?>
+<error code="100" description="Unknown function" />"#;
+
 // ============================================================================
 // Data Structures
 // ============================================================================
@@ -1141,6 +1156,18 @@ struct IndexerResult {
 mod tests {
     use super::*;
     
+    /// Indexer result with a fixed publish date, shared by the XML tests
+    fn sample_result(title: &str, code: &str, link: &str, size: u64, category: u32) -> IndexerResult {
+        IndexerResult {
+            title: title.to_string(),
+            guid: format!("fshare://{}", code),
+            link: link.to_string(),
+            size,
+            pub_date: DateTime::<Utc>::UNIX_EPOCH,
+            category,
+        }
+    }
+    
     #[test]
     fn test_determine_category_movies_hd() {
         // 1080p movies
@@ -1220,12 +1247,23 @@ mod tests {
     }
     
     #[test]
-    fn test_generate_error_xml() {
-        let error = generate_error_xml("Test error message");
-        
-        assert!(error.contains("<?xml version=\"1.0\" encoding=\"UTF-8\"?>"));
-        assert!(error.contains("<error code=\"100\""));
-        assert!(error.contains("Test error message"));
+    fn test_log_preview_respects_char_boundaries() {
+        assert_eq!(log_preview("short", 500), "short");
+        assert_eq!(log_preview("abcdef", 3), "abc");
+        // "ậ" is 3 bytes; cutting at 2 must back off to the boundary before it
+        assert_eq!(log_preview("aậb", 2), "a");
+    }
+
+    #[test]
+    fn test_error_xml_constants() {
+        for (error, message) in [
+            (INVALID_API_KEY_XML, "Invalid API key"),
+            (UNKNOWN_FUNCTION_XML, "Unknown function"),
+        ] {
+            assert!(error.contains("<?xml version=\"1.0\" encoding=\"UTF-8\"?>"));
+            assert!(error.contains("<error code=\"100\""));
+            assert!(error.contains(message));
+        }
     }
     
     #[test]
@@ -1244,22 +1282,8 @@ mod tests {
     #[test]
     fn test_generate_search_xml_with_items() {
         let results = vec![
-            IndexerResult {
-                title: "Test Movie 1080p".to_string(),
-                guid: "fshare://TEST123".to_string(),
-                link: "https://www.fshare.vn/file/TEST123".to_string(),
-                size: 1024 * 1024 * 1024, // 1GB
-                pub_date: Utc::now(),
-                category: 2040,
-            },
-            IndexerResult {
-                title: "Test Show S01E01 2160p".to_string(),
-                guid: "fshare://TEST456".to_string(),
-                link: "https://www.fshare.vn/file/TEST456".to_string(),
-                size: 2 * 1024 * 1024 * 1024, // 2GB
-                pub_date: Utc::now(),
-                category: 5045,
-            },
+            sample_result("Test Movie 1080p", "TEST123", "https://www.fshare.vn/file/TEST123", 1024 * 1024 * 1024, 2040), // 1GB
+            sample_result("Test Show S01E01 2160p", "TEST456", "https://www.fshare.vn/file/TEST456", 2 * 1024 * 1024 * 1024, 5045), // 2GB
         ];
         
         let xml = generate_search_xml(results, "test");
@@ -1286,24 +1310,10 @@ mod tests {
     
     #[test]
     fn test_indexer_result_category_assignment() {
-        let movie_hd = IndexerResult {
-            title: "Movie.1080p.mkv".to_string(),
-            guid: "fshare://TEST1".to_string(),
-            link: "https://example.com".to_string(),
-            size: 1000,
-            pub_date: Utc::now(),
-            category: determine_category("Movie.1080p.mkv"),
-        };
+        let movie_hd = sample_result("Movie.1080p.mkv", "TEST1", "https://example.com", 1000, determine_category("Movie.1080p.mkv"));
         assert_eq!(movie_hd.category, 2040);
         
-        let tv_uhd = IndexerResult {
-            title: "Show.S01E01.2160p.mkv".to_string(),
-            guid: "fshare://TEST2".to_string(),
-            link: "https://example.com".to_string(),
-            size: 2000,
-            pub_date: Utc::now(),
-            category: determine_category("Show.S01E01.2160p.mkv"),
-        };
+        let tv_uhd = sample_result("Show.S01E01.2160p.mkv", "TEST2", "https://example.com", 2000, determine_category("Show.S01E01.2160p.mkv"));
         assert_eq!(tv_uhd.category, 5045);
     }
     
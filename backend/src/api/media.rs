@@ -5,7 +5,7 @@ use axum::{
 };
 use serde::{Serialize, Deserialize};
 use serde_json::Value;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use std::collections::HashMap;
 
 use crate::AppState;
@@ -204,12 +204,18 @@ async fn smart_grab(
     .map_err(|e| (axum::http::StatusCode::INTERNAL_SERVER_ERROR, e))
 }
 
+/// Host name used to filter history rows. The environment is fixed for the
+/// lifetime of the process, so it is read once instead of on every request.
+fn history_host() -> &'static str {
+    static HOST: OnceLock<String> = OnceLock::new();
+    HOST.get_or_init(|| std::env::var("FLASHARR_HOST").unwrap_or_else(|_| "flasharr".to_string()))
+}
+
 /// GET /api/media/history — Get download history
 async fn get_media_history(
     State(state): State<Arc<AppState>>,
 ) -> Result<Json<Vec<crate::downloader::task::DownloadTask>>, (axum::http::StatusCode, String)> {
-    let host = std::env::var("FLASHARR_HOST").unwrap_or_else(|_| "flasharr".to_string());
-    state.db.get_history_async(&host).await
+    state.db.get_history_async(history_host()).await
         .map(Json)
         .map_err(|e| (axum::http::StatusCode::INTERNAL_SERVER_ERROR, format!("DB error: {}", e)))
 }
@@ -11,10 +11,12 @@ use axum::{
     http::StatusCode,
     response::IntoResponse,
 };
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, OnceLock};
 use serde::{Deserialize, Serialize};
 use crate::AppState;
-use crate::downloader::DownloadState;
+use crate::api::downloads::invalidate_listing;
+use crate::downloader::{DownloadState, DownloadTask};
 
 pub fn router() -> Router<Arc<AppState>> {
     Router::new()
@@ -49,15 +51,141 @@ pub struct SabParams {
     nzo_id: Option<String>,    // Task ID for operations
 }
 
+/// Queue slot borrowing from the task snapshot; sizes and ETA are formatted
+/// straight into the response buffer instead of via per-row Strings.
 #[derive(Serialize)]
-struct SabQueueSlot {
-    nzo_id: String,
-    filename: String,
+struct SabQueueSlot<'a> {
+    nzo_id: uuid::Uuid,
+    filename: &'a str,
     percentage: u32,
-    mb: String,
-    mbleft: String,
-    status: String,
-    timeleft: String,
+    mb: Megabytes,
+    mbleft: Megabytes,
+    status: &'static str,
+    timeleft: TimeLeft,
+}
+
+/// Byte count rendered as SABnzbd's two-decimal megabyte string
+struct Megabytes(u64);
+
+impl Serialize for Megabytes {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.collect_str(&format_args!("{:.2}", self.0 as f64 / 1_048_576.0))
+    }
+}
+
+/// Remaining seconds rendered as `"{n}s"`, or `"Unknown"` when stalled
+struct TimeLeft(Option<u64>);
+
+impl Serialize for TimeLeft {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        match self.0 {
+            Some(secs) => serializer.collect_str(&format_args!("{}s", secs)),
+            None => serializer.serialize_str("Unknown"),
+        }
+    }
+}
+
+/// Byte amount rendered as a two-decimal megabyte string with a unit label,
+/// e.g. `"12.50 MB"` or `"3.20 MB/s"`
+struct LabeledMegabytes(f64, &'static str);
+
+impl Serialize for LabeledMegabytes {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        serializer.collect_str(&format_args!("{:.2} {}", self.0 / 1_048_576.0, self.1))
+    }
+}
+
+/// Running totals accumulated while building queue slots
+#[derive(Default)]
+struct QueueTotals {
+    speed: f64,
+    size: u64,
+    left: u64,
+}
+
+impl QueueTotals {
+    fn speed(&self) -> LabeledMegabytes {
+        LabeledMegabytes(self.speed, "MB/s")
+    }
+
+    fn size(&self) -> LabeledMegabytes {
+        LabeledMegabytes(self.size as f64, "MB")
+    }
+
+    fn sizeleft(&self) -> LabeledMegabytes {
+        LabeledMegabytes(self.left as f64, "MB")
+    }
+}
+
+fn queue_slot_status(state: DownloadState) -> &'static str {
+    match state {
+        DownloadState::Queued => "Queued",
+        DownloadState::Starting => "Starting",
+        DownloadState::Downloading => "Downloading",
+        DownloadState::Waiting => "Waiting",
+        _ => "Unknown",
+    }
+}
+
+/// Build queue slots for the given tasks, accumulating speed/size totals
+fn build_queue_slots<'a>(
+    tasks: impl Iterator<Item = &'a crate::downloader::DownloadTask>,
+) -> (Vec<SabQueueSlot<'a>>, QueueTotals) {
+    let mut totals = QueueTotals::default();
+    let slots = tasks
+        .map(|t| {
+            totals.speed += t.speed as f64;
+            totals.size += t.size;
+            let downloaded = ((t.progress as f64) / 100.0 * t.size as f64) as u64;
+            let left = t.size.saturating_sub(downloaded);
+            totals.left += left;
+
+            let speed = t.speed as f64;
+            SabQueueSlot {
+                nzo_id: t.id,
+                filename: &t.filename,
+                percentage: t.progress as u32,
+                mb: Megabytes(t.size),
+                mbleft: Megabytes(left),
+                status: queue_slot_status(t.state),
+                timeleft: TimeLeft((speed > 0.0).then(|| (left as f64 / speed) as u64)),
+            }
+        })
+        .collect();
+    (slots, totals)
+}
+
+/// Queue totals shared by `mode=queue` and `mode=fullstatus`
+#[derive(Serialize)]
+struct SabQueueBody<'a> {
+    paused: bool,
+    status: &'static str,
+    noofslots: usize,
+    slots: Vec<SabQueueSlot<'a>>,
+    speed: LabeledMegabytes,
+    size: LabeledMegabytes,
+    sizeleft: LabeledMegabytes,
+}
+
+#[derive(Serialize)]
+struct SabQueueResponse<'a> {
+    queue: SabQueueBody<'a>,
+}
+
+#[derive(Serialize)]
+struct SabFullStatusBody<'a> {
+    state: &'static str,
+    paused: bool,
+    noofslots: usize,
+    slots: Vec<SabQueueSlot<'a>>,
+    speed: LabeledMegabytes,
+    size: LabeledMegabytes,
+    sizeleft: LabeledMegabytes,
+}
+
+#[derive(Serialize)]
+struct SabFullStatusResponse<'a> {
+    status: SabFullStatusBody<'a>,
 }
 
 #[derive(Serialize)]
@@ -71,6 +199,79 @@ struct SabHistorySlot {
     fail_message: String,
 }
 
+#[derive(Serialize)]
+struct SabHistoryBody {
+    slots: Vec<SabHistorySlot>,
+}
+
+#[derive(Serialize)]
+struct SabHistoryResponse {
+    history: SabHistoryBody,
+}
+
+// ============================================================================
+// Constant responses
+// ============================================================================
+
+// Replies that never change are kept as ready-to-send JSON text instead of
+// building and serializing a `Value` tree per request.
+const VERSION_JSON: &str = r#"{"version":"3.5.0"}"#;
+const STATUS_OK_JSON: &str = r#"{"status":true}"#;
+const UNKNOWN_MODE_JSON: &str = r#"{"status":false,"error":"Unknown mode"}"#;
+const ADDFILE_REQUIRES_POST_JSON: &str =
+    r#"{"status":false,"error":"addfile mode requires POST with multipart data"}"#;
+
+fn json_body(body: &'static str) -> axum::response::Response {
+    ([(axum::http::header::CONTENT_TYPE, "application/json")], body).into_response()
+}
+
+/// Config (for *arr compatibility testing), serialized once per process
+/// 
+/// Sonarr/Radarr use complete_dir + category dir to determine where downloads land.
+/// Our downloads go directly into series/movie-named folders under /data/downloads/,
+/// so category dirs must be empty to avoid Sonarr looking in /data/downloads/TV/ etc.
+fn config_json() -> &'static str {
+    static CONFIG_JSON: OnceLock<String> = OnceLock::new();
+    CONFIG_JSON.get_or_init(|| {
+        serde_json::json!({
+            "config": {
+                "version": "3.5.0",
+                "paused": false,
+                "pause_int": "0",
+                "download_dir": "/data/downloads/incomplete",
+                "complete_dir": "/data/downloads",
+                "nzb_backup_dir": "/appData/nzb_backup",
+                "script_dir": "/appData/scripts",
+                "categories": [
+                    {
+                        "name": "tv",
+                        "dir": "",
+                        "newzbin": "",
+                        "priority": 0
+                    },
+                    {
+                        "name": "movies",
+                        "dir": "",
+                        "newzbin": "",
+                        "priority": 0
+                    },
+                    {
+                        "name": "*",
+                        "dir": "",
+                        "newzbin": "",
+                        "priority": 0
+                    }
+                ],
+                "misc": {
+                    "queue_complete": "",
+                    "refresh_rate": 2,
+                    "bandwidth_limit": ""
+                }
+            }
+        }).to_string()
+    })
+}
+
 // ============================================================================
 // Handlers
 // ============================================================================
@@ -89,22 +290,20 @@ pub async fn handle_get(
         "addfile" => {
             // addfile requires multipart data, return error for now
             // The actual implementation needs to be in handle_post with multipart
-            Ok(Json(serde_json::json!({ 
-                "status": false, 
-                "error": "addfile mode requires POST with multipart data" 
-            })))
+            return json_body(ADDFILE_REQUIRES_POST_JSON);
         },
-        "queue" => handle_queue(state).await,
-        "fullstatus" => handle_fullstatus(state).await,
-        "history" => handle_history(state).await,
-        "version" => handle_version().await,
-        "get_config" => handle_get_config().await,
-        "pause" => handle_pause(state, params).await,
-        "resume" => handle_resume(state, params).await,
-        "delete" => handle_delete(state, params).await,
+        // Polled endpoints serialize typed structs directly (no intermediate Value tree)
+        "queue" => return handle_queue(state).await.into_response(),
+        "fullstatus" => return handle_fullstatus(state).await.into_response(),
+        "history" => return handle_history(state).await.into_response(),
+        "version" => return json_body(VERSION_JSON),
+        "get_config" => return json_body(config_json()),
+        "pause" => return handle_pause(state, params).await,
+        "resume" => return handle_resume(state, params).await,
+        "delete" => return handle_delete(state, params).await,
         _ => {
             tracing::warn!("Unknown SABnzbd mode: {}", mode);
-            Ok(Json(serde_json::json!({ "status": false, "error": "Unknown mode" })))
+            return json_body(UNKNOWN_MODE_JSON);
         }
     };
 
@@ -154,7 +353,7 @@ async fn handle_add_file(
     let category = params.cat.unwrap_or_else(|| "other".to_string());
     
     // Parse multipart form data
-    while let Some(field) = multipart.next_field().await.map_err(|e| {
+    while let Some(mut field) = multipart.next_field().await.map_err(|e| {
         tracing::error!("Failed to read multipart field: {}", e);
         StatusCode::BAD_REQUEST
     })? {
@@ -162,7 +361,7 @@ async fn handle_add_file(
         
         // Look for the NZB file field (usually named "name" or "nzbfile")
         if field_name == "name" || field_name == "nzbfile" {
-            let data = field.bytes().await.map_err(|e| {
+            let data = read_nzb_head(&mut field).await.map_err(|e| {
                 tracing::error!("Failed to read field bytes: {}", e);
                 StatusCode::INTERNAL_SERVER_ERROR
             })?;
@@ -170,22 +369,25 @@ async fn handle_add_file(
             let content = String::from_utf8_lossy(&data);
             tracing::debug!("NZB content preview: {}", &content[..content.len().min(200)]);
             
+            let metadata = parse_nzb_metadata(&content);
+            let meta = |key: &str| metadata.get(key).map(|v| v.to_string());
+
             // Extract Fshare URL from <meta type="fshare_url"> tag
-            let fshare_url = extract_nzb_metadata(&content, "fshare_url")
+            let fshare_url = meta("fshare_url")
                 .ok_or_else(|| {
                     tracing::error!("No Fshare URL found in NZB metadata");
                     StatusCode::BAD_REQUEST
                 })?;
             
             // Extract TMDB metadata if present
-            let tmdb_id = extract_nzb_metadata(&content, "tmdb_id");
-            let season = extract_nzb_metadata(&content, "season")
+            let tmdb_id = meta("tmdb_id");
+            let season = meta("season")
                 .and_then(|s| s.parse::<u32>().ok());
-            let episode = extract_nzb_metadata(&content, "episode")
+            let episode = meta("episode")
                 .and_then(|e| e.parse::<u32>().ok());
             
             // Extract category from NZB metadata (fallback to query param)
-            let nzb_category = extract_nzb_metadata(&content, "category")
+            let nzb_category = meta("category")
                 .unwrap_or(category.clone());
             
             tracing::info!(
@@ -193,79 +395,15 @@ async fn handle_add_file(
                 fshare_url, nzb_category, tmdb_id, season, episode
             );
             
-            // Build TMDB metadata if available
-            let tmdb_meta = if let (Some(id), Some(s), Some(e)) = (tmdb_id.clone(), season, episode) {
-                // Parse tmdb_id as i64
-                let tmdb_id_i64 = id.parse::<i64>().ok();
-                
-            // Fetch series title AND release year from TMDB for proper folder/filename organization
-                let (title, year) = if let Some(tmdb_id_val) = &tmdb_id {
-                    crate::api::indexer::fetch_tmdb_title_and_year(tmdb_id_val, "tv").await
-                } else {
-                    (None, None)
-                };
-                
-                tracing::info!("SABnzbd: Fetched TMDB title: {:?}, year: {:?}", title, year);
-                
-                Some(crate::downloader::TmdbDownloadMetadata {
-                    tmdb_id: tmdb_id_i64,
-                    media_type: Some("tv".to_string()),
-                    title, // Use fetched title for proper folder structure
-                    year,  // Use fetched year for consistent filename format
-                    collection_name: None,
-                    season: Some(s as i32),
-                    episode: Some(e as i32),
-                })
-            } else {
-                None
-            };
-            
-            // Auto-batch: TV episodes should always be in a batch (same logic as downloads API)
-            let (batch_id, batch_name) = if let Some(ref meta) = tmdb_meta {
-                if meta.media_type.as_deref() == Some("tv") && meta.season.is_some() {
-                    let auto_batch_name = format!(
-                        "{} S{:02}",
-                        meta.title.as_deref().unwrap_or("Unknown Show"),
-                        meta.season.unwrap()
-                    );
-                    
-                    let existing_batch_id = state.db
-                        .get_batch_id_by_name_async(&auto_batch_name)
-                        .await
-                        .ok()
-                        .flatten();
-                    
-                    let auto_batch_id = if let Some(existing_id) = existing_batch_id {
-                        tracing::info!("SABnzbd: Reusing existing batch: {} ({})", auto_batch_name, existing_id);
-                        existing_id
-                    } else {
-                        let new_id = uuid::Uuid::new_v4().to_string();
-                        tracing::info!("SABnzbd: Creating new batch: {} ({})", auto_batch_name, new_id);
-                        new_id
-                    };
-                    
-                    (Some(auto_batch_id), Some(auto_batch_name))
-                } else {
-                    (None, None)
-                }
-            } else {
-                (None, None)
-            };
-            
-            // Add to download queue
-            // Pass None for filename to let orchestrator fetch real filename from Fshare API
-            let task = state.download_orchestrator.add_download_with_metadata(
+            let task = run_to_completion(add_nzb_download(
+                state.clone(),
                 fshare_url,
-                None, // Let orchestrator fetch real filename from Fshare API
-                "fshare".to_string(),
                 nzb_category,
-                tmdb_meta,
-                batch_id,
-                batch_name,
-            ).await.map_err(|e| {
-                tracing::error!("Failed to add download: {}", e);
-                StatusCode::INTERNAL_SERVER_ERROR
-            })?;
+                tmdb_id,
+                season,
+                episode,
+            )).await?;
+            invalidate_listing(&state);
             
             return Ok(Json(serde_json::json!({
                 "status": true,
@@ -278,16 +416,148 @@ async fn handle_add_file(
     Err(StatusCode::BAD_REQUEST)
 }
 
-/// Extract metadata value from NZB XML
-fn extract_nzb_metadata(content: &str, meta_type: &str) -> Option<String> {
-    let tag_start = format!(r#"<meta type="{}">"#, meta_type);
-    if let Some(start) = content.find(&tag_start) {
-        let after_tag = &content[start + tag_start.len()..];
-        if let Some(end) = after_tag.find("</meta>") {
-            return Some(after_tag[..end].to_string());
+/// Resolve TMDB metadata and batch for an uploaded NZB, then queue it
+async fn add_nzb_download(
+    state: Arc<AppState>,
+    fshare_url: String,
+    nzb_category: String,
+    tmdb_id: Option<String>,
+    season: Option<u32>,
+    episode: Option<u32>,
+) -> anyhow::Result<DownloadTask> {
+    // Build TMDB metadata if available
+    let tmdb_meta = if let (Some(id), Some(s), Some(e)) = (tmdb_id.clone(), season, episode) {
+        // Parse tmdb_id as i64
+        let tmdb_id_i64 = id.parse::<i64>().ok();
+        
+        // Fetch series title AND release year from TMDB for proper folder/filename organization
+        let (title, year) = if let Some(tmdb_id_val) = &tmdb_id {
+            crate::api::indexer::fetch_tmdb_title_and_year(tmdb_id_val, "tv").await
+        } else {
+            (None, None)
+        };
+        
+        tracing::info!("SABnzbd: Fetched TMDB title: {:?}, year: {:?}", title, year);
+        
+        Some(crate::downloader::TmdbDownloadMetadata {
+            tmdb_id: tmdb_id_i64,
+            media_type: Some("tv".to_string()),
+            title, // Use fetched title for proper folder structure
+            year,  // Use fetched year for consistent filename format
+            collection_name: None,
+            season: Some(s as i32),
+            episode: Some(e as i32),
+        })
+    } else {
+        None
+    };
+    
+    // Auto-batch: TV episodes should always be in a batch (same logic as downloads API)
+    let (batch_id, batch_name) = if let Some(ref meta) = tmdb_meta {
+        if meta.media_type.as_deref() == Some("tv") && meta.season.is_some() {
+            let auto_batch_name = format!(
+                "{} S{:02}",
+                meta.title.as_deref().unwrap_or("Unknown Show"),
+                meta.season.unwrap()
+            );
+            
+            let existing_batch_id = state.db
+                .get_batch_id_by_name_async(&auto_batch_name)
+                .await
+                .ok()
+                .flatten();
+            
+            let auto_batch_id = if let Some(existing_id) = existing_batch_id {
+                tracing::info!("SABnzbd: Reusing existing batch: {} ({})", auto_batch_name, existing_id);
+                existing_id
+            } else {
+                let new_id = uuid::Uuid::new_v4().to_string();
+                tracing::info!("SABnzbd: Creating new batch: {} ({})", auto_batch_name, new_id);
+                new_id
+            };
+            
+            (Some(auto_batch_id), Some(auto_batch_name))
+        } else {
+            (None, None)
+        }
+    } else {
+        (None, None)
+    };
+    
+    // Add to download queue
+    // Pass None for filename to let orchestrator fetch real filename from Fshare API
+    state.download_orchestrator.add_download_with_metadata(
+        fshare_url,
+        None, // Let orchestrator fetch real filename from Fshare API
+        "fshare".to_string(),
+        nzb_category,
+        tmdb_meta,
+        batch_id,
+        batch_name,
+    ).await
+}
+
+/// Run an add on its own task so it finishes even if the caller disconnects,
+/// and wait for its result.
+///
+/// Sonarr/Radarr give up on slow SABnzbd calls and retry. Adds involve Fshare
+/// and TMDB round-trips; spawning them means a dropped connection can't
+/// abandon one half-way. This does not shorten the response: *arr tracks the
+/// download by the returned `nzo_id`, which is only known once the add has
+/// resolved duplicates against existing tasks.
+async fn run_to_completion<F>(job: F) -> Result<DownloadTask, StatusCode>
+where
+    F: std::future::Future<Output = anyhow::Result<DownloadTask>> + Send + 'static,
+{
+    match tokio::spawn(job).await {
+        Ok(Ok(task)) => Ok(task),
+        Ok(Err(e)) => {
+            tracing::error!("Failed to add download: {}", e);
+            Err(StatusCode::INTERNAL_SERVER_ERROR)
+        }
+        Err(e) => {
+            tracing::error!("Add download job failed: {}", e);
+            Err(StatusCode::INTERNAL_SERVER_ERROR)
         }
     }
-    None
+}
+
+/// Read an uploaded NZB only up to the end of its `<head>`, where all the
+/// `<meta>` tags live. The segment list after it can be large and is never
+/// buffered. Files without a `</head>` are read whole.
+async fn read_nzb_head(
+    field: &mut axum::extract::multipart::Field<'_>,
+) -> Result<Vec<u8>, axum::extract::multipart::MultipartError> {
+    const HEAD_END: &[u8] = b"</head>";
+    let mut buf = Vec::new();
+    while let Some(chunk) = field.chunk().await? {
+        // Re-check the tail of the previous chunk in case the tag was split
+        let search_from = buf.len().saturating_sub(HEAD_END.len() - 1);
+        buf.extend_from_slice(&chunk);
+        if let Some(pos) = buf[search_from..].windows(HEAD_END.len()).position(|w| w == HEAD_END) {
+            buf.truncate(search_from + pos + HEAD_END.len());
+            break;
+        }
+    }
+    Ok(buf)
+}
+
+/// Collect every `<meta type="...">value</meta>` tag from NZB XML in one pass.
+/// The first occurrence of a type wins.
+fn parse_nzb_metadata(content: &str) -> HashMap<&str, &str> {
+    const OPEN: &str = r#"<meta type=""#;
+    let mut metadata = HashMap::new();
+    let mut rest = content;
+    while let Some(start) = rest.find(OPEN) {
+        rest = &rest[start + OPEN.len()..];
+        let Some(type_end) = rest.find("\">") else { break };
+        let meta_type = &rest[..type_end];
+        rest = &rest[type_end + 2..];
+        let Some(value_end) = rest.find("</meta>") else { break };
+        metadata.entry(meta_type).or_insert(&rest[..value_end]);
+        rest = &rest[value_end..];
+    }
+    metadata
 }
 
 /// Add URL to download queue
@@ -301,12 +571,16 @@ async fn handle_add_url(
     
     tracing::info!("SABnzbd: Adding download - URL: {}, filename: {}", url, filename);
     
-    let task = state.download_orchestrator.add_download(
-        url,
-        filename,
-        "fshare".to_string(),
-        category,
-    ).await.map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?;
+    let orchestrator = state.download_orchestrator.clone();
+    let task = run_to_completion(async move {
+        orchestrator.add_download(
+            url,
+            filename,
+            "fshare".to_string(),
+            category,
+        ).await
+    }).await?;
+    invalidate_listing(&state);
     
     Ok(Json(serde_json::json!({
         "status": true,
@@ -315,107 +589,51 @@ async fn handle_add_url(
 }
 
 /// Get queue status
-async fn handle_queue(state: Arc<AppState>) -> Result<Json<serde_json::Value>, StatusCode> {
-    let tasks = state.download_orchestrator.task_manager().get_tasks().await;
-    
-    let mut total_speed = 0.0;
-    let mut total_size = 0u64;
-    let mut total_left = 0u64;
-    
-    let slots: Vec<SabQueueSlot> = tasks.iter()
-        .filter(|t| matches!(t.state, 
+async fn handle_queue(state: Arc<AppState>) -> Result<axum::response::Response, StatusCode> {
+    let tasks = state.download_orchestrator.task_manager()
+        .get_tasks_matching(|t| matches!(t.state, 
             DownloadState::Queued | 
             DownloadState::Starting | 
             DownloadState::Downloading |
             DownloadState::Waiting
         ))
-        .map(|t| {
-            total_speed += t.speed as f64;
-            total_size += t.size;
-            let downloaded = ((t.progress as f64) / 100.0 * t.size as f64) as u64;
-            let left = t.size.saturating_sub(downloaded);
-            total_left += left;
-            
-            let speed = t.speed as f64;
-            let eta = if speed > 0.0 {
-                format!("{}s", (left as f64 / speed) as u64)
-            } else {
-                "Unknown".to_string()
-            };
-            
-            SabQueueSlot {
-                nzo_id: t.id.to_string(),
-                filename: t.filename.clone(),
-                percentage: t.progress as u32,
-                mb: format!("{:.2}", t.size as f64 / 1_048_576.0),
-                mbleft: format!("{:.2}", left as f64 / 1_048_576.0),
-                status: format!("{:?}", t.state),
-                timeleft: eta,
-            }
-        })
-        .collect();
+        .await;
+    
+    let (slots, totals) = build_queue_slots(tasks.iter());
 
-    Ok(Json(serde_json::json!({
-        "queue": {
-            "paused": false,
-            "status": if slots.is_empty() { "Idle" } else { "Downloading" },
-            "noofslots": slots.len(),
-            "slots": slots,
-            "speed": format!("{:.2} MB/s", total_speed / 1_048_576.0),
-            "size": format!("{:.2} MB", total_size as f64 / 1_048_576.0),
-            "sizeleft": format!("{:.2} MB", total_left as f64 / 1_048_576.0),
-        }
-    })))
+    // Serialized here because the slots borrow from `tasks`
+    Ok(Json(SabQueueResponse {
+        queue: SabQueueBody {
+            paused: false,
+            status: if slots.is_empty() { "Idle" } else { "Downloading" },
+            noofslots: slots.len(),
+            slots,
+            speed: totals.speed(),
+            size: totals.size(),
+            sizeleft: totals.sizeleft(),
+        },
+    }).into_response())
 }
 
 /// Get full status (flattened queue response for *arr compatibility)
-async fn handle_fullstatus(state: Arc<AppState>) -> Result<Json<serde_json::Value>, StatusCode> {
-    let tasks = state.download_orchestrator.task_manager().get_tasks().await;
-    
-    let mut total_speed = 0.0;
-    let mut total_size = 0u64;
-    let mut total_left = 0u64;
+async fn handle_fullstatus(state: Arc<AppState>) -> Result<axum::response::Response, StatusCode> {
+    let tasks = state.download_orchestrator.task_manager()
+        .get_tasks_matching(|t| matches!(t.state, DownloadState::Downloading | DownloadState::Queued))
+        .await;
     
-    let slots: Vec<SabQueueSlot> = tasks
-        .iter()
-        .filter(|t| matches!(t.state, crate::downloader::DownloadState::Downloading | crate::downloader::DownloadState::Queued))
-        .map(|t| {
-            total_speed += t.speed as f64;
-            total_size += t.size;
-            let downloaded = ((t.progress as f64) / 100.0 * t.size as f64) as u64;
-            let left = t.size.saturating_sub(downloaded);
-            total_left += left;
-            
-            let speed = t.speed as f64;
-            let eta = if speed > 0.0 {
-                format!("{}s", (left as f64 / speed) as u64)
-            } else {
-                "Unknown".to_string()
-            };
-            
-            SabQueueSlot {
-                nzo_id: t.id.to_string(),
-                filename: t.filename.clone(),
-                percentage: t.progress as u32,
-                mb: format!("{:.2}", t.size as f64 / 1_048_576.0),
-                mbleft: format!("{:.2}", left as f64 / 1_048_576.0),
-                status: format!("{:?}", t.state),
-                timeleft: eta,
-            }
-        })
-        .collect();
+    let (slots, totals) = build_queue_slots(tasks.iter());
 
-    Ok(Json(serde_json::json!({
-        "status": {
-            "state": if slots.is_empty() { "Idle" } else { "Downloading" },
-            "paused": false,
-            "noofslots": slots.len(),
-            "slots": slots,
-            "speed": format!("{:.2} MB/s", total_speed / 1_048_576.0),
-            "size": format!("{:.2} MB", total_size as f64 / 1_048_576.0),
-            "sizeleft": format!("{:.2} MB", total_left as f64 / 1_048_576.0),
-        }
-    })))
+    Ok(Json(SabFullStatusResponse {
+        status: SabFullStatusBody {
+            state: if slots.is_empty() { "Idle" } else { "Downloading" },
+            paused: false,
+            noofslots: slots.len(),
+            slots,
+            speed: totals.speed(),
+            size: totals.size(),
+            sizeleft: totals.sizeleft(),
+        },
+    }).into_response())
 }
 
 /// Get history
@@ -423,15 +641,16 @@ async fn handle_fullstatus(state: Arc<AppState>) -> Result<Json<serde_json::Valu
 /// Returns completed/failed downloads for Sonarr/Radarr to detect and import.
 /// Uses TMDB title for the `name` field so *arr can match to series/movies in its library.
 /// Only returns items where the file actually exists on disk.
-async fn handle_history(state: Arc<AppState>) -> Result<Json<serde_json::Value>, StatusCode> {
-    let tasks = state.download_orchestrator.task_manager().get_tasks().await;
-    
-    let slots: Vec<SabHistorySlot> = tasks.iter()
-        .filter(|t| matches!(t.state, 
+async fn handle_history(state: Arc<AppState>) -> Result<Json<SabHistoryResponse>, StatusCode> {
+    let tasks = state.download_orchestrator.task_manager()
+        .get_tasks_matching(|t| matches!(t.state, 
             DownloadState::Completed | 
             DownloadState::Failed |
             DownloadState::Cancelled
         ))
+        .await;
+    
+    let slots: Vec<SabHistorySlot> = tasks.iter()
         .filter_map(|t| {
             let status = match t.state {
                 DownloadState::Completed => "Completed",
@@ -533,102 +752,93 @@ async fn handle_history(state: Arc<AppState>) -> Result<Json<serde_json::Value>,
         })
         .collect();
     
-    Ok(Json(serde_json::json!({
-        "history": {
-            "slots": slots
-        }
-    })))
-}
-
-/// Get version
-async fn handle_version() -> Result<Json<serde_json::Value>, StatusCode> {
-    Ok(Json(serde_json::json!({
-        "version": "3.5.0"
-    })))
-}
-
-/// Get config (for *arr compatibility testing)
-/// 
-/// Sonarr/Radarr use complete_dir + category dir to determine where downloads land.
-/// Our downloads go directly into series/movie-named folders under /data/downloads/,
-/// so category dirs must be empty to avoid Sonarr looking in /data/downloads/TV/ etc.
-async fn handle_get_config() -> Result<Json<serde_json::Value>, StatusCode> {
-    Ok(Json(serde_json::json!({
-        "config": {
-            "version": "3.5.0",
-            "paused": false,
-            "pause_int": "0",
-            "download_dir": "/data/downloads/incomplete",
-            "complete_dir": "/data/downloads",
-            "nzb_backup_dir": "/appData/nzb_backup",
-            "script_dir": "/appData/scripts",
-            "categories": [
-                {
-                    "name": "tv",
-                    "dir": "",
-                    "newzbin": "",
-                    "priority": 0
-                },
-                {
-                    "name": "movies",
-                    "dir": "",
-                    "newzbin": "",
-                    "priority": 0
-                },
-                {
-                    "name": "*",
-                    "dir": "",
-                    "newzbin": "",
-                    "priority": 0
-                }
-            ],
-            "misc": {
-                "queue_complete": "",
-                "refresh_rate": 2,
-                "bandwidth_limit": ""
-            }
-        }
-    })))
+    Ok(Json(SabHistoryResponse {
+        history: SabHistoryBody { slots },
+    }))
 }
 
 /// Pause a download
 async fn handle_pause(
     state: Arc<AppState>,
     params: SabParams,
-) -> Result<Json<serde_json::Value>, StatusCode> {
+) -> axum::response::Response {
     if let Some(nzo_id) = params.nzo_id {
         if let Ok(uuid) = uuid::Uuid::parse_str(&nzo_id) {
-            let _ = state.download_orchestrator.task_manager().pause_task(uuid).await;
+            if state.download_orchestrator.task_manager().pause_task(uuid).await.is_some() {
+                invalidate_listing(&state);
+            }
         }
     }
 
-    Ok(Json(serde_json::json!({ "status": true })))
+    json_body(STATUS_OK_JSON)
 }
 
 /// Resume a download
 async fn handle_resume(
     state: Arc<AppState>,
     params: SabParams,
-) -> Result<Json<serde_json::Value>, StatusCode> {
+) -> axum::response::Response {
     if let Some(nzo_id) = params.nzo_id {
         if let Ok(uuid) = uuid::Uuid::parse_str(&nzo_id) {
-            let _ = state.download_orchestrator.task_manager().resume_task(uuid).await;
+            if state.download_orchestrator.task_manager().resume_task(uuid).await.is_some() {
+                invalidate_listing(&state);
+            }
         }
     }
 
-    Ok(Json(serde_json::json!({ "status": true })))
+    json_body(STATUS_OK_JSON)
 }
 
 /// Delete a download
 async fn handle_delete(
     state: Arc<AppState>,
     params: SabParams,
-) -> Result<Json<serde_json::Value>, StatusCode> {
+) -> axum::response::Response {
     if let Some(nzo_id) = params.nzo_id {
         if let Ok(uuid) = uuid::Uuid::parse_str(&nzo_id) {
-            let _ = state.download_orchestrator.task_manager().delete_task(uuid).await;
+            if state.download_orchestrator.task_manager().delete_task(uuid).await {
+                invalidate_listing(&state);
+            }
         }
     }
 
-    Ok(Json(serde_json::json!({ "status": true })))
+    json_body(STATUS_OK_JSON)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_queue_totals_serialize_as_labeled_megabytes() {
+        let totals = QueueTotals { speed: 3_355_443.2, size: 13_107_200, left: 0 };
+        assert_eq!(serde_json::to_string(&totals.speed()).unwrap(), r#""3.20 MB/s""#);
+        assert_eq!(serde_json::to_string(&totals.size()).unwrap(), r#""12.50 MB""#);
+        assert_eq!(serde_json::to_string(&totals.sizeleft()).unwrap(), r#""0.00 MB""#);
+    }
+
+    #[test]
+    fn test_parse_nzb_metadata() {
+        let nzb = r#"<nzb><head>
+            <meta type="fshare_url">https://www.fshare.vn/file/ABC123</meta>
+            <meta type="tmdb_id">1399</meta>
+            <meta type="season">1</meta>
+            <meta type="season">2</meta>
+        </head></nzb>"#;
+        let metadata = parse_nzb_metadata(nzb);
+        assert_eq!(metadata.get("fshare_url"), Some(&"https://www.fshare.vn/file/ABC123"));
+        assert_eq!(metadata.get("tmdb_id"), Some(&"1399"));
+        assert_eq!(metadata.get("season"), Some(&"1"));
+        assert_eq!(metadata.get("episode"), None);
+    }
+
+    #[test]
+    fn test_constant_responses_are_valid_json() {
+        for body in [VERSION_JSON, STATUS_OK_JSON, UNKNOWN_MODE_JSON, ADDFILE_REQUIRES_POST_JSON] {
+            assert!(serde_json::from_str::<serde_json::Value>(body).is_ok(), "{}", body);
+        }
+        let config: serde_json::Value = serde_json::from_str(config_json()).unwrap();
+        assert_eq!(config["config"]["complete_dir"], "/data/downloads");
+        assert_eq!(config["config"]["categories"].as_array().map(Vec::len), Some(3));
+    }
 }
@@ -116,6 +116,8 @@ async fn enhanced_search(
     match resp {
         Ok(r) => {
             if let Ok(data) = r.json::<serde_json::Value>().await {
+                // The query's keywords are the same for every result
+                let query_keyword_count = get_title_keywords(&params.q).len();
                 let mut results: Vec<SearchResult> = data["data"].as_array().map(|arr| {
                     arr.iter().map(|item| {
                         let original_filename = item["name"].as_str().unwrap_or("Unknown").to_string();
@@ -126,8 +128,7 @@ async fn enhanced_search(
                         let parsed = smart_parse(&original_filename);
                         let sim_res = calculate_unified_similarity(&params.q, &original_filename, &[]);
                         
-                        let keywords = get_title_keywords(&params.q);
-                        let matched_count = (keywords.len() as f32 * sim_res.score).round() as i32;
+                        let matched_count = (query_keyword_count as f32 * sim_res.score).round() as i32;
                         
                         // Score = relevance + quality (total_score handles resolution/source/HDR/codec/vietsub)
                         let relevance = matched_count * 10 + (sim_res.score * 50.0) as i32;
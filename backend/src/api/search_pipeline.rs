@@ -7,6 +7,8 @@ use moka::future::Cache;
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
+use std::collections::HashSet;
+use std::sync::OnceLock;
 use tracing::{info, warn};
 
 /// Allowed media file extensions (lowercase, without dot)
@@ -19,9 +21,12 @@ pub const MEDIA_EXTENSIONS: &[&str] = &[
 /// Check if a filename has a media file extension.
 /// Returns true for video files and common archives, false for .ts, .iso, .nfo, .srt, .txt, etc.
 pub fn is_media_file(filename: &str) -> bool {
+    static MEDIA_EXTENSION_SET: OnceLock<HashSet<&'static str>> = OnceLock::new();
     if let Some(dot_pos) = filename.rfind('.') {
-        let ext = &filename[dot_pos + 1..].to_lowercase();
-        MEDIA_EXTENSIONS.contains(&ext.as_str())
+        let ext = filename[dot_pos + 1..].to_ascii_lowercase();
+        MEDIA_EXTENSION_SET
+            .get_or_init(|| MEDIA_EXTENSIONS.iter().copied().collect())
+            .contains(ext.as_str())
     } else {
         // No extension — assume it could be media (folder links, etc.)
         true
@@ -121,7 +126,7 @@ impl SearchPipeline {
     /// Deduplicate results by fcode
     #[allow(dead_code)]
     pub fn deduplicate_by_fcode(results: Vec<RawFshareResult>) -> Vec<RawFshareResult> {
-        let mut seen = std::collections::HashSet::new();
+        let mut seen = HashSet::new();
         results.into_iter()
             .filter(|r| {
                 let pure_fcode = r.fcode.split('?').next().unwrap_or(&r.fcode);
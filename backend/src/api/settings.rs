@@ -6,10 +6,12 @@ use axum::{
     routing::{get, put, post},
     Router,
     Json,
+    body::Bytes,
     extract::State,
-    http::StatusCode,
+    http::{header, StatusCode},
+    response::{IntoResponse, Response},
 };
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use serde::{Deserialize, Serialize};
 use crate::AppState;
 
@@ -101,12 +103,23 @@ struct UpdateSettingsRequest {
 // ============================================================================
 
 /// GET /api/settings - Get all settings
+///
+/// `AppState.config` is loaded once at startup and never replaced, so the
+/// masked projection is built and serialized on the first call only.
 async fn get_settings(
     State(state): State<Arc<AppState>>,
-) -> Json<SettingsResponse> {
-    let config = &state.config;
-    
-    Json(SettingsResponse {
+) -> Response {
+    static SETTINGS_JSON: OnceLock<Bytes> = OnceLock::new();
+    let body = SETTINGS_JSON.get_or_init(|| {
+        serde_json::to_vec(&settings_response(&state.config))
+            .map(Bytes::from)
+            .unwrap_or_default()
+    });
+    ([(header::CONTENT_TYPE, "application/json")], body.clone()).into_response()
+}
+
+fn settings_response(config: &crate::config::Config) -> SettingsResponse {
+    SettingsResponse {
         server: ServerSettings {
             host: config.server.host.clone(),
             port: config.server.port,
@@ -128,7 +141,7 @@ async fn get_settings(
             api_key: mask_api_key(&r.api_key),
             auto_import: r.auto_import,
         }),
-    })
+    }
 }
 
 /// PUT /api/settings - Update settings
@@ -246,8 +259,10 @@ async fn update_sonarr_settings(
     match crate::config::save_config(&config) {
         Ok(_) => {
             // Also save to database so GET endpoints can read them back
-            let _ = state.db.save_setting("sonarr_url", &payload.url);
-            let _ = state.db.save_setting("sonarr_api_key", &payload.api_key);
+            let _ = state.db.save_settings(&[
+                ("sonarr_url", payload.url.as_str()),
+                ("sonarr_api_key", payload.api_key.as_str()),
+            ]);
             
             // Reload arr_client dynamically (no restart needed!)
             state.download_orchestrator.reload_arr_client(
@@ -315,8 +330,10 @@ async fn update_radarr_settings(
     match crate::config::save_config(&config) {
         Ok(_) => {
             // Also save to database so GET endpoints can read them back
-            let _ = state.db.save_setting("radarr_url", &payload.url);
-            let _ = state.db.save_setting("radarr_api_key", &payload.api_key);
+            let _ = state.db.save_settings(&[
+                ("radarr_url", payload.url.as_str()),
+                ("radarr_api_key", payload.api_key.as_str()),
+            ]);
             
             // Reload arr_client dynamically (no restart needed!)
             state.download_orchestrator.reload_arr_client(
@@ -373,6 +390,7 @@ async fn update_indexer_settings(
         });
     }
     
+    crate::api::auth::invalidate_api_key(&state);
     tracing::info!("Indexer settings updated: API key saved to database");
     
     Json(ActionResponse {
@@ -385,8 +403,8 @@ async fn update_indexer_settings(
 async fn generate_api_key() -> Json<GenerateKeyResponse> {
     use uuid::Uuid;
     
-    // Generate a secure random API key
-    let api_key = format!("flasharr_{}", Uuid::new_v4().to_string().replace("-", ""));
+    // Generate a secure random API key (`simple()` formats without hyphens directly)
+    let api_key = format!("flasharr_{}", Uuid::new_v4().simple());
     
     Json(GenerateKeyResponse {
         api_key,
@@ -16,6 +16,16 @@ static HTTP_CLIENT: Lazy<reqwest::Client> = Lazy::new(|| {
         .expect("Failed to create HTTP client")
 });
 
+/// Shared client for the Fshare web-login fallback (no redirects, so the
+/// login response's cookies can be inspected)
+static WEB_LOGIN_CLIENT: Lazy<reqwest::Client> = Lazy::new(|| {
+    reqwest::Client::builder()
+        .redirect(reqwest::redirect::Policy::none())
+        .timeout(std::time::Duration::from_secs(15))
+        .build()
+        .unwrap_or_else(|_| reqwest::Client::new())
+});
+
 // ============================================================================
 // Response Types
 // ============================================================================
@@ -161,11 +171,7 @@ pub async fn setup_fshare(
     // Fallback: Web form login via www.fshare.vn/site/login
     tracing::info!("[SETUP] Attempting web form login for FShare credentials validation");
     
-    let web_client = reqwest::Client::builder()
-        .redirect(reqwest::redirect::Policy::none())
-        .timeout(std::time::Duration::from_secs(15))
-        .build()
-        .unwrap_or_else(|_| reqwest::Client::new());
+    let web_client = &*WEB_LOGIN_CLIENT;
     
     // Step 1: GET login page for CSRF token
     let login_page = match web_client
@@ -422,10 +428,11 @@ pub async fn get_indexer_key(State(state): State<Arc<AppState>>) -> Json<Indexer
     let api_key = state.db.get_indexer_api_key()
         .unwrap_or_else(|_| {
             // Generate new key using UUID
-            let key = uuid::Uuid::new_v4().to_string().replace("-", "");
+            let key = uuid::Uuid::new_v4().simple().to_string();
             
             // Save to database
             let _ = state.db.save_indexer_api_key(&key);
+            crate::api::auth::invalidate_api_key(&state);
             key
         });
     
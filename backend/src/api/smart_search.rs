@@ -9,8 +9,8 @@ use crate::utils::title_matcher::{
     calculate_unified_similarity, group_by_quality, SmartSearchResult, QualityGroup,
     extract_core_title, normalize_vietnamese, detect_badges
 };
-use crate::utils::unified_scorer::{calculate_match_score, is_valid_match};
-use crate::utils::smart_tokenizer::smart_parse;
+use crate::utils::unified_scorer::{calculate_match_scores, is_valid_match};
+use crate::utils::smart_tokenizer::{smart_parse, SmartParsedMedia};
 use tracing::info;
 use regex::Regex;
 use std::sync::Arc;
@@ -238,25 +238,27 @@ pub async fn handle_movie_search(
 
     // 4. PARSE AND MAP TOP 100
     let mut valid_results = Vec::new();
-    static RE_YEAR: OnceLock<Regex> = OnceLock::new();
-    let _year_re = RE_YEAR.get_or_init(|| Regex::new(r"\b(19|20)\d{2}\b").unwrap());
 
-    for r in target_results {
-        let parsed = smart_parse(&r.name);
+    let parsed_results = parse_names_parallel(&target_results).await;
+
+    // Use unified scorer for primary match (movies: 70% title + 20% year), scored as one batch
+    let candidates: Vec<(&str, Option<u32>)> = target_results
+        .iter()
+        .zip(&parsed_results)
+        .map(|(r, parsed)| (r.name.as_str(), parsed.year))
+        .collect();
+    let primary_scores = calculate_match_scores(
+        &official_name,
+        &candidates,
+        year_str.as_ref().and_then(|y| y.parse::<u32>().ok()),
+        &aliases,
+        false, // is_tv_series = false for movies
+    );
 
+    for ((r, parsed), primary_score) in target_results.into_iter().zip(parsed_results).zip(primary_scores) {
         let final_id = base_tmdb_id;
         let final_poster = base_poster.clone();
         
-        // Use unified scorer for primary match (movies: 70% title + 20% year)
-        let primary_score = calculate_match_score(
-            &official_name,
-            &r.name,
-            parsed.year,
-            year_str.as_ref().and_then(|y| y.parse::<u32>().ok()),
-            &aliases,
-            false, // is_tv_series = false for movies
-        );
-        
         let best_score = primary_score;
 
         // FILTER: Use unified scorer's validation
@@ -308,25 +310,7 @@ pub async fn handle_movie_search(
     }
 
     // PHASE 2.1: Sort by match_type first (alias > exact > fuzzy), then by quality
-    valid_results.sort_by(|a, b| {
-        let a_priority = match a.match_type.as_str() {
-            "alias" => 0,
-            "exact" => 1,
-            "fuzzy" | "keyword_overlap" => 2,
-            _ => 3,
-        };
-        let b_priority = match b.match_type.as_str() {
-            "alias" => 0,
-            "exact" => 1,
-            "fuzzy" | "keyword_overlap" => 2,
-            _ => 3,
-        };
-        
-        match a_priority.cmp(&b_priority) {
-            std::cmp::Ordering::Equal => b.total_score.cmp(&a.total_score),
-            other => other,
-        }
-    });
+    valid_results.sort_by_key(|r| (match_type_priority(&r.match_type, false), std::cmp::Reverse(r.total_score)));
 
     let groups = group_by_quality(valid_results);
     info!("Total Optimized Smart Search took: {:?}", start_time.elapsed());
@@ -845,14 +829,15 @@ pub async fn handle_tv_search(
     // 4. PARSE AND EVALUATE
     let phase4_start = std::time::Instant::now();
     let mut valid_results = Vec::new();
+    // Season/episode parsed for each accepted file, reused when grouping below
+    let mut parsed_se: std::collections::HashMap<String, (Option<u32>, Option<u32>)> = std::collections::HashMap::new();
     
     info!("Total files to evaluate: {}", target_results.len());
     let vn_files: Vec<_> = target_results.iter().filter(|r| r.name.contains("Bộ Bộ")).map(|r| &r.name).collect();
     info!("Vietnamese files in results: {} - {:?}", vn_files.len(), vn_files);
 
-    for r in target_results {
-        let parsed = smart_parse(&r.name);
-
+    let parsed_results = parse_names_parallel(&target_results).await;
+    for (r, parsed) in target_results.into_iter().zip(parsed_results) {
         // Version Filtering: Strict Year Match for TV originals vs remakes
         if let Some(ref y_req) = year_str {
             if let Some(file_year) = parsed.year {
@@ -910,6 +895,7 @@ pub async fn handle_tv_search(
         
         // PHASE 3: Detect badges
         let (vietdub, vietsub, hdr, dolby_vision) = detect_badges(&r.name);
+        parsed_se.insert(r.name.clone(), (parsed.season, parsed.episode));
         
         valid_results.push(SmartSearchResult {
             name: r.name.clone(),
@@ -951,38 +937,16 @@ pub async fn handle_tv_search(
 
     // PHASE 2.1: Sort by match_type first (alias > exact > fuzzy), then by quality
     // This ensures Vietnamese files (alias matches) appear first
-    valid_results.sort_by(|a, b| {
-        // Prioritize alias matches (Vietnamese files)
-        let a_priority = match a.match_type.as_str() {
-            "alias" => 0,      // Highest priority
-            "exact" => 1,
-            "fuzzy" | "keyword_overlap" | "tv_match" => 2,
-            _ => 3,
-        };
-        let b_priority = match b.match_type.as_str() {
-            "alias" => 0,
-            "exact" => 1,
-            "fuzzy" | "keyword_overlap" | "tv_match" => 2,
-            _ => 3,
-        };
-        
-        // First compare by match_type priority
-        match a_priority.cmp(&b_priority) {
-            std::cmp::Ordering::Equal => {
-                // If same match_type, sort by quality score (higher first)
-                b.total_score.cmp(&a.total_score)
-            },
-            other => other,
-        }
-    });
+    valid_results.sort_by_key(|r| (match_type_priority(&r.match_type, true), std::cmp::Reverse(r.total_score)));
 
     // Grouping for TV: Seasons -> Episodes -> Files
-    let mut seasons_map: std::collections::HashMap<u32, std::collections::HashMap<u32, Vec<SmartSearchResult>>> = std::collections::HashMap::new();
+    // Ordered maps, so seasons and episodes come out already sorted
+    let mut seasons_map: std::collections::BTreeMap<u32, std::collections::BTreeMap<u32, Vec<SmartSearchResult>>> = std::collections::BTreeMap::new();
     
     for res in valid_results {
-        let parsed = smart_parse(&res.name);
-        let s = parsed.season.or(season).unwrap_or(1); 
-        let e = parsed.episode.or(episode).unwrap_or(0);
+        let (file_season, file_episode) = parsed_se.get(&res.name).copied().unwrap_or_default();
+        let s = file_season.or(season).unwrap_or(1); 
+        let e = file_episode.or(episode).unwrap_or(0);
         
         seasons_map.entry(s).or_default()
             .entry(e).or_default()
@@ -1051,7 +1015,7 @@ pub async fn handle_tv_search(
         let mut episodes_grouped = Vec::new();
         for (e_num, mut files) in eps_map {
             // Sort files by quality score descending
-            files.sort_by(|a, b| b.total_score.cmp(&a.total_score));
+            files.sort_by_key(|f| std::cmp::Reverse(f.total_score));
             
             let meta = episode_metadata.get(&(s_num, e_num));
 
@@ -1088,7 +1052,6 @@ pub async fn handle_tv_search(
                 files,
             });
         }
-        episodes_grouped.sort_by(|a, b| a.episode_number.cmp(&b.episode_number));
         
         seasons.push(SeasonGroup {
             season: s_num,
@@ -1097,7 +1060,6 @@ pub async fn handle_tv_search(
             episodes_grouped,
         });
     }
-    seasons.sort_by(|a, b| a.season.cmp(&b.season));
 
     info!("Total Optimized TV Smart Search took: {:?}", start_time.elapsed());
 
@@ -1119,6 +1081,48 @@ pub async fn handle_tv_search(
     Json(response).into_response()
 }
 
+/// Sort rank for a result's match type: alias (Vietnamese files) first,
+/// then exact, then fuzzy-style matches. `tv_match` only counts as fuzzy-style
+/// in TV search; movie search keeps ranking it with unknown types.
+fn match_type_priority(match_type: &str, is_tv: bool) -> u8 {
+    match match_type {
+        "alias" => 0,
+        "exact" => 1,
+        "fuzzy" | "keyword_overlap" => 2,
+        "tv_match" if is_tv => 2,
+        _ => 3,
+    }
+}
+
+/// Below this many results, parsing inline is cheaper than the blocking-pool fan-out
+const PARALLEL_PARSE_MIN: usize = 64;
+
+/// Parse result filenames. Large result sets go to the blocking pool, split into
+/// one chunk per core, so they spread across all cores instead of running
+/// serially on the request's runtime worker; small ones are parsed inline.
+async fn parse_names_parallel(results: &[RawFshareResult]) -> Vec<SmartParsedMedia> {
+    if results.len() < PARALLEL_PARSE_MIN {
+        return results.iter().map(|r| smart_parse(&r.name)).collect();
+    }
+
+    let names: Vec<String> = results.iter().map(|r| r.name.clone()).collect();
+    let workers = std::thread::available_parallelism().map_or(1, |n| n.get());
+    let chunk_size = names.len().div_ceil(workers).max(1);
+    let names = Arc::new(names);
+    let tasks = (0..names.len()).step_by(chunk_size).map(|start| {
+        let names = Arc::clone(&names);
+        tokio::task::spawn_blocking(move || {
+            let end = (start + chunk_size).min(names.len());
+            names[start..end].iter().map(|n| smart_parse(n)).collect::<Vec<_>>()
+        })
+    });
+    futures_util::future::join_all(tasks)
+        .await
+        .into_iter()
+        .flat_map(|parsed| parsed.expect("filename parse task panicked"))
+        .collect()
+}
+
 /// Delegate Fshare search to SearchPipeline module (uncached — for snowball/targeted)
 async fn execute_fshare_search(client: &Client, query: &str, limit: usize) -> Vec<RawFshareResult> {
     SearchPipeline::execute_fshare_search(client, query, limit).await
@@ -1331,3 +1335,19 @@ fn build_movie_enrichment_cache(enrichment: MediaEnrichment, fallback_title: &st
         collections,
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_match_type_priority() {
+        assert_eq!(match_type_priority("alias", false), 0);
+        assert_eq!(match_type_priority("exact", false), 1);
+        assert_eq!(match_type_priority("keyword_overlap", false), 2);
+        assert_eq!(match_type_priority("tv_match", true), 2);
+        // Movie search ranks tv_match with unknown match types
+        assert_eq!(match_type_priority("tv_match", false), 3);
+        assert_eq!(match_type_priority("other", true), 3);
+    }
+}
@@ -3,23 +3,84 @@
 //! Engine statistics endpoints.
 
 use axum::{
+    body::Bytes,
     routing::get,
     Router,
-    Json,
     extract::State,
+    http::header,
+    response::{IntoResponse, Response},
 };
 use std::sync::Arc;
+use std::time::Duration;
+use tokio::time::MissedTickBehavior;
 use crate::AppState;
 use crate::downloader::EngineStats;
+use crate::websocket::WsMessage;
 
 pub fn router() -> Router<Arc<AppState>> {
     Router::new()
         .route("/", get(get_stats))
 }
 
+/// Engine stats together with their serialized forms.
+///
+/// Built once per cache refresh so REST pollers and every connected
+/// WebSocket client reuse the same encoded payload.
+pub struct StatsSnapshot {
+    pub stats: EngineStats,
+    /// `EngineStats` as a JSON body for the REST endpoints
+    pub json: Bytes,
+    /// `ENGINE_STATS` WebSocket frame text
+    pub ws_frame: String,
+}
+
+impl StatsSnapshot {
+    fn new(stats: EngineStats) -> Self {
+        let json = serde_json::to_vec(&stats).map(Bytes::from).unwrap_or_default();
+        let ws_frame = serde_json::to_string(&WsMessage::EngineStats { stats: stats.clone() })
+            .unwrap_or_default();
+        Self { stats, json, ws_frame }
+    }
+
+    /// Pre-encoded JSON response for the REST stats endpoints
+    pub fn json_response(&self) -> Response {
+        ([(header::CONTENT_TYPE, "application/json")], self.json.clone()).into_response()
+    }
+}
+
 /// GET /api/stats - Get engine statistics
 async fn get_stats(
     State(state): State<Arc<AppState>>,
-) -> Json<EngineStats> {
-    Json(state.download_orchestrator.task_manager().get_stats().await)
+) -> Response {
+    cached_stats(&state).await.json_response()
+}
+
+/// Engine statistics (with database counts), shared by all pollers for up to 1s.
+/// Concurrent callers within the TTL wait on a single computation.
+pub async fn cached_stats(state: &AppState) -> Arc<StatsSnapshot> {
+    state.stats_cache
+        .get_with((), async {
+            Arc::new(StatsSnapshot::new(state.download_orchestrator.get_stats().await))
+        })
+        .await
+}
+
+/// Keep the stats snapshot warm from a single background task.
+///
+/// Refreshing every 500ms (inside the 1s TTL) means pollers and WebSocket
+/// ticks read a ready snapshot instead of computing one on the request path,
+/// and DB load stays constant however many clients are connected.
+pub async fn refresh_stats_loop(state: Arc<AppState>) {
+    let mut interval = tokio::time::interval(Duration::from_millis(500));
+    interval.set_missed_tick_behavior(MissedTickBehavior::Delay);
+    loop {
+        interval.tick().await;
+        let snapshot = StatsSnapshot::new(state.download_orchestrator.get_stats().await);
+        state.stats_cache.insert((), Arc::new(snapshot)).await;
+    }
+}
+
+/// Drop the cached stats so the next poll reflects a mutation immediately
+pub fn invalidate_stats(state: &AppState) {
+    state.stats_cache.invalidate_all();
 }
@@ -9,7 +9,7 @@ use axum::{
     extract::Query,
 };
 use serde::{Deserialize, Serialize};
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use std::fs;
 use std::path::Path;
 use crate::AppState;
@@ -26,9 +26,9 @@ pub fn router() -> Router<Arc<AppState>> {
 
 #[derive(Serialize)]
 struct VersionResponse {
-    version: String,
+    version: &'static str,
     rust_version: &'static str,
-    build_date: Option<String>,
+    build_date: Option<&'static str>,
 }
 
 #[derive(Serialize)]
@@ -64,22 +64,59 @@ fn default_lines() -> usize {
 // Handlers
 // ============================================================================
 
+/// Application version from the VERSION file, read once per process.
+/// The file is baked into the image, so it can't change while running.
+/// `main` resolves it at startup, so no request ever pays for the read.
+pub fn app_version() -> &'static str {
+    static VERSION: OnceLock<String> = OnceLock::new();
+    VERSION.get_or_init(|| {
+        read_version_file("VERSION")
+            .or_else(|| read_version_file("../VERSION"))
+            .map(|version| version.trim().to_string())
+            .unwrap_or_else(|| env!("CARGO_PKG_VERSION").to_string())
+    })
+}
+
+/// A missing VERSION file is expected (dev builds); anything else is logged
+/// rather than silently falling back to the crate version.
+fn read_version_file(path: &str) -> Option<String> {
+    match fs::read_to_string(path) {
+        Ok(version) => Some(version),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => None,
+        Err(e) => {
+            tracing::warn!("Failed to read {}: {}", path, e);
+            None
+        }
+    }
+}
+
 /// GET /api/system/version - Get version info
 async fn get_version() -> Json<VersionResponse> {
-    // Try to read VERSION file
-    let version = fs::read_to_string("VERSION")
-        .or_else(|_| fs::read_to_string("../VERSION"))
-        .unwrap_or_else(|_| env!("CARGO_PKG_VERSION").to_string())
-        .trim()
-        .to_string();
-    
     Json(VersionResponse {
-        version,
+        version: app_version(),
         rust_version: "1.75+",
-        build_date: option_env!("BUILD_DATE").map(|s| s.to_string()),
+        build_date: option_env!("BUILD_DATE"),
     })
 }
 
+/// Log file locations, in lookup order
+const LOG_PATHS: [&str; 3] = [
+    "data/flasharr.log",
+    "../data/flasharr.log",
+    "flasharr.log",
+];
+
+/// First log file candidate that exists. Remembered once found, since the
+/// logger keeps writing to the same file; until then every call probes again.
+fn log_path() -> Option<&'static str> {
+    static LOG_PATH: OnceLock<&'static str> = OnceLock::new();
+    if let Some(&path) = LOG_PATH.get() {
+        return Some(path);
+    }
+    let path = LOG_PATHS.into_iter().find(|path| Path::new(path).exists())?;
+    Some(*LOG_PATH.get_or_init(|| path))
+}
+
 /// GET /api/system/logs - Get recent log entries
 async fn get_logs(
     Query(params): Query<LogsQuery>,
@@ -87,21 +124,9 @@ async fn get_logs(
     let lines = params.lines.min(1000); // Cap at 1000 lines
     
     // Try to read log file
-    let log_paths = [
-        "data/flasharr.log",
-        "../data/flasharr.log",
-        "flasharr.log",
-    ];
-    
-    let mut log_content = String::new();
-    for path in log_paths {
-        if Path::new(path).exists() {
-            if let Ok(content) = fs::read_to_string(path) {
-                log_content = content;
-                break;
-            }
-        }
-    }
+    let log_content = log_path()
+        .and_then(|path| fs::read_to_string(path).ok())
+        .unwrap_or_default();
     
     // Parse log entries (simple line-based parsing)
     let log_lines: Vec<&str> = log_content.lines().rev().take(lines).collect();
@@ -9,7 +9,7 @@ use axum::{
     extract::{State, Path, Query},
     http::StatusCode,
 };
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use reqwest::Client;
@@ -89,7 +89,15 @@ struct TmdbClient {
     api_key: String,
 }
 
+static SHARED_TMDB_CLIENT: OnceLock<TmdbClient> = OnceLock::new();
+
 impl TmdbClient {
+    /// Process-wide client so every proxy request reuses the same
+    /// connection pool (and TLS sessions) to the TMDB hosts.
+    fn shared() -> &'static Self {
+        SHARED_TMDB_CLIENT.get_or_init(Self::new)
+    }
+
     fn new() -> Self {
         Self {
             client: Client::new(),
@@ -134,7 +142,7 @@ async fn search(
     State(_state): State<Arc<AppState>>,
     Query(params): Query<SearchQuery>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     
     let path = format!("/search/{}", params.media_type);
     let page_str = params.page.to_string();
@@ -153,7 +161,7 @@ async fn discover(
     Path(media_type): Path<String>,
     Query(params): Query<DiscoverQuery>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     
     let path = format!("/discover/{}", media_type);
     let page_str = params.page.to_string();
@@ -188,7 +196,7 @@ async fn movie_details(
     State(_state): State<Arc<AppState>>,
     Path(id): Path<u32>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/movie/{}", id);
     
     let data = client.get(&path, &[
@@ -205,7 +213,7 @@ async fn tv_details(
     State(_state): State<Arc<AppState>>,
     Path(id): Path<u32>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/tv/{}", id);
 
     let mut data = client.get(&path, &[
@@ -267,7 +275,7 @@ async fn collection_details(
     State(_state): State<Arc<AppState>>,
     Path(id): Path<u32>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/collection/{}", id);
     
     let data = client.get(&path, &[]).await?;
@@ -280,7 +288,7 @@ async fn season_details(
     State(_state): State<Arc<AppState>>,
     Path((id, season)): Path<(u32, u32)>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/tv/{}/season/{}", id, season);
     
     let data = client.get(&path, &[]).await?;
@@ -292,7 +300,7 @@ async fn genres(
     State(_state): State<Arc<AppState>>,
     Path(media_type): Path<String>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/genre/{}/list", media_type);
     
     let data = client.get(&path, &[]).await?;
@@ -305,7 +313,7 @@ async fn similar(
     Path((media_type, id)): Path<(String, u32)>,
     Query(params): Query<PaginationQuery>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/{}/{}/similar", media_type, id);
     let page_str = params.page.to_string();
     
@@ -319,7 +327,7 @@ async fn recommendations(
     Path((media_type, id)): Path<(String, u32)>,
     Query(params): Query<PaginationQuery>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/{}/{}/recommendations", media_type, id);
     let page_str = params.page.to_string();
     
@@ -333,7 +341,7 @@ async fn trending(
     Path((media_type, time_window)): Path<(String, String)>,
     Query(params): Query<PaginationQuery>,
 ) -> Result<Json<Value>, StatusCode> {
-    let client = TmdbClient::new();
+    let client = TmdbClient::shared();
     let path = format!("/trending/{}/{}", media_type, time_window);
     let page_str = params.page.to_string();
     
@@ -345,10 +353,9 @@ async fn trending(
 async fn proxy_image(
     Path((size, path)): Path<(String, String)>,
 ) -> Result<axum::response::Response, StatusCode> {
-    let client = Client::new();
     let url = format!("{}/{}/{}", TMDB_IMAGE_BASE, size, path);
     
-    let resp = client.get(&url)
+    let resp = TmdbClient::shared().client.get(&url)
         .send()
         .await
         .map_err(|_| StatusCode::BAD_GATEWAY)?;
@@ -466,16 +473,15 @@ mod tests {
 
     #[test]
     fn test_pagination_query() {
-        let json = r#"{"page": 5}"#;
-        let query: PaginationQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.page, 5);
-    }
-
-    #[test]
-    fn test_pagination_query_default() {
-        let json = r#"{}"#;
-        let query: PaginationQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.page, 1);
+        let cases = [
+            (r#"{"page": 5}"#, 5),
+            (r#"{}"#, 1), // default
+            (r#"{"page": 1000}"#, 1000),
+        ];
+        for (json, page) in cases {
+            let query: PaginationQuery = serde_json::from_str(json).unwrap();
+            assert_eq!(query.page, page, "{}", json);
+        }
     }
 
     // ========================================================================
@@ -496,6 +502,13 @@ mod tests {
     // Integration Tests - TmdbClient
     // ========================================================================
 
+    #[test]
+    fn test_tmdb_client_shared_is_reused() {
+        let first = TmdbClient::shared();
+        let second = TmdbClient::shared();
+        assert!(std::ptr::eq(first, second));
+    }
+
     #[tokio::test]
     async fn test_tmdb_client_get_without_api_key() {
         // API key is hardcoded in TmdbClient::new(), so it's never empty
@@ -532,59 +545,30 @@ mod tests {
     // ========================================================================
 
     #[test]
-    fn test_search_query_special_characters() {
-        let json = r#"{"q": "The Matrix: Reloaded (2003)"}"#;
-        let query: SearchQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.q, "The Matrix: Reloaded (2003)");
-    }
-
-    #[test]
-    fn test_search_query_unicode() {
-        let json = r#"{"q": "千と千尋の神隠し"}"#;
-        let query: SearchQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.q, "千と千尋の神隠し");
-    }
-
-    #[test]
-    fn test_discover_query_negative_vote() {
-        let json = r#"{"vote_average_gte": 0.0}"#;
-        let query: DiscoverQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.vote_average_gte, Some(0.0));
-    }
-
-    #[test]
-    fn test_discover_query_max_vote() {
-        let json = r#"{"vote_average_gte": 10.0}"#;
-        let query: DiscoverQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.vote_average_gte, Some(10.0));
-    }
-
-    #[test]
-    fn test_pagination_large_page() {
-        let json = r#"{"page": 1000}"#;
-        let query: PaginationQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.page, 1000);
-    }
-
-    #[test]
-    fn test_discover_query_old_year() {
-        let json = r#"{"year": 1900}"#;
-        let query: DiscoverQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.year, Some(1900));
-    }
-
-    #[test]
-    fn test_discover_query_future_year() {
-        let json = r#"{"year": 2030}"#;
-        let query: DiscoverQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.year, Some(2030));
+    fn test_search_query_special_text() {
+        for q in ["The Matrix: Reloaded (2003)", "千と千尋の神隠し"] {
+            let json = serde_json::json!({ "q": q }).to_string();
+            let query: SearchQuery = serde_json::from_str(&json).unwrap();
+            assert_eq!(query.q, q);
+        }
     }
 
     #[test]
-    fn test_discover_query_multiple_genres() {
-        let json = r#"{"genre": "28,12,16"}"#;
-        let query: DiscoverQuery = serde_json::from_str(json).unwrap();
-        assert_eq!(query.genre, Some("28,12,16".to_string()));
+    fn test_discover_query_edge_values() {
+        // (json, year, genre, vote_average_gte)
+        let cases = [
+            (r#"{"vote_average_gte": 0.0}"#, None, None, Some(0.0)),
+            (r#"{"vote_average_gte": 10.0}"#, None, None, Some(10.0)),
+            (r#"{"year": 1900}"#, Some(1900), None, None),
+            (r#"{"year": 2030}"#, Some(2030), None, None),
+            (r#"{"genre": "28,12,16"}"#, None, Some("28,12,16"), None),
+        ];
+        for (json, year, genre, vote) in cases {
+            let query: DiscoverQuery = serde_json::from_str(json).unwrap();
+            assert_eq!(query.year, year, "{}", json);
+            assert_eq!(query.genre.as_deref(), genre, "{}", json);
+            assert_eq!(query.vote_average_gte, vote, "{}", json);
+        }
     }
 
     #[test]
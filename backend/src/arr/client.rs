@@ -4,6 +4,7 @@
 //! Triggers automatic imports when downloads complete.
 
 use reqwest::Client;
+use std::sync::OnceLock;
 use serde::{Deserialize, Serialize};
 use crate::config::ArrConfig;
 
@@ -207,8 +208,12 @@ impl ArrClient {
 
 
     /// Test connection to an *arr service (Sonarr or Radarr)
+    ///
+    /// Uses one process-wide client, so repeated tests from the settings and
+    /// setup pages reuse the pooled keep-alive connection to the same host.
     pub async fn test_connection(url: &str, api_key: &str, service_name: &str) -> anyhow::Result<String> {
-        let client = Client::new();
+        static TEST_CLIENT: OnceLock<Client> = OnceLock::new();
+        let client = TEST_CLIENT.get_or_init(Client::new);
         let test_url = format!("{}/api/v3/system/status", url.trim_end_matches('/'));
         
         let response = client
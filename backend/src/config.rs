@@ -3,6 +3,7 @@
 use serde::{Deserialize, Serialize};
 use std::path::PathBuf;
 use std::env;
+use std::sync::OnceLock;
 
 /// Application configuration
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -117,10 +118,18 @@ impl Default for Config {
 
 /// Get the appData directory path
 /// Priority: FLASHARR_APPDATA_DIR env var > ./appData
+///
+/// Resolved once per process; the environment is fixed at startup and the
+/// download paths look this up for every task.
 pub fn get_appdata_dir() -> PathBuf {
-    env::var("FLASHARR_APPDATA_DIR")
-        .map(PathBuf::from)
-        .unwrap_or_else(|_| PathBuf::from("./appData"))
+    static APPDATA_DIR: OnceLock<PathBuf> = OnceLock::new();
+    APPDATA_DIR
+        .get_or_init(|| {
+            env::var("FLASHARR_APPDATA_DIR")
+                .map(PathBuf::from)
+                .unwrap_or_else(|_| PathBuf::from("./appData"))
+        })
+        .clone()
 }
 
 /// Get the config file path with fallback
@@ -2,7 +2,8 @@ use rusqlite::{params, Result, OptionalExtension};
 use std::path::Path;
 use uuid::Uuid;
 use chrono::{DateTime, Utc};
-use std::sync::Arc;
+use std::collections::HashMap;
+use std::sync::{Arc, PoisonError, RwLock};
 use tokio::sync::Notify;
 use tokio_util::sync::CancellationToken;
 use serde::{Deserialize, Serialize};
@@ -13,17 +14,47 @@ use r2d2_sqlite::SqliteConnectionManager;
 
 pub struct Db {
     pool: Pool<SqliteConnectionManager>,
+    /// Write-through copy of the settings table, loaded on first read.
+    /// All settings writes go through `Db`, so it never goes stale.
+    settings_cache: RwLock<Option<HashMap<String, String>>>,
 }
 
 impl Db {
     pub fn new<P: AsRef<Path>>(path: P) -> Result<Self> {
-        let manager = SqliteConnectionManager::file(path);
+        // WAL lets readers run alongside the writer, and synchronous=NORMAL
+        // (safe under WAL) syncs at checkpoints instead of on every commit
+        let manager = SqliteConnectionManager::file(path).with_init(|conn| {
+            conn.execute_batch(
+                "PRAGMA journal_mode = WAL;
+                 PRAGMA synchronous = NORMAL;
+                 PRAGMA busy_timeout = 5000;"
+            )
+        });
+        Self::with_manager(manager)
+    }
+
+    /// Private in-memory database for tests. Every pooled connection shares
+    /// one uniquely named memory DB, so tests skip disk I/O entirely.
+    #[cfg(test)]
+    pub fn in_memory() -> Result<Self> {
+        use rusqlite::OpenFlags;
+        let uri = format!("file:test_{}?mode=memory&cache=shared", Uuid::new_v4().simple());
+        let manager = SqliteConnectionManager::file(uri).with_flags(
+            OpenFlags::SQLITE_OPEN_READ_WRITE
+                | OpenFlags::SQLITE_OPEN_CREATE
+                | OpenFlags::SQLITE_OPEN_URI
+                | OpenFlags::SQLITE_OPEN_SHARED_CACHE,
+        );
+        Self::with_manager(manager)
+    }
+
+    fn with_manager(manager: SqliteConnectionManager) -> Result<Self> {
         let pool = Pool::builder()
             .max_size(5) // 5 concurrent connections
             .build(manager)
             .map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
         
-        let db = Self { pool };
+        let db = Self { pool, settings_cache: RwLock::new(None) };
         db.init()?;
         
         tracing::info!("Database connection pool initialized (max_size: 5)");
@@ -97,15 +128,23 @@ impl Db {
             
             if !rows.is_empty() {
                 tracing::info!("[DB] Backfilling quality metadata for {} downloads", rows.len());
-                let mut update_stmt = conn.prepare(
-                    "UPDATE downloads SET quality = ?1, resolution = ?2 WHERE id = ?3"
-                )?;
-                for (id, filename) in &rows {
-                    let attrs = crate::utils::parser::FilenameParser::extract_quality_attributes(filename);
-                    let quality = attrs.quality_name();
-                    let resolution = attrs.resolution.clone();
-                    let _ = update_stmt.execute(rusqlite::params![quality, resolution, id]);
+                // One transaction for the whole backfill instead of a commit per row,
+                // and each distinct filename (retries share one) is parsed only once
+                let tx = conn.unchecked_transaction()?;
+                {
+                    let mut update_stmt = tx.prepare(
+                        "UPDATE downloads SET quality = ?1, resolution = ?2 WHERE id = ?3"
+                    )?;
+                    let mut parsed: HashMap<&str, (String, Option<String>)> = HashMap::new();
+                    for (id, filename) in &rows {
+                        let (quality, resolution) = &*parsed.entry(filename.as_str()).or_insert_with(|| {
+                            let attrs = crate::utils::parser::FilenameParser::extract_quality_attributes(filename);
+                            (attrs.quality_name(), attrs.resolution)
+                        });
+                        let _ = update_stmt.execute(rusqlite::params![quality, resolution, id]);
+                    }
                 }
+                tx.commit()?;
                 tracing::info!("[DB] Quality backfill complete");
             }
         }
@@ -761,40 +800,45 @@ impl Db {
                 }
             }
             
-            // Step 2: For each batch ID found, fetch ALL remaining items from that batch
-            // that weren't in the initial page
+            // Step 2: Fetch ALL remaining items from the batches found on this page
+            // in a single query (one IN (...) lookup instead of one query per batch)
             if !batch_ids_to_complete.is_empty() {
                 let task_ids_in_page: std::collections::HashSet<uuid::Uuid> = 
                     tasks.iter().map(|t| t.id).collect();
                 
-                for batch_id in &batch_ids_to_complete {
-                    // Get all downloads for this batch
-                    let batch_query = format!(
-                        "SELECT id, url, original_url, filename, destination, state, progress, size, 
-                         downloaded, speed, eta, host, category, priority, segments, retry_count,
-                         created_at, started_at, completed_at, wait_until, error_message, 
-                         batch_id, batch_name, tmdb_id, tmdb_title, tmdb_season, tmdb_episode,
-                         arr_announced, arr_series_id, arr_movie_id, arr_announce_error, fshare_code,
-                         quality, resolution
-                         FROM downloads 
-                         WHERE batch_id = ?1
-                         {}",
-                        if status_filter.is_some() { 
-                            format!("AND state = '{}'", status_filter.as_ref().unwrap()) 
-                        } else { 
-                            String::new() 
-                        }
-                    );
-                    
-                    let mut batch_stmt = conn.prepare(&batch_query)?;
-                    let batch_iter = batch_stmt.query_map(params![batch_id], |row| Self::parse_task_from_row_static(row))?;
-                    
-                    for batch_task in batch_iter {
-                        if let Ok(bt) = batch_task {
-                            // Only add if not already in the page
-                            if !task_ids_in_page.contains(&bt.id) {
-                                tasks.push(bt);
-                            }
+                let placeholders: Vec<String> = (1..=batch_ids_to_complete.len())
+                    .map(|i| format!("?{}", i))
+                    .collect();
+                let batch_query = format!(
+                    "SELECT id, url, original_url, filename, destination, state, progress, size, 
+                     downloaded, speed, eta, host, category, priority, segments, retry_count,
+                     created_at, started_at, completed_at, wait_until, error_message, 
+                     batch_id, batch_name, tmdb_id, tmdb_title, tmdb_season, tmdb_episode,
+                     arr_announced, arr_series_id, arr_movie_id, arr_announce_error, fshare_code,
+                     quality, resolution
+                     FROM downloads 
+                     WHERE batch_id IN ({})
+                     {}
+                     ORDER BY batch_id, created_at",
+                    placeholders.join(", "),
+                    if status_filter.is_some() { 
+                        format!("AND state = '{}'", status_filter.as_ref().unwrap()) 
+                    } else { 
+                        String::new() 
+                    }
+                );
+                
+                let batch_params: Vec<&dyn rusqlite::ToSql> = batch_ids_to_complete.iter()
+                    .map(|id| id as &dyn rusqlite::ToSql)
+                    .collect();
+                let mut batch_stmt = conn.prepare(&batch_query)?;
+                let batch_iter = batch_stmt.query_map(batch_params.as_slice(), |row| Self::parse_task_from_row_static(row))?;
+                
+                for batch_task in batch_iter {
+                    if let Ok(bt) = batch_task {
+                        // Only add if not already in the page
+                        if !task_ids_in_page.contains(&bt.id) {
+                            tasks.push(bt);
                         }
                     }
                 }
@@ -902,7 +946,7 @@ impl Db {
     }
 
     /// Get counts of downloads by status from database
-    pub async fn get_status_counts_async(&self) -> Result<std::collections::HashMap<String, usize>> {
+    pub async fn get_status_counts_async(&self) -> Result<HashMap<String, usize>> {
         let pool = self.pool.clone();
         tokio::task::spawn_blocking(move || {
             let conn = pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
@@ -910,7 +954,7 @@ impl Db {
                 "SELECT state, COUNT(*) as count FROM downloads GROUP BY state"
             )?;
             
-            let mut counts = std::collections::HashMap::new();
+            let mut counts = HashMap::new();
             let rows = stmt.query_map([], |row| {
                 Ok((row.get::<_, String>(0)?, row.get::<_, i64>(1)?))
             })?;
@@ -926,25 +970,37 @@ impl Db {
     }
 
 
-    /// Get counts of downloads by status from database (synchronous version)
-    pub fn get_status_counts(&self) -> Result<std::collections::HashMap<String, usize>> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        let mut stmt = conn.prepare(
-            "SELECT state, COUNT(*) as count FROM downloads GROUP BY state"
-        )?;
-        
-        let mut counts = std::collections::HashMap::new();
-        let rows = stmt.query_map([], |row| {
-            Ok((row.get::<_, String>(0)?, row.get::<_, i64>(1)?))
-        })?;
-        
-        for row in rows {
-            if let Ok((state, count)) = row {
-                counts.insert(state, count as usize);
-            }
-        }
-        
-        Ok(counts)
+    /// Get UI-category status counts aggregated in SQLite (async).
+    ///
+    /// Folds the per-state counts into the filter-dropdown buckets in a single
+    /// row so stats polling doesn't have to build and re-aggregate a HashMap.
+    pub async fn get_db_status_counts_async(&self) -> Result<crate::downloader::stats::DbStatusCounts> {
+        let pool = self.pool.clone();
+        tokio::task::spawn_blocking(move || {
+            let conn = pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
+            conn.query_row(
+                "SELECT COUNT(*),
+                        COALESCE(SUM(state IN ('DOWNLOADING', 'STARTING')), 0),
+                        COALESCE(SUM(state IN ('QUEUED', 'WAITING')), 0),
+                        COALESCE(SUM(state = 'PAUSED'), 0),
+                        COALESCE(SUM(state = 'COMPLETED'), 0),
+                        COALESCE(SUM(state = 'FAILED'), 0),
+                        COALESCE(SUM(state = 'CANCELLED'), 0)
+                 FROM downloads",
+                [],
+                |row| {
+                    Ok(crate::downloader::stats::DbStatusCounts {
+                        all: row.get::<_, i64>(0)? as usize,
+                        downloading: row.get::<_, i64>(1)? as usize,
+                        queued: row.get::<_, i64>(2)? as usize,
+                        paused: row.get::<_, i64>(3)? as usize,
+                        completed: row.get::<_, i64>(4)? as usize,
+                        failed: row.get::<_, i64>(5)? as usize,
+                        cancelled: row.get::<_, i64>(6)? as usize,
+                    })
+                },
+            )
+        }).await.unwrap()
     }
 
     /// Get all tasks with a specific batch_id (async)
@@ -1299,151 +1355,133 @@ impl Db {
 
     /// Save or update a setting
     pub fn save_setting(&self, key: &str, value: &str) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value, updated_at) 
-             VALUES (?1, ?2, strftime('%s', 'now'))",
-            params![key, value],
-        )?;
+        self.save_settings(&[(key, value)])
+    }
+
+    /// Save or update several settings in a single transaction
+    pub fn save_settings(&self, entries: &[(&str, &str)]) -> Result<()> {
+        let mut conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
+        // Commit and write through under the cache lock so concurrent writers
+        // update the cache in the same order as their commits
+        let mut guard = self.settings_cache.write().unwrap_or_else(PoisonError::into_inner);
+        let tx = conn.transaction()?;
+        {
+            let mut stmt = tx.prepare(
+                "INSERT OR REPLACE INTO settings (key, value, updated_at) 
+                 VALUES (?1, ?2, strftime('%s', 'now'))",
+            )?;
+            for (key, value) in entries {
+                stmt.execute(params![key, value])?;
+            }
+        }
+        tx.commit()?;
+
+        if let Some(cache) = guard.as_mut() {
+            for (key, value) in entries {
+                cache.insert(key.to_string(), value.to_string());
+            }
+        }
         Ok(())
     }
 
+    /// Run `f` against the settings cache, loading it from the table on first use.
+    ///
+    /// Lock order is always pool connection first, then cache lock, on both the
+    /// load and write paths, so nobody waits on the pool while holding the lock.
+    fn with_settings_cache<T>(&self, f: impl FnOnce(&HashMap<String, String>) -> T) -> Result<T> {
+        if let Some(cache) = self.settings_cache.read().unwrap_or_else(PoisonError::into_inner).as_ref() {
+            return Ok(f(cache));
+        }
+
+        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
+        let mut guard = self.settings_cache.write().unwrap_or_else(PoisonError::into_inner);
+        if guard.is_none() {
+            // Loaded under the lock so a write committed meanwhile is either
+            // in this read or applied to the cache after it
+            let mut stmt = conn.prepare("SELECT key, value FROM settings")?;
+            let setting_iter = stmt.query_map([], |row| {
+                Ok((row.get::<_, String>(0)?, row.get::<_, String>(1)?))
+            })?;
+            *guard = Some(setting_iter.flatten().collect());
+        }
+        Ok(f(guard.as_ref().expect("settings cache was just loaded")))
+    }
+
     /// Get setting by key
     pub fn get_setting(&self, key: &str) -> Result<Option<String>> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        let mut stmt = conn.prepare("SELECT value FROM settings WHERE key = ?1")?;
-        stmt.query_row(params![key], |row| row.get(0)).optional()
+        self.with_settings_cache(|cache| cache.get(key).cloned())
     }
 
-    /// Get all settings as a HashMap
-    pub fn get_all_settings(&self) -> Result<std::collections::HashMap<String, String>> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        let mut stmt = conn.prepare("SELECT key, value FROM settings")?;
-        let setting_iter = stmt.query_map([], |row| {
-            Ok((row.get::<_, String>(0)?, row.get::<_, String>(1)?))
-        })?;
+    /// Get several settings at once. Keys with no stored value are absent from the map.
+    pub fn get_settings(&self, keys: &[&str]) -> Result<HashMap<String, String>> {
+        self.with_settings_cache(|cache| {
+            keys.iter()
+                .filter_map(|&key| cache.get_key_value(key))
+                .map(|(k, v)| (k.clone(), v.clone()))
+                .collect()
+        })
+    }
 
-        let mut settings = std::collections::HashMap::new();
-        for setting in setting_iter {
-            if let Ok((k, v)) = setting {
-                settings.insert(k, v);
-            }
-        }
-        Ok(settings)
+    /// Get all settings as a HashMap
+    pub fn get_all_settings(&self) -> Result<HashMap<String, String>> {
+        self.with_settings_cache(HashMap::clone)
     }
 
     /// Delete setting by key
     pub fn delete_setting(&self, key: &str) -> Result<()> {
         let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
+        let mut guard = self.settings_cache.write().unwrap_or_else(PoisonError::into_inner);
         conn.execute("DELETE FROM settings WHERE key = ?1", params![key])?;
+        if let Some(cache) = guard.as_mut() {
+            cache.remove(key);
+        }
         Ok(())
     }
     
     /// Check if onboarding is complete
     pub fn is_onboarding_complete(&self) -> Result<bool> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        let result: Option<String> = conn
-            .query_row(
-                "SELECT value FROM settings WHERE key = 'onboarding_complete'",
-                [],
-                |row| row.get(0),
-            )
-            .optional()?;
-        
-        Ok(result.map(|v| v == "true").unwrap_or(false))
+        Ok(self.get_setting("onboarding_complete")?.map(|v| v == "true").unwrap_or(false))
     }
     
     /// Mark onboarding as complete
     pub fn mark_onboarding_complete(&self) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('onboarding_complete', 'true')",
-            [],
-        )?;
-        Ok(())
+        self.save_setting("onboarding_complete", "true")
     }
     
     /// Save Fshare credentials
     pub fn save_fshare_credentials(&self, email: &str, password: &str) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('fshare_email', ?1)",
-            params![email],
-        )?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('fshare_password', ?1)",
-            params![password],
-        )?;
-        Ok(())
+        self.save_settings(&[("fshare_email", email), ("fshare_password", password)])
     }
     
     /// Save download settings
     pub fn save_download_settings(&self, directory: &str, max_concurrent: u32) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('download_directory', ?1)",
-            params![directory],
-        )?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('max_concurrent', ?1)",
-            params![max_concurrent.to_string()],
-        )?;
-        Ok(())
+        self.save_settings(&[
+            ("download_directory", directory),
+            ("max_concurrent", max_concurrent.to_string().as_str()),
+        ])
     }
     
     /// Save Arr (Sonarr/Radarr) configuration
     pub fn save_arr_config(&self, service: &str, url: &str, api_key: &str) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            &format!("INSERT OR REPLACE INTO settings (key, value) VALUES ('{}_url', ?1)", service),
-            params![url],
-        )?;
-        conn.execute(
-            &format!("INSERT OR REPLACE INTO settings (key, value) VALUES ('{}_api_key', ?1)", service),
-            params![api_key],
-        )?;
-        Ok(())
+        self.save_settings(&[
+            (format!("{}_url", service).as_str(), url),
+            (format!("{}_api_key", service).as_str(), api_key),
+        ])
     }
     
     /// Save Jellyfin configuration
     pub fn save_jellyfin_config(&self, url: &str, api_key: &str) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('jellyfin_url', ?1)",
-            params![url],
-        )?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('jellyfin_api_key', ?1)",
-            params![api_key],
-        )?;
-        Ok(())
+        self.save_settings(&[("jellyfin_url", url), ("jellyfin_api_key", api_key)])
     }
     
     /// Get indexer API key (or generate if not exists)
     pub fn get_indexer_api_key(&self) -> Result<String> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        let result: Option<String> = conn
-            .query_row(
-                "SELECT value FROM settings WHERE key = 'indexer_api_key'",
-                [],
-                |row| row.get(0),
-            )
-            .optional()?;
-        
-        match result {
-            Some(key) => Ok(key),
-            None => Err(rusqlite::Error::QueryReturnedNoRows),
-        }
+        self.get_setting("indexer_api_key")?.ok_or(rusqlite::Error::QueryReturnedNoRows)
     }
     
     /// Save indexer API key
     pub fn save_indexer_api_key(&self, api_key: &str) -> Result<()> {
-        let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
-        conn.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('indexer_api_key', ?1)",
-            params![api_key],
-        )?;
-        Ok(())
+        self.save_setting("indexer_api_key", api_key)
     }
 
     // ============================================================================
@@ -1685,7 +1723,7 @@ impl Db {
     }
 
     /// Get download count per media item (for library display)
-    pub fn get_media_download_counts(&self) -> Result<std::collections::HashMap<i64, usize>> {
+    pub fn get_media_download_counts(&self) -> Result<HashMap<i64, usize>> {
         let conn = self.pool.get().map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
         let mut stmt = conn.prepare(
             "SELECT tmdb_id, COUNT(*) FROM downloads WHERE tmdb_id IS NOT NULL GROUP BY tmdb_id"
@@ -1693,7 +1731,7 @@ impl Db {
         let rows = stmt.query_map([], |row| {
             Ok((row.get::<_, i64>(0)?, row.get::<_, i64>(1)?))
         })?;
-        let mut counts = std::collections::HashMap::new();
+        let mut counts = HashMap::new();
         for row in rows {
             if let Ok((id, count)) = row {
                 counts.insert(id, count as usize);
@@ -2149,7 +2187,7 @@ impl Db {
     }
 
     /// Get all existing TMDB mappings as a HashMap for fast lookup
-    pub fn get_all_folder_tmdb_mappings(&self) -> Result<std::collections::HashMap<String, FolderTmdbMapping>> {
+    pub fn get_all_folder_tmdb_mappings(&self) -> Result<HashMap<String, FolderTmdbMapping>> {
         let conn = self.pool.get()
             .map_err(|e| rusqlite::Error::ToSqlConversionFailure(Box::new(e)))?;
         let mut stmt = conn.prepare(
@@ -2163,7 +2201,7 @@ impl Db {
                 poster_path: row.get(3)?,
             })
         })?;
-        let mut map = std::collections::HashMap::new();
+        let mut map = HashMap::new();
         for row in rows {
             if let Ok(m) = row {
                 map.insert(m.linkcode.clone(), m);
@@ -2172,3 +2210,53 @@ impl Db {
         Ok(map)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_settings_cache_write_through() {
+        let db = Db::in_memory().unwrap();
+        assert_eq!(db.get_setting("sonarr_url").unwrap(), None);
+
+        db.save_arr_config("sonarr", "http://sonarr:8989", "key1").unwrap();
+        assert_eq!(db.get_setting("sonarr_url").unwrap().as_deref(), Some("http://sonarr:8989"));
+
+        db.save_setting("sonarr_url", "http://other:8989").unwrap();
+        let settings = db.get_settings(&["sonarr_url", "sonarr_api_key", "missing"]).unwrap();
+        assert_eq!(settings.len(), 2);
+        assert_eq!(settings["sonarr_url"], "http://other:8989");
+
+        db.delete_setting("sonarr_api_key").unwrap();
+        assert_eq!(db.get_setting("sonarr_api_key").unwrap(), None);
+        assert!(!db.get_all_settings().unwrap().contains_key("sonarr_api_key"));
+    }
+
+    #[test]
+    fn test_settings_cache_matches_db_after_concurrent_writes() {
+        let db = Db::in_memory().unwrap();
+        assert_eq!(db.get_setting("fshare_rank").unwrap(), None);
+
+        std::thread::scope(|scope| {
+            for writer in 0..4 {
+                let db = &db;
+                scope.spawn(move || {
+                    for i in 0..50 {
+                        let value = format!("{}-{}", writer, i);
+                        db.save_settings(&[("fshare_rank", &value), ("fshare_valid_until", &value)])
+                            .unwrap();
+                    }
+                });
+            }
+        });
+
+        let conn = db.pool.get().unwrap();
+        for key in ["fshare_rank", "fshare_valid_until"] {
+            let stored: String = conn
+                .query_row("SELECT value FROM settings WHERE key = ?1", params![key], |row| row.get(0))
+                .unwrap();
+            assert_eq!(db.get_setting(key).unwrap().as_deref(), Some(stored.as_str()));
+        }
+    }
+}
@@ -33,10 +33,9 @@ impl DuplicateDetector {
         task_manager: &DownloadTaskManager,
         code: &str
     ) -> Option<DownloadTask> {
-        task_manager.get_tasks()
+        task_manager
+            .find_task(|t| t.fshare_code.as_deref() == Some(code))
             .await
-            .into_iter()
-            .find(|t| t.fshare_code.as_deref() == Some(code))
     }
     
     /// Handle duplicate download based on existing task state
@@ -93,9 +93,7 @@ impl SimpleDownloadEngine {
         };
 
         if !parent_writable {
-            let app_data_dir = std::env::var("FLASHARR_APPDATA_DIR")
-                .map(PathBuf::from)
-                .unwrap_or_else(|_| PathBuf::from("appData"));
+            let app_data_dir = crate::config::get_appdata_dir();
             let rescue_dir = app_data_dir.join("downloads").join("rescue");
             tokio::fs::create_dir_all(&rescue_dir).await?;
             let filename = dest_path.file_name().unwrap_or_default();
@@ -152,9 +150,7 @@ impl SimpleDownloadEngine {
                 let _ = std::fs::remove_file(test_file);
                 path
             } else {
-                let app_data_dir = std::env::var("FLASHARR_APPDATA_DIR")
-                    .map(PathBuf::from)
-                    .unwrap_or_else(|_| std::env::current_dir().unwrap_or_default().join("appData"));
+                let app_data_dir = crate::config::get_appdata_dir();
                 let rel_path = path.strip_prefix("/downloads").unwrap_or(&path);
                 let fallback = app_data_dir.join("downloads").join(rel_path);
                 tracing::warn!(
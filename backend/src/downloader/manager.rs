@@ -11,6 +11,40 @@ use chrono::Utc;
 use super::task::{DownloadTask, DownloadState};
 use super::stats::EngineStats;
 
+/// Real-time fields of an in-flight task, copied out under the read lock
+/// so progress merges don't clone every String field of the task
+#[derive(Debug, Clone)]
+pub struct LiveProgress {
+    pub batch_id: Option<String>,
+    pub progress: f32,
+    pub speed: f64,
+    pub eta: f64,
+    pub downloaded: u64,
+    pub state: DownloadState,
+}
+
+impl LiveProgress {
+    fn of(task: &DownloadTask) -> Self {
+        Self {
+            batch_id: task.batch_id.clone(),
+            progress: task.progress,
+            speed: task.speed,
+            eta: task.eta,
+            downloaded: task.downloaded,
+            state: task.state,
+        }
+    }
+
+    /// Overwrite a (DB-loaded) task's progress with the live values
+    pub fn apply_to(&self, task: &mut DownloadTask) {
+        task.progress = self.progress;
+        task.speed = self.speed;
+        task.eta = self.eta;
+        task.downloaded = self.downloaded;
+        task.state = self.state;
+    }
+}
+
 /// Thread-safe download task manager (in-memory only)
 pub struct DownloadTaskManager {
     tasks: Arc<tokio::sync::RwLock<HashMap<Uuid, DownloadTask>>>,
@@ -56,13 +90,41 @@ impl DownloadTaskManager {
     /// Get only active tasks (DOWNLOADING/STARTING) for real-time progress updates
     /// This is the primary method for merging real-time data with DB queries
     pub async fn get_active_tasks(&self) -> Vec<DownloadTask> {
+        self.get_tasks_matching(|t| matches!(t.state, DownloadState::Downloading | DownloadState::Starting)).await
+    }
+
+    /// Live progress of active (DOWNLOADING/STARTING) tasks keyed by task id,
+    /// for merging into pages read from the database in a single lookup per row
+    pub async fn get_active_progress(&self) -> HashMap<Uuid, LiveProgress> {
         let tasks = self.tasks.read().await;
         tasks.values()
             .filter(|t| matches!(t.state, DownloadState::Downloading | DownloadState::Starting))
+            .map(|t| (t.id, LiveProgress::of(t)))
+            .collect()
+    }
+
+    /// Get tasks matching a predicate, filtering under the read lock so only
+    /// the matching tasks are cloned
+    pub async fn get_tasks_matching<F>(&self, predicate: F) -> Vec<DownloadTask>
+    where
+        F: Fn(&DownloadTask) -> bool,
+    {
+        let tasks = self.tasks.read().await;
+        tasks.values()
+            .filter(|t| predicate(*t))
             .cloned()
             .collect()
     }
 
+    /// Find the first task matching a predicate without cloning the rest
+    pub async fn find_task<F>(&self, predicate: F) -> Option<DownloadTask>
+    where
+        F: Fn(&DownloadTask) -> bool,
+    {
+        let tasks = self.tasks.read().await;
+        tasks.values().find(|t| predicate(*t)).cloned()
+    }
+
     /// Get a specific task
     pub async fn get_task(&self, id: Uuid) -> Option<DownloadTask> {
         let tasks = self.tasks.read().await;
@@ -45,8 +45,9 @@ pub struct DownloadOrchestrator {
     /// Worker handles
     workers: Mutex<Vec<JoinHandle<()>>>,
     
-    /// Configuration (wrapped for dynamic updates)
-    config: Arc<RwLock<DownloadConfig>>,
+    /// Configuration (wrapped for dynamic updates). Updates swap in a new
+    /// immutable snapshot so readers can hold it without copying.
+    config: Arc<RwLock<Arc<DownloadConfig>>>,
     
     /// Running state
     running: Arc<std::sync::atomic::AtomicBool>,
@@ -120,7 +121,7 @@ impl DownloadOrchestrator {
             progress_tx,
             event_bus,
             workers: Mutex::new(Vec::new()),
-            config: Arc::new(RwLock::new(config)),
+            config: Arc::new(RwLock::new(Arc::new(config))),
             running: Arc::new(std::sync::atomic::AtomicBool::new(false)),
             task_notify: Arc::new(Notify::new()),
             arr_client: Arc::new(RwLock::new(arr_client)),
@@ -181,9 +182,9 @@ impl DownloadOrchestrator {
                             }
                         }
                     } else {
-                        task_manager_s.get_tasks().await.into_iter()
-                            .filter(|t| t.state == DownloadState::Completed && !t.arr_announced && t.tmdb_id.is_some())
-                            .collect()
+                        task_manager_s
+                            .get_tasks_matching(|t| t.state == DownloadState::Completed && !t.arr_announced && t.tmdb_id.is_some())
+                            .await
                     };
 
                     if unannounced.is_empty() {
@@ -199,9 +200,7 @@ impl DownloadOrchestrator {
                             if tokio::fs::metadata(stored).await.is_ok() {
                                 Some(task.destination.clone())
                             } else if task.destination.starts_with("/downloads") {
-                                let app_data_dir = std::env::var("FLASHARR_APPDATA_DIR")
-                                    .map(std::path::PathBuf::from)
-                                    .unwrap_or_else(|_| std::path::PathBuf::from("appData"));
+                                let app_data_dir = crate::config::get_appdata_dir();
                                 let rel = task.destination.trim_start_matches("/downloads");
                                 let remapped = app_data_dir.join("downloads").join(rel.trim_start_matches('/'));
                                 if tokio::fs::metadata(&remapped).await.is_ok() {
@@ -627,7 +626,9 @@ impl DownloadOrchestrator {
                                         
                                         // Update in-memory tasks with arr_series_id/arr_movie_id
                                         if let Some(tmdb_id) = task_clone.tmdb_id {
-                                            let all_tasks = task_manager_clone.get_tasks().await;
+                                            let all_tasks = task_manager_clone
+                                                .get_tasks_matching(|t| t.tmdb_id == Some(tmdb_id))
+                                                .await;
                                             let mut updated_count = 0;
 
                                             for mut task in all_tasks {
@@ -837,9 +838,9 @@ impl DownloadOrchestrator {
             }
         } else {
             // Fallback to in-memory tasks
-            self.task_manager.get_tasks().await.into_iter()
-                .filter(|t| t.state == DownloadState::Completed)
-                .collect()
+            self.task_manager
+                .get_tasks_matching(|t| t.state == DownloadState::Completed)
+                .await
         };
 
         tracing::info!("Backfill: Processing {} completed tasks", completed_tasks.len());
@@ -894,31 +895,8 @@ impl DownloadOrchestrator {
 
         // Query database for accurate status counts (for filter dropdown)
         if let Some(db) = &self.db {
-            match db.get_status_counts() {
-                Ok(counts) => {
-                    use crate::downloader::stats::DbStatusCounts;
-
-                    // Aggregate counts by UI category
-                    let downloading = *counts.get("DOWNLOADING").unwrap_or(&0)
-                        + *counts.get("STARTING").unwrap_or(&0);
-                    let queued = *counts.get("QUEUED").unwrap_or(&0)
-                        + *counts.get("WAITING").unwrap_or(&0);
-                    let paused = *counts.get("PAUSED").unwrap_or(&0);
-                    let completed = *counts.get("COMPLETED").unwrap_or(&0);
-                    let failed = *counts.get("FAILED").unwrap_or(&0);
-                    let cancelled = *counts.get("CANCELLED").unwrap_or(&0);
-                    let all: usize = counts.values().sum();
-
-                    stats.db_counts = Some(DbStatusCounts {
-                        all,
-                        downloading,
-                        queued,
-                        paused,
-                        completed,
-                        failed,
-                        cancelled,
-                    });
-                }
+            match db.get_db_status_counts_async().await {
+                Ok(counts) => stats.db_counts = Some(counts),
                 Err(e) => {
                     tracing::warn!("Failed to get status counts from DB: {}", e);
                 }
@@ -941,20 +919,10 @@ impl DownloadOrchestrator {
     /// Broadcast a task update to all WebSocket clients
     /// Used when task state changes (pause, resume, etc.)
     pub fn broadcast_task_update(&self, task: &DownloadTask) {
-        let state_str = format!("{:?}", task.state).to_uppercase();
-        
-        // Legacy progress broadcast
-        let _ = self.progress_tx.send(ProgressUpdate {
-            event: TaskEvent::Updated,
-            task_id: task.id.to_string(),
-            downloaded_bytes: task.downloaded,
-            total_bytes: task.size,
-            speed_bytes_per_sec: task.speed,
-            eta_seconds: task.eta,
-            percentage: task.progress as f64,
-            state: state_str,
-        });
-        
+        // Only the StateChanged event is emitted: it already carries the full
+        // task, so a legacy ProgressUpdate here just made every WebSocket client
+        // look the same task up again and batch it twice.
+        //
         // Emit StateChanged event (event-driven architecture)
         // Note: We don't have old_state here, so we'll use the current state for both
         // This is acceptable as the task object contains the new state
@@ -1353,7 +1321,8 @@ impl DownloadOrchestrator {
                 if let Some(task) = task_manager.pop_next_queued().await {
                     tracing::info!("Worker {}: Processing task {}", worker_id, task.id);
                     
-                    // Acquire locks for current config and engine
+                    // Snapshot current config and engine; both are shared
+                    // immutably, so this is two refcount bumps, not a deep copy
                     let (current_engine, current_config) = {
                         let engine_guard = download_engine.read().await;
                         let config_guard = config.read().await;
@@ -1806,7 +1775,7 @@ impl DownloadOrchestrator {
 
     /// Get current download configuration
     pub async fn get_config(&self) -> DownloadConfig {
-        self.config.read().await.clone()
+        DownloadConfig::clone(&self.config.read().await)
     }
     
     /// Update download configuration
@@ -1819,7 +1788,7 @@ impl DownloadOrchestrator {
         // Update config
         {
             let mut config_guard = self.config.write().await;
-            *config_guard = new_config.clone();
+            *config_guard = Arc::new(new_config.clone());
         }
         
         // Recreation of engine to pick up new settings
@@ -2157,13 +2126,13 @@ impl DownloadOrchestrator {
             None
         };
 
+        // Swap both under their write locks together (always arr_client first)
+        // so concurrent reloads can't interleave and leave the artifact manager
+        // wrapping a different client than the one readers see.
         {
             let mut arr_guard = self.arr_client.write().await;
-            *arr_guard = new_client;
-        }
-        
-        {
             let mut artifact_guard = self.artifact_manager.write().await;
+            *arr_guard = new_client;
             *artifact_guard = new_artifact_manager;
         }
         
@@ -54,9 +54,24 @@ impl WebSessionData {
     const VALIDATION_INTERVAL_MINUTES: i64 = 10;
 
     fn needs_validation(&self) -> bool {
-        let age = Utc::now().signed_duration_since(self.last_validated);
+        self.needs_validation_at(Utc::now())
+    }
+
+    fn needs_validation_at(&self, now: DateTime<Utc>) -> bool {
+        let age = now.signed_duration_since(self.last_validated);
         age > chrono::Duration::minutes(Self::VALIDATION_INTERVAL_MINUTES)
     }
+
+    /// Logged-in web session with placeholder cookie/CSRF values, for tests
+    #[cfg(test)]
+    fn for_testing(last_validated: DateTime<Utc>) -> Self {
+        Self {
+            cookies: "fshare_app=test".to_string(),
+            csrf_token: "csrf".to_string(),
+            created_at: last_validated,
+            last_validated,
+        }
+    }
 }
 
 impl SessionData {
@@ -65,10 +80,26 @@ impl SessionData {
     
     /// Check if session needs validation
     fn needs_validation(&self) -> bool {
-        let age = Utc::now().signed_duration_since(self.last_validated);
+        self.needs_validation_at(Utc::now())
+    }
+
+    /// Check if session needs validation relative to a given reference time
+    fn needs_validation_at(&self, now: DateTime<Utc>) -> bool {
+        let age = now.signed_duration_since(self.last_validated);
         age > chrono::Duration::minutes(Self::VALIDATION_INTERVAL_MINUTES)
     }
     
+    /// Logged-in API session with placeholder credentials, for tests
+    #[cfg(test)]
+    fn for_testing(last_validated: DateTime<Utc>) -> Self {
+        Self {
+            session_id: "sid".to_string(),
+            token: "token".to_string(),
+            created_at: last_validated,
+            last_validated,
+        }
+    }
+
     /// Get time since last validation in seconds
     fn seconds_since_validation(&self) -> i64 {
         Utc::now().signed_duration_since(self.last_validated).num_seconds()
@@ -250,50 +281,57 @@ impl FshareHandler {
     }
     
     /// Validate session using /api/user/get
+    ///
+    /// Both endpoints are probed concurrently and the first success wins, so a
+    /// slow or failing api.fshare.vn no longer delays the primary API check.
     async fn validate_session(&self, session: &SessionData) -> anyhow::Result<()> {
+        use futures_util::FutureExt;
+
         tracing::debug!("[FSHARE] Validating session...");
         
-        // Try api.fshare.vn first (faster and more reliable)
-        let api2_result = self.api2_client
-            .get("https://api.fshare.vn/api/user/get")
-            .header("Cookie", format!("session_id={}", session.session_id))
-            .timeout(std::time::Duration::from_secs(5))
-            .send()
-            .await;
-        
-        match api2_result {
-            Ok(resp) if resp.status() == 200 => {
-                tracing::debug!("[FSHARE-API2] Session validation successful");
-                return Ok(());
-            }
-            Ok(resp) => {
-                tracing::debug!("[FSHARE-API2] Session invalid (status: {}), trying primary API", resp.status());
+        // api.fshare.vn (faster and more reliable when up)
+        let api2_check = async {
+            let resp = self.api2_client
+                .get("https://api.fshare.vn/api/user/get")
+                .header("Cookie", format!("session_id={}", session.session_id))
+                .timeout(std::time::Duration::from_secs(5))
+                .send()
+                .await
+                .map_err(|e| anyhow::anyhow!("[FSHARE-API2] Validation failed: {}", e))?;
+            if resp.status() != 200 {
+                return Err(anyhow::anyhow!("[FSHARE-API2] Session invalid (status: {})", resp.status()));
             }
-            Err(e) => {
-                tracing::debug!("[FSHARE-API2] Validation failed ({}), trying primary API", e);
+            tracing::debug!("[FSHARE-API2] Session validation successful");
+            Ok(())
+        };
+        
+        // Primary API
+        let primary_check = async {
+            let resp = self.client
+                .post("https://download.fsharegroup.site/api/user/get")
+                .json(&serde_json::json!({
+                    "session_id": session.session_id,
+                }))
+                .timeout(std::time::Duration::from_secs(5))
+                .send()
+                .await
+                .map_err(|e| anyhow::anyhow!("Session validation request failed: {}", e))?;
+            
+            let status = resp.status();
+            let data: Value = resp.json().await?;
+            
+            if status != 200 || data["code"] != 200 {
+                return Err(anyhow::anyhow!("Session invalid (status: {}, code: {})", status, data["code"]));
             }
-        }
+            
+            tracing::debug!("[FSHARE] Session validation successful");
+            Ok(())
+        };
         
-        // Fallback to primary API
-        let resp = self.client
-            .post("https://download.fsharegroup.site/api/user/get")
-            .json(&serde_json::json!({
-                "session_id": session.session_id,
-            }))
-            .timeout(std::time::Duration::from_secs(5))
-            .send()
+        // Errors only when both endpoints reject the session (last error wins)
+        futures_util::future::select_ok([api2_check.boxed(), primary_check.boxed()])
             .await
-            .map_err(|e| anyhow::anyhow!("Session validation request failed: {}", e))?;
-        
-        let status = resp.status();
-        let data: Value = resp.json().await?;
-        
-        if status != 200 || data["code"] != 200 {
-            return Err(anyhow::anyhow!("Session invalid (status: {}, code: {})", status, data["code"]));
-        }
-        
-        tracing::debug!("[FSHARE] Session validation successful");
-        Ok(())
+            .map(|_| ())
     }
     
     /// Perform login with concurrent protection and rate limiting
@@ -508,8 +546,10 @@ impl FshareHandler {
                 .or_else(|| data["expire_vip"].as_u64())
                 .unwrap_or(0);
                 
-            let _ = db.save_setting("fshare_rank", rank);
-            let _ = db.save_setting("fshare_valid_until", &valid_until.to_string());
+            let _ = db.save_settings(&[
+                ("fshare_rank", rank),
+                ("fshare_valid_until", valid_until.to_string().as_str()),
+            ]);
             tracing::debug!("[FSHARE] Cached rank '{}' and valid_until '{}' to DB", rank, valid_until);
         }
         
@@ -610,9 +650,11 @@ impl FshareHandler {
             // Fetch and cache rank immediately since API2 login response doesn't include account type
             if let Ok(status) = self.fetch_account_status_for_session(&new_session).await {
                 let rank = if status.premium { "VIP" } else { "FREE" };
-                let _ = db.save_setting("fshare_rank", rank);
                 let valid_until = status.valid_until.unwrap_or(0);
-                let _ = db.save_setting("fshare_valid_until", &valid_until.to_string());
+                let _ = db.save_settings(&[
+                    ("fshare_rank", rank),
+                    ("fshare_valid_until", valid_until.to_string().as_str()),
+                ]);
                 tracing::info!("[FSHARE-API2] Verified account rank: {}, valid_until: {}", rank, valid_until);
             }
         }
@@ -625,16 +667,14 @@ impl FshareHandler {
     // ── Web Form Login Fallback ──────────────────────────────────────────────
     
     /// Extract CSRF token from HTML: <meta name="csrf-token" content="...">
-    fn extract_csrf_token(html: &str) -> Option<String> {
-        // Look for <meta name="csrf-token" content="VALUE">
-        let marker = "name=\"csrf-token\" content=\"";
-        if let Some(pos) = html.find(marker) {
-            let start = pos + marker.len();
-            if let Some(end) = html[start..].find('"') {
-                return Some(html[start..start + end].to_string());
-            }
-        }
-        None
+    ///
+    /// Works on the raw body so pages aren't UTF-8 decoded just to find one
+    /// tag; the meta tag sits in `<head>`, so the scan usually stops early.
+    fn extract_csrf_token(html: &[u8]) -> Option<String> {
+        const MARKER: &[u8] = b"name=\"csrf-token\" content=\"";
+        let start = html.windows(MARKER.len()).position(|w| w == MARKER)? + MARKER.len();
+        let len = html[start..].iter().position(|&b| b == b'"')?;
+        String::from_utf8(html[start..start + len].to_vec()).ok()
     }
     
     /// Extract Set-Cookie values from response headers into a cookie string
@@ -674,7 +714,7 @@ impl FshareHandler {
             .map_err(|e| anyhow::anyhow!("[FSHARE-WEB] Failed to load login page: {}", e))?;
         
         let initial_cookies = Self::extract_cookies(&login_page_resp);
-        let html = login_page_resp.text().await?;
+        let html = login_page_resp.bytes().await?;
         
         let csrf_token = Self::extract_csrf_token(&html)
             .ok_or_else(|| anyhow::anyhow!("[FSHARE-WEB] Could not extract CSRF token from login page"))?;
@@ -704,8 +744,10 @@ impl FshareHandler {
         let login_cookies = Self::extract_cookies(&login_resp);
         let all_cookies = Self::merge_cookies(&initial_cookies, &login_cookies);
         
-        tracing::info!("[FSHARE-WEB] Login POST status: {} | Cookies: {}", status, 
-            if all_cookies.len() > 60 { format!("{}...", &all_cookies[..60]) } else { all_cookies.clone() });
+        // Preview borrows from the cookie header rather than building a copy to log
+        tracing::info!("[FSHARE-WEB] Login POST status: {} | Cookies: {}{}", status,
+            &all_cookies[..all_cookies.len().min(60)],
+            if all_cookies.len() > 60 { "..." } else { "" });
         
         // 302 redirect = success (redirecting to home page)
         // 200 = failure (re-rendered login form with errors)
@@ -741,7 +783,7 @@ impl FshareHandler {
                     tracing::info!("[FSHARE-WEB] Session confirmed via /account/profile (200)");
                     
                     // Try to extract a fresh CSRF token from the profile page
-                    let profile_html = resp.text().await.unwrap_or_default();
+                    let profile_html = resp.bytes().await.unwrap_or_default();
                     let final_csrf = Self::extract_csrf_token(&profile_html)
                         .unwrap_or(csrf_token);
                     
@@ -883,7 +925,7 @@ impl FshareHandler {
             Ok(resp) => {
                 let page_cookies = Self::extract_cookies(&resp);
                 let merged = Self::merge_cookies(&web_session.cookies, &page_cookies);
-                let html = resp.text().await.unwrap_or_default();
+                let html = resp.bytes().await.unwrap_or_default();
                 let csrf = Self::extract_csrf_token(&html).unwrap_or_else(|| web_session.csrf_token.clone());
                 tracing::debug!("[FSHARE-WEB] Got file-page CSRF: {}...", &csrf[..20.min(csrf.len())]);
                 (csrf, merged)
@@ -1338,8 +1380,8 @@ impl HostHandler for FshareHandler {
 
         let data: Value = resp.json().await?;
         
-        // Debug: Log the full response
-        tracing::info!("[FSHARE] Full API response: {}", serde_json::to_string(&data).unwrap_or_else(|_| format!("{:?}", data)));
+        // Debug: Log the full response (Value's Display is compact JSON, only rendered if enabled)
+        tracing::debug!("[FSHARE] Full API response: {}", data);
         
         // Check for errors in response
         if let Some(error) = data["error"].as_str() {
@@ -1411,3 +1453,29 @@ impl HostHandler for FshareHandler {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Fixed reference time so expiry checks don't depend on the wall clock
+    fn fake_now() -> DateTime<Utc> {
+        DateTime::<Utc>::UNIX_EPOCH + chrono::Duration::days(365 * 60)
+    }
+
+    #[test]
+    fn test_session_needs_validation() {
+        let now = fake_now();
+        let session = SessionData::for_testing(now - chrono::Duration::minutes(5));
+        assert!(!session.needs_validation_at(now));
+        assert!(session.needs_validation_at(now + chrono::Duration::seconds(1)));
+    }
+
+    #[test]
+    fn test_web_session_needs_validation() {
+        let now = fake_now();
+        let session = WebSessionData::for_testing(now - chrono::Duration::minutes(10));
+        assert!(!session.needs_validation_at(now));
+        assert!(session.needs_validation_at(now + chrono::Duration::minutes(1)));
+    }
+}
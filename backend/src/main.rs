@@ -9,6 +9,10 @@ use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt};
 use figment::providers::Format;
 use tower_http::services::{ServeDir, ServeFile};
 use tower_http::cors::{CorsLayer, Any};
+use tower_http::compression::{
+    predicate::{NotForContentType, Predicate, SizeAbove},
+    CompressionLayer, CompressionLevel,
+};
 use moka::future::Cache;
 use std::time::Duration;
 
@@ -65,6 +69,14 @@ pub struct AppState {
     pub http_client: Arc<reqwest::Client>,
     /// Cache for TimFshare search results (avoids duplicate API calls)
     pub fshare_search_cache: Cache<String, Vec<api::search_pipeline::RawFshareResult>>,
+    /// Short-lived engine stats snapshot shared by REST pollers and WebSocket clients
+    pub stats_cache: Cache<(), Arc<api::stats::StatsSnapshot>>,
+    /// Configured indexer API key, so auth checks skip the settings table
+    pub api_key_cache: Cache<(), String>,
+    /// Recently read pages of the downloads table, shared by UI pollers
+    pub downloads_page_cache: Cache<api::downloads::DownloadsPageKey, Arc<api::downloads::DownloadsPage>>,
+    /// Stored Fshare account info served to the account badge poller
+    pub account_cache: Cache<(), Option<api::accounts::AccountInfo>>,
     pub discovery_service: Arc<services::DiscoveryService>,
     pub library_sync_service: Arc<services::LibrarySyncService>,
 }
@@ -91,7 +103,7 @@ async fn main() {
         .with(tracing_subscriber::fmt::layer())
         .init();
 
-    tracing::info!("Starting Flasharr v{}", env!("CARGO_PKG_VERSION"));
+    tracing::info!("Starting Flasharr v{}", api::system::app_version());
 
     // Create appData directory structure if needed
     if let Err(e) = config::ensure_appdata_dirs() {
@@ -273,6 +285,30 @@ async fn main() {
         .max_capacity(200)
         .time_to_live(Duration::from_secs(300)) // 5 minutes
         .build();
+
+    // Engine stats cache (1s TTL) — concurrent pollers share one DB aggregation
+    let stats_cache = Cache::builder()
+        .max_capacity(1)
+        .time_to_live(Duration::from_secs(1))
+        .build();
+
+    // Indexer API key cache (10s TTL) — every authenticated request reads it
+    let api_key_cache = Cache::builder()
+        .max_capacity(1)
+        .time_to_live(Duration::from_secs(10))
+        .build();
+
+    // Downloads page cache (1s TTL) — UI pollers share one page query per second
+    let downloads_page_cache = Cache::builder()
+        .max_capacity(64)
+        .time_to_live(Duration::from_secs(1))
+        .build();
+
+    // Account info cache (5s TTL) — rank updates written by the Fshare host show up within 5s
+    let account_cache = Cache::builder()
+        .max_capacity(1)
+        .time_to_live(Duration::from_secs(5))
+        .build();
     
     // Create DownloadService for business logic abstraction
     let download_service = Arc::new(services::DownloadService::new(
@@ -323,6 +359,10 @@ async fn main() {
         tmdb_cache,
         http_client,
         fshare_search_cache,
+        stats_cache,
+        api_key_cache,
+        downloads_page_cache,
+        account_cache,
         discovery_service,
         library_sync_service: Arc::clone(&library_sync_service),
     });
@@ -367,9 +407,24 @@ async fn main() {
                 .allow_methods(Any)
                 .allow_headers(Any)
         )
+        // gzip/br for API payloads over 1 KiB (download lists, batch items);
+        // small replies like /api/system/version go out as-is
+        .layer(
+            CompressionLayer::new()
+                .quality(CompressionLevel::Precise(4))
+                .compress_when(
+                    SizeAbove::new(1024)
+                        .and(NotForContentType::GRPC)
+                        .and(NotForContentType::IMAGES)
+                        .and(NotForContentType::SSE),
+                )
+        )
         .layer(tower_http::trace::TraceLayer::new_for_http())
         .fallback_service(ServeDir::new("static").not_found_service(ServeFile::new("static/index.html")))
-        .with_state(state);
+        .with_state(Arc::clone(&state));
+
+    // Spawn stats snapshot refresher (every 500ms)
+    tokio::spawn(api::stats::refresh_stats_loop(state));
 
     // Spawn folder cache background sync (daily)
     tokio::spawn(async move {
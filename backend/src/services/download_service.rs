@@ -259,15 +259,11 @@ impl DownloadService {
     
     /// Merge real-time progress from active tasks into a list of tasks
     pub async fn merge_realtime_progress(&self, mut tasks: Vec<DownloadTask>) -> Vec<DownloadTask> {
-        let active_tasks = self.orchestrator.task_manager().get_active_tasks().await;
+        let live = self.orchestrator.task_manager().get_active_progress().await;
 
         for task in tasks.iter_mut() {
-            if let Some(active) = active_tasks.iter().find(|t| t.id == task.id) {
-                task.progress = active.progress;
-                task.speed = active.speed;
-                task.eta = active.eta;
-                task.downloaded = active.downloaded;
-                task.state = active.state;
+            if let Some(progress) = live.get(&task.id) {
+                progress.apply_to(task);
             }
         }
 
@@ -10,7 +10,7 @@ use quick_xml::Reader;
 use quick_xml::events::Event;
 use crate::db::Db;
 use crate::db::sqlite::CachedFolderItem;
-use crate::api::folder_source::FolderSourceEntry;
+use crate::api::folder_source::{fshare_item_url, take_json_scalar, take_json_str, FolderSourceEntry};
 use crate::utils::parser::FilenameParser;
 use crate::services::tmdb_service::TmdbService;
 
@@ -253,11 +253,7 @@ impl FolderCacheService {
                         let is_dir = item.r#type == "0" || item.mimetype.is_empty();
                         let size: u64 = item.size.parse().unwrap_or(0);
 
-                        let fshare_url = if is_dir {
-                            format!("https://www.fshare.vn/folder/{}", item.linkcode)
-                        } else {
-                            format!("https://www.fshare.vn/file/{}", item.linkcode)
-                        };
+                        let fshare_url = fshare_item_url(&item.linkcode, is_dir);
 
                         let parsed = FilenameParser::parse(&item.name);
 
@@ -598,7 +594,7 @@ fn parse_folder_response(body: &str) -> (Vec<FshareXmlItem>, bool) {
 
 /// Parse JSON response from Fshare v3 API
 fn parse_folder_json(json_text: &str) -> (Vec<FshareXmlItem>, bool) {
-    let parsed: serde_json::Value = match serde_json::from_str(json_text) {
+    let mut parsed: serde_json::Value = match serde_json::from_str(json_text) {
         Ok(v) => v,
         Err(e) => {
             tracing::error!("[FOLDER-CACHE] JSON parse error: {}", e);
@@ -606,36 +602,26 @@ fn parse_folder_json(json_text: &str) -> (Vec<FshareXmlItem>, bool) {
         }
     };
 
+    // Check for pagination
+    let has_next = parsed.get("_links")
+        .and_then(|links| links.get("next"))
+        .map(|next| !next.is_null())
+        .unwrap_or(false);
+
     let mut items = Vec::new();
 
-    if let Some(arr) = parsed.get("items").and_then(|v| v.as_array()) {
-        for item in arr {
-            let linkcode = item.get("linkcode").and_then(|v| v.as_str()).unwrap_or("").to_string();
-            let name = item.get("name").and_then(|v| v.as_str()).unwrap_or("").to_string();
+    // Items are taken by value so their strings move into FshareXmlItem without cloning
+    if let Some(serde_json::Value::Array(arr)) = parsed.get_mut("items").map(serde_json::Value::take) {
+        for mut item in arr {
+            let linkcode = take_json_str(&mut item, "linkcode");
+            let name = take_json_str(&mut item, "name");
 
             if linkcode.is_empty() || name.is_empty() { continue; }
 
-            let item_type = item.get("type").map(|v| match v {
-                serde_json::Value::Number(n) => n.to_string(),
-                serde_json::Value::String(s) => s.clone(),
-                _ => String::new(),
-            }).unwrap_or_default();
-
-            let size = item.get("size").map(|v| match v {
-                serde_json::Value::Number(n) => n.to_string(),
-                serde_json::Value::String(s) => s.clone(),
-                _ => "0".to_string(),
-            }).unwrap_or_else(|| "0".to_string());
-
-            let mimetype = item.get("mimetype")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string();
-
-            let path = item.get("path")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string();
+            let item_type = take_json_scalar(&mut item, "type").unwrap_or_default();
+            let size = take_json_scalar(&mut item, "size").unwrap_or_else(|| "0".to_string());
+            let mimetype = take_json_str(&mut item, "mimetype");
+            let path = take_json_str(&mut item, "path");
 
             items.push(FshareXmlItem {
                 linkcode,
@@ -648,12 +634,6 @@ fn parse_folder_json(json_text: &str) -> (Vec<FshareXmlItem>, bool) {
         }
     }
 
-    // Check for pagination
-    let has_next = parsed.get("_links")
-        .and_then(|links| links.get("next"))
-        .map(|next| !next.is_null())
-        .unwrap_or(false);
-
     (items, has_next)
 }
 
@@ -744,11 +724,9 @@ mod tests {
     use super::*;
     use tempfile::NamedTempFile;
 
-    /// Create a fresh test DB (temp file, auto-cleaned up)
-    fn test_db() -> (Arc<Db>, NamedTempFile) {
-        let tmp = NamedTempFile::new().expect("Failed to create temp file");
-        let db = Db::new(tmp.path()).expect("Failed to create test DB");
-        (Arc::new(db), tmp)
+    /// Create a fresh in-memory test DB (dropped with the pool)
+    fn test_db() -> Arc<Db> {
+        Arc::new(Db::in_memory().expect("Failed to create test DB"))
     }
 
     /// Build a set of realistic cached folder items for testing
@@ -921,7 +899,7 @@ mod tests {
 
     #[test]
     fn test_insert_and_count() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         let items = sample_items();
 
         let inserted = db.insert_folder_cache_batch(&items).unwrap();
@@ -935,7 +913,7 @@ mod tests {
 
     #[test]
     fn test_search_by_title() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         // Search for "Peaky" — should find Peaky Blinders
@@ -953,7 +931,7 @@ mod tests {
 
     #[test]
     fn test_search_by_filename() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         // Search for "Traces" — matches the scene release name
@@ -971,7 +949,7 @@ mod tests {
 
     #[test]
     fn test_search_prefix_matching() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         // Search for "Vik" — prefix should match "Vikings"
@@ -989,7 +967,7 @@ mod tests {
 
     #[test]
     fn test_search_multi_word() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         // "Dune Part" should match "Dune Part Two"
@@ -1007,7 +985,7 @@ mod tests {
 
     #[test]
     fn test_search_by_category() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         // Search by label "Phim Lẻ" — should find movies
@@ -1024,7 +1002,7 @@ mod tests {
 
     #[test]
     fn test_search_empty_query() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         // Empty string should not match (we'd handle this in the API layer)
@@ -1037,7 +1015,7 @@ mod tests {
 
     #[test]
     fn test_clear_cache() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
         assert_eq!(db.get_folder_cache_count().unwrap(), 8);
 
@@ -1053,7 +1031,7 @@ mod tests {
 
     #[test]
     fn test_metadata() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
 
         // Initially no metadata
         assert!(db.get_folder_cache_meta("last_sync").unwrap().is_none());
@@ -1073,7 +1051,7 @@ mod tests {
 
     #[test]
     fn test_search_result_fields() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
         db.insert_folder_cache_batch(&sample_items()).unwrap();
 
         let results = db.search_folder_cache("Oppenheimer", 50).unwrap();
@@ -1101,7 +1079,7 @@ mod tests {
 
     #[test]
     fn test_large_batch_insert() {
-        let (db, _tmp) = test_db();
+        let db = test_db();
 
         // Create 1000 items
         let mut items = Vec::new();
@@ -1194,6 +1172,34 @@ mod tests {
         assert_eq!(items[1].r#type, "0"); // folder
     }
 
+    #[test]
+    fn test_json_parsing() {
+        // Captured shape of a v3 JSON page: numeric type/size, string fields, null next link
+        let json = r#"{
+            "items": [
+                {"linkcode": "ABC123", "name": "Test Movie 2024.mkv", "type": 1, "size": 5000000000,
+                 "mimetype": "video/x-matroska", "path": "/movies"},
+                {"linkcode": "DEF456", "name": "TV Show Season 1", "type": "0", "size": "0",
+                 "mimetype": "", "path": "/shows"},
+                {"linkcode": "", "name": "skipped"}
+            ],
+            "_links": {"next": null}
+        }"#;
+
+        let (items, has_next) = parse_folder_response(json);
+
+        assert_eq!(items.len(), 2);
+        assert!(!has_next);
+
+        assert_eq!(items[0].r#type, "1");
+        assert_eq!(items[0].size, "5000000000");
+        assert_eq!(items[0].mimetype, "video/x-matroska");
+
+        assert_eq!(items[1].linkcode, "DEF456");
+        assert_eq!(items[1].r#type, "0");
+        assert_eq!(items[1].path, "/shows");
+    }
+
     // ── Test: extract_folder_code ─────────────────────────────────────
 
     #[test]
@@ -1279,11 +1285,7 @@ mod tests {
                     for item in &items {
                         let is_dir = item.r#type == "0" || item.mimetype.is_empty();
                         let size: u64 = item.size.parse().unwrap_or(0);
-                        let fshare_url = if is_dir {
-                            format!("https://www.fshare.vn/folder/{}", item.linkcode)
-                        } else {
-                            format!("https://www.fshare.vn/file/{}", item.linkcode)
-                        };
+                        let fshare_url = fshare_item_url(&item.linkcode, is_dir);
                         let parsed = FilenameParser::parse(&item.name);
 
                         batch.push(CachedFolderItem {
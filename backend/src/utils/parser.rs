@@ -1,4 +1,5 @@
 use serde::{Deserialize, Serialize};
+use aho_corasick::AhoCorasick;
 use regex::Regex;
 use std::sync::OnceLock;
 
@@ -207,6 +208,108 @@ pub struct ParsedFilename {
 
 pub struct FilenameParser;
 
+/// Declares the `Marker` enum and the matching `QUALITY_MARKERS` table in one
+/// place, so a marker's discriminant is always its index in the table.
+macro_rules! quality_markers {
+    ($($variant:ident => $text:literal,)*) => {
+        /// Literal markers `extract_quality_attributes` looks for.
+        #[derive(Clone, Copy)]
+        #[repr(usize)]
+        enum Marker { $($variant,)* }
+
+        /// Marker text, indexed by `Marker` discriminant.
+        const QUALITY_MARKERS: &[&str] = &[$($text,)*];
+    };
+}
+
+quality_markers! {
+    P2160 => "2160p",
+    FourK => "4k",
+    Uhd => "uhd",
+    P1080 => "1080p",
+    I1080 => "1080i",
+    P720 => "720p",
+    Remux => "remux",
+    BluRay => "bluray",
+    BluRayDash => "blu-ray",
+    BdRip => "bdrip",
+    BrRip => "brrip",
+    WebDlDash => "web-dl",
+    WebDl => "webdl",
+    WebRip => "webrip",
+    WebRipDash => "web-rip",
+    Hdtv => "hdtv",
+    Pdtv => "pdtv",
+    Cam => "cam",
+    X265 => "x265",
+    Hevc => "hevc",
+    H265 => "h.265",
+    X264 => "x264",
+    Avc => "avc",
+    H264 => "h.264",
+    Atmos => "atmos",
+    TrueHd => "truehd",
+    DtsHdDash => "dts-hd",
+    DtsHd => "dtshd",
+    DtsX => "dts:x",
+    Dts => "dts",
+    Eac3 => "eac3",
+    DdPlus => "dd+",
+    Ddp => "ddp",
+    Ac3 => "ac3",
+    Aac => "aac",
+    Mp3 => "mp3",
+    Hdr => "hdr",
+    Hdr10 => "hdr10",
+    Dv => "dv",
+    DolbyVision => "dolby vision",
+    Bit10 => "10bit",
+    Bit10Spaced => "10 bit",
+    Bit12 => "12bit",
+    Bit12Spaced => "12 bit",
+    VietSub => "vietsub",
+    SubViet => "sub viet",
+    PhuDe => "phu de",
+    PhuDeAccented => "phụ đề",
+    Vie => "vie",
+    ThuyetMinh => "thuyet minh",
+    ThuyetMinhAccented => "thuyết minh",
+    LongTieng => "long tieng",
+    LongTiengAccented => "lồng tiếng",
+    Tmph => "tmph",
+    Tvp => "tvp",
+    Tmpd => "tmpd",
+    VietDub => "vietdub",
+}
+
+/// Set of `QUALITY_MARKERS` present in a lowercased filename.
+///
+/// One Aho-Corasick pass finds every marker (overlaps included, so "hdr10"
+/// also reports "hdr"), replacing a separate substring scan per marker.
+struct QualityMarkers(u64);
+
+impl QualityMarkers {
+    fn scan(fl: &str) -> Self {
+        static AUTOMATON: OnceLock<AhoCorasick> = OnceLock::new();
+        // Each marker owns one bit of the u64
+        debug_assert!(QUALITY_MARKERS.len() <= 64);
+        let ac = AUTOMATON.get_or_init(|| AhoCorasick::new(QUALITY_MARKERS).unwrap());
+        let mut found = 0u64;
+        for m in ac.find_overlapping_iter(fl) {
+            found |= 1 << m.pattern().as_usize();
+        }
+        Self(found)
+    }
+
+    fn has(&self, marker: Marker) -> bool {
+        self.0 & (1 << marker as usize) != 0
+    }
+
+    fn has_any(&self, markers: &[Marker]) -> bool {
+        markers.iter().any(|&m| self.has(m))
+    }
+}
+
 #[allow(dead_code)]
 static SE_PATTERNS: OnceLock<Vec<Regex>> = OnceLock::new();
 static YEAR_PATTERN: OnceLock<Regex> = OnceLock::new();
@@ -217,8 +320,7 @@ impl FilenameParser {
     fn se_patterns() -> &'static Vec<Regex> {
         SE_PATTERNS.get_or_init(|| {
             vec![
-                Regex::new(r"(?i)S(\d{1,4})E(\d{1,3})").unwrap(),           // S01E14
-                Regex::new(r"(?i)S(\d{1,4})\s*EP?(\d{1,3})").unwrap(),      // S01 E14, S01 EP14
+                Regex::new(r"(?i)S(\d{1,4})\s*EP?(\d{1,3})").unwrap(),      // S01E14, S01 E14, S01EP14
                 Regex::new(r"(?i)\bE(\d{1,3})\b").unwrap(),                 // E14 (standalone)
                 Regex::new(r"(?i)\bEP(\d{1,3})\b").unwrap(),                // EP14 (standalone)
                 Regex::new(r"(?i)\bChapter\s*(\d{1,4})\b").unwrap(),        // Chapter 14
@@ -234,6 +336,27 @@ impl FilenameParser {
         YEAR_PATTERN.get_or_init(|| Regex::new(r"\b(19|20)\d{2}\b").unwrap())
     }
 
+    /// Cheap substring prefilter: a year always starts with "19" or "20",
+    /// so names without either can skip the regex engine entirely.
+    pub fn may_contain_year(text: &str) -> bool {
+        text.contains("19") || text.contains("20")
+    }
+
+    /// Every S/E pattern needs a digit, so names without one (bare titles,
+    /// folder names) skip the whole pattern battery. `char::is_numeric` is a
+    /// superset of the regexes' Unicode `\d`, so no match is lost.
+    fn may_contain_episode_marker(text: &str) -> bool {
+        text.chars().any(char::is_numeric)
+    }
+
+    /// Find the first year in `text`, skipping the regex when no year is possible
+    pub fn find_year(text: &str) -> Option<regex::Match<'_>> {
+        if !Self::may_contain_year(text) {
+            return None;
+        }
+        Self::year_pattern().find(text)
+    }
+
     pub fn quality_pattern() -> &'static Regex {
         QUALITY_PATTERN.get_or_init(|| {
             let keywords = vec![
@@ -272,7 +395,8 @@ impl FilenameParser {
         let mut pivot_start = name.len();
         let mut pivot_end = name.len();
 
-        for pattern in Self::se_patterns() {
+        let se_candidates = if Self::may_contain_episode_marker(&name) { Self::se_patterns().as_slice() } else { &[] };
+        for pattern in se_candidates {
             if let Some(caps) = pattern.captures(&name) {
                 if let Some(m) = caps.get(0) {
                     pivot_start = m.start();
@@ -293,7 +417,7 @@ impl FilenameParser {
         }
 
         // 2. Identify Year
-        let year_match = Self::year_pattern().find(&name);
+        let year_match = Self::find_year(&name);
         let year = year_match.and_then(|m| m.as_str().parse().ok());
         
         // If no S/E found, year can be a pivot
@@ -334,7 +458,9 @@ impl FilenameParser {
         title_part = Self::quality_pattern().replace_all(&title_part, "").to_string();
         
         // 5c. Remove year from title part if it existed
-        title_part = Self::year_pattern().replace_all(&title_part, "").to_string();
+        if year_match.is_some() {
+            title_part = Self::year_pattern().replace_all(&title_part, "").to_string();
+        }
         
         // 5d. Handle "Double Dash" or "Separator Overload"
         title_part = title_part.replace(" - ", " ").replace('_', " ").replace('.', " ");
@@ -369,52 +495,51 @@ impl FilenameParser {
 
     pub fn extract_quality_attributes(filename: &str) -> QualityAttributes {
         let fl = filename.to_lowercase();
+        let markers = QualityMarkers::scan(&fl);
         let mut attrs = QualityAttributes::default();
 
         // Resolution
-        if fl.contains("2160p") || fl.contains("4k") || fl.contains("uhd") {
+        if markers.has_any(&[Marker::P2160, Marker::FourK, Marker::Uhd]) {
             attrs.resolution = Some("2160p".to_string());
             attrs.is_hd = true;
-        } else if fl.contains("1080p") || fl.contains("1080i") {
+        } else if markers.has_any(&[Marker::P1080, Marker::I1080]) {
             attrs.resolution = Some("1080p".to_string());
             attrs.is_hd = true;
-        } else if fl.contains("720p") {
+        } else if markers.has(Marker::P720) {
             attrs.resolution = Some("720p".to_string());
             attrs.is_hd = true;
         }
 
         // Source — word-boundary regexes to avoid false positives like "ts" inside "subtitle"
-        static TS_RE: std::sync::OnceLock<Regex> = std::sync::OnceLock::new();
-        static TC_RE: std::sync::OnceLock<Regex> = std::sync::OnceLock::new();
-        static DVD_RE: std::sync::OnceLock<Regex> = std::sync::OnceLock::new();
-        let ts_re  = TS_RE.get_or_init(|| Regex::new(r"(?i)\b(ts|telesync|telecine)\b").unwrap());
-        let tc_re  = TC_RE.get_or_init(|| Regex::new(r"(?i)\b(tc|telecine)\b").unwrap());
+        static TS_RE: OnceLock<Regex> = OnceLock::new();
+        static DVD_RE: OnceLock<Regex> = OnceLock::new();
+        let ts_re  = TS_RE.get_or_init(|| Regex::new(r"(?i)\b(ts|tc|telesync|telecine)\b").unwrap());
         let dvd_re = DVD_RE.get_or_init(|| Regex::new(r"(?i)\b(dvd|dvdrip|dvd5|dvd9)\b").unwrap());
 
-        if fl.contains("remux") {
+        if markers.has(Marker::Remux) {
             attrs.source = Some("Remux".to_string());
-        } else if fl.contains("bluray") || fl.contains("blu-ray") {
+        } else if markers.has_any(&[Marker::BluRay, Marker::BluRayDash]) {
             attrs.source = Some("BluRay".to_string());
-        } else if fl.contains("bdrip") || fl.contains("brrip") {
+        } else if markers.has_any(&[Marker::BdRip, Marker::BrRip]) {
             attrs.source = Some("BDRip".to_string());
-        } else if fl.contains("web-dl") || fl.contains("webdl") {
+        } else if markers.has_any(&[Marker::WebDlDash, Marker::WebDl]) {
             attrs.source = Some("WebDL".to_string());
-        } else if fl.contains("webrip") || fl.contains("web-rip") {
+        } else if markers.has_any(&[Marker::WebRip, Marker::WebRipDash]) {
             attrs.source = Some("WEBRip".to_string());
-        } else if fl.contains("hdtv") || fl.contains("pdtv") {
+        } else if markers.has_any(&[Marker::Hdtv, Marker::Pdtv]) {
             attrs.source = Some("HDTV".to_string());
         } else if dvd_re.is_match(&fl) {
             attrs.source = Some("DVDRip".to_string());
-        } else if ts_re.is_match(&fl) || tc_re.is_match(&fl) {
+        } else if ts_re.is_match(&fl) {
             attrs.source = Some("TS".to_string());
-        } else if fl.contains("cam") {
+        } else if markers.has(Marker::Cam) {
             attrs.source = Some("CAM".to_string());
         }
 
         // Codec
-        if fl.contains("x265") || fl.contains("hevc") || fl.contains("h.265") {
+        if markers.has_any(&[Marker::X265, Marker::Hevc, Marker::H265]) {
             attrs.video_codec = Some("x265".to_string());
-        } else if fl.contains("x264") || fl.contains("avc") || fl.contains("h.264") {
+        } else if markers.has_any(&[Marker::X264, Marker::Avc, Marker::H264]) {
             attrs.video_codec = Some("x264".to_string());
         }
 
@@ -422,48 +547,51 @@ impl FilenameParser {
         static DD_RE: OnceLock<Regex> = OnceLock::new();
         let dd_re = DD_RE.get_or_init(|| Regex::new(r"(?i)dd[p\s.]*[0-9](\.[0-9])?").unwrap());
         
-        if fl.contains("atmos") {
+        if markers.has(Marker::Atmos) {
             attrs.audio_codec = Some("Atmos".to_string());
-        } else if fl.contains("truehd") {
+        } else if markers.has(Marker::TrueHd) {
             attrs.audio_codec = Some("TrueHD".to_string());
-        } else if fl.contains("dts-hd") || fl.contains("dtshd") || fl.contains("dts:x") {
+        } else if markers.has_any(&[Marker::DtsHdDash, Marker::DtsHd, Marker::DtsX]) {
             attrs.audio_codec = Some("DTS-HD".to_string());
-        } else if fl.contains("dts") {
+        } else if markers.has(Marker::Dts) {
             attrs.audio_codec = Some("DTS".to_string());
-        } else if fl.contains("eac3") || fl.contains("dd+") || fl.contains("ddp") {
+        } else if markers.has_any(&[Marker::Eac3, Marker::DdPlus, Marker::Ddp]) {
             attrs.audio_codec = Some("EAC3".to_string());
-        } else if dd_re.is_match(&fl) || fl.contains("ac3") {
+        } else if dd_re.is_match(&fl) || markers.has(Marker::Ac3) {
             attrs.audio_codec = Some("AC3".to_string());
-        } else if fl.contains("aac") {
+        } else if markers.has(Marker::Aac) {
             attrs.audio_codec = Some("AAC".to_string());
-        } else if fl.contains("mp3") {
+        } else if markers.has(Marker::Mp3) {
             attrs.audio_codec = Some("MP3".to_string());
         }
 
         // HDR
-        if fl.contains("hdr") || fl.contains("hdr10") {
+        if markers.has_any(&[Marker::Hdr, Marker::Hdr10]) {
             attrs.hdr = true;
         }
-        if fl.contains("dv") || fl.contains("dolby vision") {
+        if markers.has_any(&[Marker::Dv, Marker::DolbyVision]) {
             attrs.dolby_vision = true;
             attrs.hdr = true;
         }
 
         // Bit Depth
-        if fl.contains("10bit") || fl.contains("10 bit") {
+        if markers.has_any(&[Marker::Bit10, Marker::Bit10Spaced]) {
             attrs.bit_depth = 10;
-        } else if fl.contains("12bit") || fl.contains("12 bit") {
+        } else if markers.has_any(&[Marker::Bit12, Marker::Bit12Spaced]) {
             attrs.bit_depth = 12;
         }
 
         // Vietnamese
-        let viet_sub_markers = ["vietsub", "sub viet", "phu de", "phụ đề"];
-        let viet_dub_markers = ["vie", "thuyet minh", "thuyết minh", "long tieng", "lồng tiếng", "tmph", "tvp", "tmpd", "vietdub"];
+        let viet_sub_markers = [Marker::VietSub, Marker::SubViet, Marker::PhuDe, Marker::PhuDeAccented];
+        let viet_dub_markers = [
+            Marker::Vie, Marker::ThuyetMinh, Marker::ThuyetMinhAccented, Marker::LongTieng,
+            Marker::LongTiengAccented, Marker::Tmph, Marker::Tvp, Marker::Tmpd, Marker::VietDub,
+        ];
         
-        if viet_sub_markers.iter().any(|m| fl.contains(m)) {
+        if markers.has_any(&viet_sub_markers) {
             attrs.viet_sub = true;
         }
-        if viet_dub_markers.iter().any(|m| fl.contains(m)) {
+        if markers.has_any(&viet_dub_markers) {
             attrs.viet_dub = true;
         }
 
@@ -474,3 +602,36 @@ impl FilenameParser {
 
 
 
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_season_episode_formats() {
+        for name in ["Show.S01E14.1080p.mkv", "Show S01 E14 1080p.mkv", "Show.S01EP14.mkv", "Show.s1e14.mkv"] {
+            let parsed = FilenameParser::parse(name);
+            assert_eq!((parsed.season, parsed.episode), (Some(1), Some(14)), "{}", name);
+            assert!(parsed.is_series);
+        }
+    }
+
+    #[test]
+    fn test_quality_markers_fit_bitset() {
+        assert!(QUALITY_MARKERS.len() <= 64);
+    }
+
+    #[test]
+    fn test_extract_quality_attributes() {
+        let attrs = FilenameParser::extract_quality_attributes(
+            "Movie.2023.2160p.BluRay.HDR10.DTS-HD.x265.10bit.Vietsub.mkv",
+        );
+        assert_eq!(attrs.resolution.as_deref(), Some("2160p"));
+        assert_eq!(attrs.source.as_deref(), Some("BluRay"));
+        assert_eq!(attrs.video_codec.as_deref(), Some("x265"));
+        assert_eq!(attrs.audio_codec.as_deref(), Some("DTS-HD"));
+        assert!(attrs.hdr);
+        assert_eq!(attrs.bit_depth, 10);
+        assert!(attrs.viet_sub);
+    }
+}
@@ -204,7 +204,15 @@ static LANGUAGE_RE: OnceLock<Regex> = OnceLock::new();
 static BRACKET_RE: OnceLock<Regex> = OnceLock::new();
 static RELEASE_GROUP_RE: OnceLock<Regex> = OnceLock::new();
 
-fn get_classifiers() -> Vec<(TokenType, &'static Regex)> {
+static CLASSIFIERS: OnceLock<Vec<(TokenType, &'static Regex)>> = OnceLock::new();
+
+/// Priority-ordered classifier table, built once and shared by every call
+/// to `classify_token` instead of being reassembled per token.
+fn get_classifiers() -> &'static [(TokenType, &'static Regex)] {
+    CLASSIFIERS.get_or_init(build_classifiers)
+}
+
+fn build_classifiers() -> Vec<(TokenType, &'static Regex)> {
     vec![
         // High priority patterns
         (TokenType::Extension, EXTENSION_RE.get_or_init(|| 
@@ -411,8 +419,7 @@ pub fn classify_token(token: &str, position: usize, is_last: bool) -> Classified
         // Try to classify the inner content first
         // If it's single-token metadata (like Year, Resolution), treat it as such
         /* recursion would be nice but simple check is enough */
-        let classifiers = get_classifiers();
-        for (token_type, regex) in &classifiers {
+        for (token_type, regex) in classifiers {
             // Skip structural types for inner check
             if *token_type == TokenType::BracketGroup || *token_type == TokenType::ReleaseGroup {
                 continue;
@@ -444,7 +451,7 @@ pub fn classify_token(token: &str, position: usize, is_last: bool) -> Classified
     }
     
     // Try each classifier
-    for (token_type, regex) in &classifiers {
+    for (token_type, regex) in classifiers {
         if regex.is_match(token) {
             // Strict ID check for ReleaseGroup (must not be all digits)
             if *token_type == TokenType::ReleaseGroup {
@@ -1,4 +1,6 @@
+use aho_corasick::AhoCorasick;
 use regex::Regex;
+use std::borrow::Cow;
 use std::collections::{HashSet, HashMap};
 use std::sync::OnceLock;
 use serde::{Deserialize, Serialize};
@@ -45,7 +47,12 @@ pub fn extract_core_title(text: &str) -> String {
     
     // 1. Remove obvious quality/source/year noise first to isolate the titles
     name = FilenameParser::quality_pattern().replace_all(&name, " ").to_string();
-    name = FilenameParser::year_pattern().replace_all(&name, " ").to_string();
+    if FilenameParser::may_contain_year(&name) {
+        // replace_all borrows when nothing matched, so only a real strip allocates
+        if let Cow::Owned(stripped) = FilenameParser::year_pattern().replace_all(&name, " ") {
+            name = stripped;
+        }
+    }
     name = EXT_RE.get_or_init(|| Regex::new(r"(?i)\.(mkv|mp4|avi|m4v|wmv|flv|webm|ts|m2ts)$").unwrap())
         .replace_all(&name, "").to_string();
     
@@ -80,16 +87,19 @@ pub fn extract_core_title(text: &str) -> String {
 }
 
 pub fn get_title_keywords(title: &str) -> HashSet<String> {
-    let core = extract_core_title(title);
+    // V2 Stop Words, built once rather than on every call
+    static STOP_WORDS: OnceLock<HashSet<&'static str>> = OnceLock::new();
+    let stop_words = STOP_WORDS.get_or_init(|| {
+        [
+            "the", "a", "an", "and", "or", "but", "in", "on", "at", 
+            "to", "for", "of", "with", "by", "from", "as", "is", "was",
+            "are", "were", "be", "been", "being", "have", "has", "had",
+            "i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x",
+            "va" // Vietnamese "and"
+        ].into_iter().collect()
+    });
     
-    // V2 Stop Words
-    let stop_words: HashSet<&str> = [
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", 
-        "to", "for", "of", "with", "by", "from", "as", "is", "was",
-        "are", "were", "be", "been", "being", "have", "has", "had",
-        "i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x",
-        "va" // Vietnamese "and"
-    ].iter().cloned().collect();
+    let core = extract_core_title(title);
     
     core.split_whitespace()
         .filter(|w| !stop_words.contains(w) && w.len() > 1)
@@ -301,11 +311,39 @@ pub fn normalize_vietnamese(text: &str) -> String {
     result
 }
 
+/// Badge markers, in the order of `detect_badges`' bitset
+const BADGE_MARKERS: [&str; 7] = ["vietdub", "long tieng", "vietsub", "phu de", "hdr", "dv", "dolby vision"];
+
+/// Detect (vietdub, vietsub, hdr, dolby_vision) badges from a filename.
+/// All markers are found in a single case-insensitive scan.
 pub fn detect_badges(filename: &str) -> (bool, bool, bool, bool) {
-    let lower = filename.to_lowercase();
-    let vietdub = lower.contains("vietdub") || lower.contains("long tieng");
-    let vietsub = (lower.contains("vietsub") || lower.contains("phu de")) && !vietdub;
-    let hdr = lower.contains("hdr") || lower.contains("hdr10");
-    let dolby_vision = lower.contains("dv") || lower.contains("dolby vision");
+    static BADGES: OnceLock<AhoCorasick> = OnceLock::new();
+    let ac = BADGES.get_or_init(|| {
+        AhoCorasick::builder()
+            .ascii_case_insensitive(true)
+            .build(BADGE_MARKERS)
+            .unwrap()
+    });
+    let mut seen = [false; BADGE_MARKERS.len()];
+    for m in ac.find_overlapping_iter(filename) {
+        seen[m.pattern().as_usize()] = true;
+    }
+    let vietdub = seen[0] || seen[1];
+    let vietsub = (seen[2] || seen[3]) && !vietdub;
+    let hdr = seen[4];
+    let dolby_vision = seen[5] || seen[6];
     (vietdub, vietsub, hdr, dolby_vision)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_detect_badges() {
+        assert_eq!(detect_badges("Movie.2023.2160p.HDR10.DV.VietDub.mkv"), (true, false, true, true));
+        assert_eq!(detect_badges("Movie.2023.1080p.Vietsub.mkv"), (false, true, false, false));
+        assert_eq!(detect_badges("Movie 2023 Phu De Dolby Vision.mkv"), (false, true, false, true));
+        assert_eq!(detect_badges("Movie.2023.1080p.mkv"), (false, false, false, false));
+    }
+}
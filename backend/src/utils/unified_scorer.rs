@@ -1,7 +1,9 @@
 use crate::utils::title_matcher::{calculate_unified_similarity, normalize_vietnamese};
 
 /// Unified scoring function that considers title similarity, year match, and aliases
-/// with media-type-aware year weighting
+/// with media-type-aware year weighting. Only the tests score a single filename;
+/// search paths use [`calculate_match_scores`].
+#[cfg(test)]
 pub fn calculate_match_score(
     search_title: &str,
     filename: &str,
@@ -9,6 +11,46 @@ pub fn calculate_match_score(
     target_year: Option<u32>,
     aliases: &[String],
     is_tv_series: bool,
+) -> f32 {
+    let needles = alias_needles(aliases);
+    score_with_needles(search_title, filename, file_year, target_year, aliases, &needles, is_tv_series)
+}
+
+/// Unified scoring for a whole result set against one target. The alias-boost
+/// needles are normalized once up front; title similarity still matches every
+/// alias against each filename.
+pub fn calculate_match_scores(
+    search_title: &str,
+    candidates: &[(&str, Option<u32>)],
+    target_year: Option<u32>,
+    aliases: &[String],
+    is_tv_series: bool,
+) -> Vec<f32> {
+    let needles = alias_needles(aliases);
+    candidates
+        .iter()
+        .map(|&(filename, file_year)| {
+            score_with_needles(search_title, filename, file_year, target_year, aliases, &needles, is_tv_series)
+        })
+        .collect()
+}
+
+/// Lowercased forms of each alias (Vietnamese-normalized and plain) used by the alias boost
+fn alias_needles(aliases: &[String]) -> Vec<(String, String)> {
+    aliases
+        .iter()
+        .map(|alias| (normalize_vietnamese(alias), alias.to_lowercase()))
+        .collect()
+}
+
+fn score_with_needles(
+    search_title: &str,
+    filename: &str,
+    file_year: Option<u32>,
+    target_year: Option<u32>,
+    aliases: &[String],
+    needles: &[(String, String)],
+    is_tv_series: bool,
 ) -> f32 {
     let mut score = 0.0;
     
@@ -42,9 +84,8 @@ pub fn calculate_match_score(
     
     // Phase 3: Alias Boost (10% weight)
     let filename_lower = filename.to_lowercase();
-    let has_alias_match = aliases.iter().any(|alias| {
-        let alias_norm = normalize_vietnamese(alias);
-        filename_lower.contains(&alias_norm) || filename_lower.contains(&alias.to_lowercase())
+    let has_alias_match = needles.iter().any(|(alias_norm, alias_lower)| {
+        filename_lower.contains(alias_norm.as_str()) || filename_lower.contains(alias_lower.as_str())
     });
     
     if has_alias_match {
@@ -122,4 +163,18 @@ mod tests {
         );
         assert!(score > 0.80, "Alias match should provide significant boost");
     }
+
+    #[test]
+    fn test_batch_scores_match_single() {
+        let aliases = vec!["Bộ Bộ Kinh Tâm".to_string()];
+        let candidates = [
+            ("Scarlet.Heart.S05E01.2015.1080p.mkv", Some(2015)),
+            ("Bộ.Bộ.Kinh.Tâm.2011.1080p.mkv", Some(2011)),
+            ("Unrelated.Movie.2011.720p.mkv", None),
+        ];
+        let batch = calculate_match_scores("Scarlet Heart", &candidates, Some(2011), &aliases, false);
+        for (&(filename, year), score) in candidates.iter().zip(batch) {
+            assert_eq!(score, calculate_match_score("Scarlet Heart", filename, year, Some(2011), &aliases, false));
+        }
+    }
 }
@@ -74,6 +74,7 @@ async fn handle_socket(socket: WebSocket, state: Arc<AppState>) {
     
     // Clone state for the send task
     let orchestrator = state.download_orchestrator.clone();
+    let stats_state = Arc::clone(&state);
     
     // Spawn a task to handle incoming messages (ping/pong, client commands)
     let mut recv_task = tokio::spawn(async move {
@@ -177,6 +178,10 @@ async fn handle_socket(socket: WebSocket, state: Arc<AppState>) {
                 result = progress_rx.recv() => {
                     match result {
                         Ok(progress) => {
+                            // Removal notices carry no task to look up (it's gone)
+                            if matches!(progress.event, crate::downloader::progress::TaskEvent::Removed) {
+                                continue;
+                            }
                             // Parse task_id and fetch full task, then batch it
                             if let Ok(task_id) = uuid::Uuid::parse_str(&progress.task_id) {
                                 if let Some(task) = orchestrator.get_task_unified(task_id).await {
@@ -214,26 +219,26 @@ async fn handle_socket(socket: WebSocket, state: Arc<AppState>) {
                 
                 // Check stats periodically, but only send if changed
                 _ = stats_interval.tick() => {
-                    let stats = orchestrator.get_stats().await;
+                    // Shared 1s snapshot: N connected clients cost one DB aggregation per tick
+                    let snapshot = crate::api::stats::cached_stats(&stats_state).await;
                     
                     // Only send if stats have changed
                     let should_send = match &last_stats {
                         None => true, // First time, always send
-                        Some(prev) => prev != &stats, // Only send if different
+                        Some(prev) => prev != &snapshot.stats, // Only send if different
                     };
                     
                     if should_send {
-                        let msg = WsMessage::EngineStats { stats: stats.clone() };
-                        
-                        if let Ok(json) = serde_json::to_string(&msg) {
-                            if sender.send(Message::Text(json)).await.is_err() {
+                        // Frame was encoded once when the snapshot was built
+                        if !snapshot.ws_frame.is_empty() {
+                            if sender.send(Message::Text(snapshot.ws_frame.clone())).await.is_err() {
                                 tracing::debug!("WebSocket client disconnected during stats update");
                                 break;
                             }
                         }
                         
                         // Update last sent stats
-                        last_stats = Some(stats);
+                        last_stats = Some(snapshot.stats.clone());
                     }
                 }
             }
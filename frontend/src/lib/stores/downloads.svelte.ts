@@ -1247,15 +1247,19 @@ export const storeError = makeReadable<string | null>(() => downloadStore.error)
 // Helper functions (unchanged)
 // ---------------------------------------------------------------------------
 
+const BYTE_UNITS = ['B', 'KB', 'MB', 'GB', 'TB'];
+const BYTE_SCALES = BYTE_UNITS.map((_, i) => 2 ** (10 * i));
+
 /**
  * Helper: Format bytes to human readable
+ *
+ * The unit index is the binary magnitude divided by 10 (each unit is 2^10),
+ * clamped to the unit table, so sub-byte speeds and petabytes stay in range.
  */
 export function formatBytes(bytes: number): string {
   if (bytes === 0) return '0 B';
-  const k = 1024;
-  const sizes = ['B', 'KB', 'MB', 'GB', 'TB'];
-  const i = Math.floor(Math.log(bytes) / Math.log(k));
-  return `${(bytes / Math.pow(k, i)).toFixed(2)} ${sizes[i]}`;
+  const i = Math.min(BYTE_UNITS.length - 1, Math.max(0, Math.floor(Math.log2(bytes) / 10)));
+  return `${(bytes / BYTE_SCALES[i]).toFixed(2)} ${BYTE_UNITS[i]}`;
 }
 
 /**